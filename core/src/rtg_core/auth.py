@@ -1,16 +1,43 @@
 """Authentication dependencies for FastAPI."""
 
+import asyncio
+import hashlib
+import time
+
 from fastapi import Depends, HTTPException, Security
 from fastapi.security import APIKeyHeader, HTTPAuthorizationCredentials, HTTPBearer
 
-from rtg_core.config import CoreConfig
+from rtg_core.db import get_supabase_client
 
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 bearer_scheme = HTTPBearer(auto_error=False)
 
+# Validated tokens, keyed by sha256(token) -> (expires_at, user). Short TTL so a
+# revoked session stops working within a minute.
+_JWT_CACHE_TTL = 60.0
+_JWT_CACHE_MAXSIZE = 4096
+_jwt_cache: dict[bytes, tuple[float, dict]] = {}
+
+
+def _cached_user(key: bytes) -> dict | None:
+    entry = _jwt_cache.get(key)
+    if entry is None:
+        return None
+    if entry[0] <= time.monotonic():
+        _jwt_cache.pop(key, None)
+        return None
+    return dict(entry[1])
 
-def _get_config() -> CoreConfig:
-    return CoreConfig()
+
+def _cache_user(key: bytes, user: dict) -> None:
+    now = time.monotonic()
+    if len(_jwt_cache) >= _JWT_CACHE_MAXSIZE:
+        for stale in [k for k, (expires, _) in _jwt_cache.items() if expires <= now]:
+            del _jwt_cache[stale]
+        if len(_jwt_cache) >= _JWT_CACHE_MAXSIZE:
+            # Dicts keep insertion order, so the first key is the oldest entry
+            del _jwt_cache[next(iter(_jwt_cache))]
+    _jwt_cache[key] = (now + _JWT_CACHE_TTL, dict(user))
 
 
 async def get_api_key(
@@ -31,14 +58,18 @@ async def get_current_user(
     if not credentials:
         raise HTTPException(status_code=401, detail="Missing authorization header")
     token = credentials.credentials
+    cache_key = hashlib.sha256(token.encode()).digest()
+    user = _cached_user(cache_key)
+    if user is not None:
+        return user
     try:
-        from supabase import create_client
-
-        config = _get_config()
-        client = create_client(config.supabase_url, config.supabase_service_key)
-        user_response = client.auth.get_user(token)
+        client = get_supabase_client()
+        # The Supabase client is sync; run the network call off the event loop
+        user_response = await asyncio.to_thread(client.auth.get_user, token)
         if not user_response or not user_response.user:
             raise HTTPException(status_code=401, detail="Invalid token")
-        return {"id": str(user_response.user.id), "email": user_response.user.email}
+        user = {"id": str(user_response.user.id), "email": user_response.user.email}
     except Exception as e:
         raise HTTPException(status_code=401, detail=f"Authentication failed: {e}") from e
+    _cache_user(cache_key, user)
+    return user
@@ -1,5 +1,7 @@
 """Core configuration using pydantic-settings. Every module config extends this."""
 
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings
 
 
@@ -14,3 +16,9 @@ class CoreConfig(BaseSettings):
     anthropic_api_key: str = ""
 
     model_config = {"env_file": ".env", "extra": "ignore"}
+
+
+@lru_cache(maxsize=1)
+def get_config() -> CoreConfig:
+    """Return the process-wide CoreConfig, reading env vars and .env only once."""
+    return CoreConfig()
@@ -4,23 +4,24 @@ from functools import lru_cache
 
 from supabase import Client, create_client
 
-from rtg_core.config import CoreConfig
+from rtg_core.config import get_config
 
 
-@lru_cache(maxsize=1)
-def _get_config() -> CoreConfig:
-    return CoreConfig()
+@lru_cache(maxsize=4)
+def _cached_client(url: str, service_key: str) -> Client:
+    return create_client(url, service_key)
 
 
 def get_supabase_client() -> Client:
     """Return a Supabase client instance.
 
-    Uses lru_cache on config to avoid re-reading env vars on every call.
-    The Supabase Python client handles connection pooling internally.
+    Uses the cached get_config() to avoid re-reading env vars on every call.
+    Clients are cached per (url, key) so TLS setup and the client's internal
+    connection pool are reused across requests.
     """
-    config = _get_config()
+    config = get_config()
     if not config.supabase_url or not config.supabase_service_key:
         from rtg_core.errors import ConfigError
 
         raise ConfigError("SUPABASE_URL and SUPABASE_SERVICE_KEY must be set")
-    return create_client(config.supabase_url, config.supabase_service_key)
+    return _cached_client(config.supabase_url, config.supabase_service_key)
@@ -1,13 +1,26 @@
 """Forge error hierarchy and FastAPI exception handler."""
 
+from typing import ClassVar
+
+import orjson
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from pydantic import BaseModel as PydanticBaseModel
 
+# Fixed-shape error body (see ErrorResponse). Only the detail string needs JSON
+# escaping, so the rest is formatted straight into bytes.
+_ERROR_BODY = b'{"error":"%s","detail":%s,"status_code":%d}'
+
 
 class ForgeError(Exception):
     """Base exception for all Forge errors."""
 
+    error_name: ClassVar[str] = "ForgeError"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.error_name = cls.__name__
+
     def __init__(self, message: str, status_code: int = 500):
         self.message = message
         self.status_code = status_code
@@ -47,8 +60,10 @@ def register_exception_handlers(app: FastAPI) -> None:
     """Register Forge exception handlers on a FastAPI app."""
 
     @app.exception_handler(ForgeError)
-    async def forge_error_handler(_request: Request, exc: ForgeError) -> JSONResponse:
-        return JSONResponse(
-            status_code=exc.status_code,
-            content={"error": type(exc).__name__, "detail": exc.message, "status_code": exc.status_code},
+    async def forge_error_handler(_request: Request, exc: ForgeError) -> Response:
+        body = _ERROR_BODY % (
+            exc.error_name.encode(),
+            orjson.dumps(exc.message, default=str),
+            exc.status_code,
         )
+        return Response(content=body, status_code=exc.status_code, media_type="application/json")
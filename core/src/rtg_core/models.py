@@ -15,6 +15,22 @@ class BaseModel(PydanticBaseModel):
         populate_by_name=True,
     )
 
+    @classmethod
+    def complete_subclasses(cls) -> None:
+        """Build validators for every subclass whose build was deferred.
+
+        Pydantic builds a model's validator when the class is created, except
+        when a forward reference cannot be resolved yet; those models are then
+        rebuilt on their first validation, inside a request. Calling this once
+        all models are imported (mount_modules does) moves that cost to startup.
+        """
+        pending = list(cls.__subclasses__())
+        while pending:
+            model = pending.pop()
+            pending.extend(model.__subclasses__())
+            if not model.__pydantic_complete__:
+                model.model_rebuild(raise_errors=False)
+
 
 class TimestampMixin(BaseModel):
     """Mixin that adds created_at and updated_at timestamps."""
@@ -1,23 +1,78 @@
 """Profile loading and technology validation."""
 
+import copy
+import warnings
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from typing import Any
 
-from rtg_core.errors import NotFoundError
+from rtg_core.errors import ConfigError, NotFoundError
 from rtg_core.toml_utils import load_toml
 
+# Optional multi-pattern matcher for required-name lookups (rtg-core[fast]).
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
-def load_profile(name: str, profiles_dir: Path | str = "profiles") -> dict[str, Any]:
+# Per-section entry limits for constraints.toml tables. Past the warning limit
+# a profile is almost certainly generated or duplicated; the hard limit keeps
+# load and validation time bounded.
+_CONSTRAINT_WARN_LIMIT = 1_000
+_CONSTRAINT_MAX_ENTRIES = 10_000
+
+
+class _Profile(dict):
+    """A load_profile result.
+
+    Holds the constraints compiled at load time as an attribute rather than a
+    key, so serializing the profile only ever sees profile data.
+    """
+
+    __slots__ = ("compiled",)
+
+
+def load_profile(
+    name: str,
+    profiles_dir: Path | str = "profiles",
+    *,
+    include_docs: bool = True,
+) -> dict[str, Any]:
     """Load a profile by name, merging with base profile if extends is set.
 
     Args:
         name: Profile directory name (e.g., "rtg-default").
         profiles_dir: Root directory containing all profiles.
+        include_docs: Also read STACK.md and GOTCHAS.md. Pass False when only
+            the constraints are needed (e.g. before validate_against_profile).
 
     Returns:
-        Merged profile dict with keys: profile, constraints, stack_md.
+        Merged profile dict with keys: profile, constraints, and (when
+        include_docs is set) stack_md and gotchas_md.
     """
-    profiles_dir = Path(profiles_dir)
+    profiles_dir_str = str(Path(profiles_dir).resolve())
+    data, profile_dirs, compiled = _load_profile_cached(name, profiles_dir_str)
+    profile = _Profile(copy.deepcopy(data))
+    profile.compiled = compiled
+    if include_docs:
+        profile.update(_load_profile_docs(profile_dirs))
+    return profile
+
+
+@lru_cache(maxsize=64)
+def _load_profile_cached(
+    name: str, profiles_dir_str: str
+) -> tuple[dict[str, Any], tuple[str, ...], tuple[frozenset[str], tuple[str, ...]]]:
+    """Load and merge a profile once per process.
+
+    Profiles are static on disk at runtime, so the merged result (including the
+    whole extends chain) is kept for the lifetime of the process. Returns the
+    profile dict, its directory followed by its extends chain (nearest first)
+    and its compiled constraints. Callers go through load_profile, which hands
+    out copies so the cache is never mutated.
+    """
+    profiles_dir = Path(profiles_dir_str)
     profile_dir = profiles_dir / name
     if not profile_dir.is_dir():
         raise NotFoundError(f"Profile not found: {name}")
@@ -26,54 +81,129 @@ def load_profile(name: str, profiles_dir: Path | str = "profiles") -> dict[str,
     constraints_path = profile_dir / "constraints.toml"
     constraints = load_toml(constraints_path) if constraints_path.exists() else {}
 
-    stack_md_path = profile_dir / "STACK.md"
-    stack_md = stack_md_path.read_text() if stack_md_path.exists() else ""
-
-    gotchas_path = profile_dir / "gotchas" / "GOTCHAS.md"
-    gotchas_md = gotchas_path.read_text() if gotchas_path.exists() else ""
+    _check_constraint_size(constraints.get("constraints", {}), constraints_path)
 
     result = {
         "profile": profile_toml.get("profile", {}),
         "constraints": constraints.get("constraints", {}),
-        "stack_md": stack_md,
-        "gotchas_md": gotchas_md,
         "_path": str(profile_dir),
     }
+    profile_dirs: tuple[str, ...] = (str(profile_dir),)
 
     # Merge with base profile if extends is set
     extends = profile_toml.get("base", {}).get("extends", "")
     if extends:
-        base = load_profile(extends, profiles_dir)
+        base, base_dirs, _ = _load_profile_cached(extends, profiles_dir_str)
         result = _merge_profiles(base, result)
+        profile_dirs += base_dirs
+
+    # result["constraints"] is now the fully flattened extends chain; compile
+    # it once here so validation never re-walks or re-flattens it.
+    compiled = _compile_constraints(result["constraints"])
+    _required_matcher(compiled[1])  # warm the automaton cache
+    return result, profile_dirs, compiled
+
+
+@lru_cache(maxsize=64)
+def _load_profile_docs(profile_dirs: tuple[str, ...]) -> dict[str, str]:
+    """Read STACK.md and GOTCHAS.md, taking the nearest non-empty file in the chain."""
+    docs = {}
+    for key, relative in (("stack_md", "STACK.md"), ("gotchas_md", "gotchas/GOTCHAS.md")):
+        docs[key] = ""
+        for profile_dir in profile_dirs:
+            path = Path(profile_dir) / relative
+            content = path.read_text() if path.exists() else ""
+            if content:
+                docs[key] = content
+                break
+    return docs
+
 
-    return result
+def clear_profile_cache() -> None:
+    """Forget every loaded profile so the next load_profile reads from disk."""
+    _load_profile_cached.cache_clear()
+    _load_profile_docs.cache_clear()
 
 
 def _merge_profiles(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
-    """Merge override profile onto base. Override wins for overlapping keys."""
-    merged = {**base}
-    merged["profile"] = {**base.get("profile", {}), **override.get("profile", {})}
+    """Merge override profile onto base. Override wins for overlapping keys.
+
+    Sections are only rebuilt when both sides define them; otherwise the
+    merged profile shares them. Neither argument is mutated.
+    """
+    merged = {**override}
+    base_profile = base.get("profile", {})
+    if base_profile:
+        merged["profile"] = {**base_profile, **override.get("profile", {})}
 
     base_constraints = base.get("constraints", {})
     override_constraints = override.get("constraints", {})
-    merged_constraints = {**base_constraints}
-    for key, value in override_constraints.items():
-        if isinstance(value, dict) and isinstance(merged_constraints.get(key), dict):
-            merged_constraints[key] = {**merged_constraints[key], **value}
-        else:
-            merged_constraints[key] = value
-    merged["constraints"] = merged_constraints
-
-    # Override stack_md and gotchas_md only if non-empty
-    if override.get("stack_md"):
-        merged["stack_md"] = override["stack_md"]
-    if override.get("gotchas_md"):
-        merged["gotchas_md"] = override["gotchas_md"]
-
-    merged["_path"] = override["_path"]
+    if not override_constraints:
+        merged["constraints"] = base_constraints
+    elif base_constraints:
+        merged_constraints = {**base_constraints}
+        for key, value in override_constraints.items():
+            if isinstance(value, dict) and isinstance(merged_constraints.get(key), dict):
+                merged_constraints[key] = {**merged_constraints[key], **value}
+            else:
+                merged_constraints[key] = value
+        merged["constraints"] = merged_constraints
+
     return merged
 
 
+def _check_constraint_size(constraints: dict[str, Any], source: Path) -> None:
+    """Reject oversized required/forbidden tables and warn when they grow large."""
+    for section in ("required", "forbidden"):
+        count = len(constraints.get(section, {}))
+        if count >= _CONSTRAINT_MAX_ENTRIES:
+            raise ConfigError(
+                f"Too many [constraints.{section}] entries in {source}: "
+                f"{count} (limit {_CONSTRAINT_MAX_ENTRIES})"
+            )
+        if count >= _CONSTRAINT_WARN_LIMIT:
+            warnings.warn(
+                f"{source} has {count} [constraints.{section}] entries; "
+                f"profiles are capped at {_CONSTRAINT_MAX_ENTRIES}",
+                stacklevel=2,
+            )
+
+
+def _compile_constraints(
+    constraints: dict[str, Any],
+) -> tuple[frozenset[str], tuple[str, ...]]:
+    """Flatten constraints into lowercase forbidden names and required names."""
+    forbidden = constraints.get("forbidden", {})
+    required = constraints.get("required", {})
+    forbidden_set = frozenset(
+        n.lower()
+        for n in chain.from_iterable(
+            names for names in forbidden.values() if isinstance(names, list)
+        )
+    )
+    # dict.fromkeys de-duplicates while keeping declaration order
+    required_names = tuple(
+        dict.fromkeys(
+            info["name"].lower()
+            for info in required.values()
+            if isinstance(info, dict) and "name" in info
+        )
+    )
+    return forbidden_set, required_names
+
+
+@lru_cache(maxsize=64)
+def _required_matcher(required_names: tuple[str, ...]) -> Any:
+    """Build an Aho-Corasick automaton over required names, or None if unavailable."""
+    if ahocorasick is None or not required_names:
+        return None
+    automaton = ahocorasick.Automaton()
+    for name in required_names:
+        automaton.add_word(name, name)
+    automaton.make_automaton()
+    return automaton
+
+
 def validate_against_profile(
     technologies: list[str],
     profile: dict[str, Any],
@@ -82,30 +212,40 @@ def validate_against_profile(
 
     Args:
         technologies: List of technology names to validate.
-        profile: Loaded profile dict (from load_profile).
+        profile: Loaded profile dict (from load_profile). Profiles returned by
+            load_profile are checked against their constraints as loaded.
 
     Returns:
         Dict with 'violations' (using forbidden tech) and 'gaps' (missing required tech).
     """
-    constraints = profile.get("constraints", {})
-    forbidden = constraints.get("forbidden", {})
-    required = constraints.get("required", {})
-
-    # Flatten forbidden into a set of lowercase names
-    forbidden_names = set()
-    for _category, names in forbidden.items():
-        if isinstance(names, list):
-            forbidden_names.update(n.lower() for n in names)
-
-    # Flatten required into a set of lowercase names
-    required_names = set()
-    for _category, info in required.items():
-        if isinstance(info, dict) and "name" in info:
-            required_names.add(info["name"].lower())
-
-    tech_lower = [t.lower() for t in technologies]
-
-    violations = [t for t in technologies if t.lower() in forbidden_names]
-    gaps = [name for name in required_names if not any(name in t for t in tech_lower)]
+    compiled = getattr(profile, "compiled", None)
+    if compiled is not None:
+        forbidden_names, required_names = compiled
+    else:
+        # Profile dicts built outside load_profile carry no precomputed sets
+        forbidden_names, required_names = _compile_constraints(profile.get("constraints", {}))
+
+    # Single pass: lowercase each technology once and check it against forbidden
+    tech_lower: list[str] = []
+    violations: list[str] = []
+    for tech in technologies:
+        lower = tech.lower()
+        tech_lower.append(lower)
+        if lower in forbidden_names:
+            violations.append(tech)
+
+    matcher = _required_matcher(required_names)
+    if matcher is not None:
+        # One pass per technology reports every required name it contains
+        matched = {name for t in tech_lower for _end, name in matcher.iter(t)}
+        gaps = [name for name in required_names if name not in matched]
+    else:
+        # Exact matches skip the substring scan; partial matches still count
+        tech_lower_set = set(tech_lower)
+        gaps = [
+            name
+            for name in required_names
+            if name not in tech_lower_set and not any(name in t for t in tech_lower)
+        ]
 
     return {"violations": violations, "gaps": gaps}
@@ -1,25 +1,76 @@
 """TOML loading and validation utilities."""
 
+import copy
+import os
+import tomllib
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-import tomli
-
 from rtg_core.errors import ConfigError, ValidationError
 
+# Prefer the Rust-backed rtoml parser when installed (rtg-core[fast]); it is
+# several times faster than tomllib on large constraint files.
+try:
+    import rtoml
+
+    _parse_toml = rtoml.loads
+    _TOML_ERRORS: tuple[type[Exception], ...] = (rtoml.TomlParsingError, UnicodeDecodeError)
+except ImportError:
+    _parse_toml = tomllib.loads
+    _TOML_ERRORS = (tomllib.TOMLDecodeError, UnicodeDecodeError)
+
+# Parsed manifests keyed by path, tagged with the (mtime_ns, size) they were read at.
+_TOML_CACHE: dict[str, tuple[int, int, dict[str, Any]]] = {}
+
 
 def load_toml(path: Path | str) -> dict[str, Any]:
-    """Load and parse a TOML file, returning its contents as a dict."""
+    """Load and parse a TOML file, returning its contents as a dict.
+
+    Parsed results are cached per path and reused until the file's mtime or
+    size changes. Callers always receive a private copy, so mutating the
+    returned dict never leaks into the cache.
+    """
     path = Path(path)
-    if not path.exists():
-        raise ConfigError(f"TOML file not found: {path}")
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        raise ConfigError(f"TOML file not found: {path}") from None
     if not path.suffix == ".toml":
         raise ConfigError(f"Expected .toml file, got: {path}")
+
+    key = str(path)
+    cached = _TOML_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return copy.deepcopy(cached[2])
+
     try:
-        with open(path, "rb") as f:
-            return tomli.load(f)
-    except tomli.TOMLDecodeError as e:
+        # One read() into memory, then parse the contiguous string.
+        data = _parse_toml(path.read_bytes().decode("utf-8"))
+    except _TOML_ERRORS as e:
         raise ConfigError(f"Invalid TOML in {path}: {e}") from e
+    _TOML_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    return copy.deepcopy(data)
+
+
+def clear_toml_cache() -> None:
+    """Forget every parsed manifest so the next load_toml reads from disk."""
+    _TOML_CACHE.clear()
+
+
+@lru_cache(maxsize=64)
+def _compile_schema(
+    required_keys: tuple[tuple[str, type | tuple[type, ...]], ...],
+) -> tuple[tuple[str, tuple[str, ...], type | tuple[type, ...], bool], ...]:
+    """Pre-split dotted keys so repeated validations skip the per-call parsing.
+
+    Each entry is (dotted_key, key_path, types, multiple), where types is passed
+    straight to isinstance() and multiple records whether a list was given.
+    """
+    return tuple(
+        (dotted_key, tuple(dotted_key.split(".")), types, isinstance(types, tuple))
+        for dotted_key, types in required_keys
+    )
 
 
 def validate_toml(
@@ -39,27 +90,31 @@ def validate_toml(
         List of validation error strings. Empty list means valid.
     """
     errors = []
-    for dotted_key, expected_types in required_keys.items():
-        parts = dotted_key.split(".")
+    schema = _compile_schema(
+        tuple(
+            (key, tuple(types) if isinstance(types, list) else types)
+            for key, types in required_keys.items()
+        )
+    )
+    for dotted_key, path, types, multiple in schema:
         current = data
         found = True
-        for part in parts:
+        for part in path:
             if not isinstance(current, dict) or part not in current:
                 errors.append(f"Missing required key '{dotted_key}'{f' in {context}' if context else ''}")
                 found = False
                 break
             current = current[part]
-        if found:
-            if isinstance(expected_types, list):
-                if not any(isinstance(current, t) for t in expected_types):
-                    type_names = ", ".join(t.__name__ for t in expected_types)
-                    errors.append(
-                        f"Key '{dotted_key}' should be one of ({type_names}), "
-                        f"got {type(current).__name__}"
-                    )
-            elif not isinstance(current, expected_types):
+        if found and not isinstance(current, types):
+            if multiple:
+                type_names = ", ".join(t.__name__ for t in types)
+                errors.append(
+                    f"Key '{dotted_key}' should be one of ({type_names}), "
+                    f"got {type(current).__name__}"
+                )
+            else:
                 errors.append(
-                    f"Key '{dotted_key}' should be {expected_types.__name__}, "
+                    f"Key '{dotted_key}' should be {types.__name__}, "
                     f"got {type(current).__name__}"
                 )
     if errors:
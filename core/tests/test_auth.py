@@ -0,0 +1,47 @@
+"""Tests for authentication dependencies."""
+
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from rtg_core import auth
+
+
+class _FakeAuth:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def get_user(self, token: str):
+        self.calls += 1
+        if token != "good-token":
+            return None
+        return SimpleNamespace(user=SimpleNamespace(id="user-1", email="a@example.com"))
+
+
+@pytest.fixture
+def fake_auth(monkeypatch) -> _FakeAuth:
+    fake = _FakeAuth()
+    monkeypatch.setattr(auth, "get_supabase_client", lambda: SimpleNamespace(auth=fake))
+    auth._jwt_cache.clear()
+    yield fake
+    auth._jwt_cache.clear()
+
+
+def _bearer(token: str) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+async def test_get_current_user_caches_valid_token(fake_auth: _FakeAuth):
+    first = await auth.get_current_user(_bearer("good-token"))
+    second = await auth.get_current_user(_bearer("good-token"))
+    assert first == second == {"id": "user-1", "email": "a@example.com"}
+    assert fake_auth.calls == 1
+
+
+async def test_get_current_user_does_not_cache_invalid_token(fake_auth: _FakeAuth):
+    for _ in range(2):
+        with pytest.raises(HTTPException):
+            await auth.get_current_user(_bearer("bad-token"))
+    assert fake_auth.calls == 2
@@ -1,6 +1,6 @@
 """Tests for core configuration."""
 
-from rtg_core.config import CoreConfig
+from rtg_core.config import CoreConfig, get_config
 
 
 def test_core_config_defaults():
@@ -16,3 +16,9 @@ def test_core_config_from_env(monkeypatch):
     config = CoreConfig()
     assert config.supabase_url == "https://test.supabase.co"
     assert config.supabase_service_key == "test-key"
+
+
+def test_get_config_is_cached():
+    get_config.cache_clear()
+    assert get_config() is get_config()
+    get_config.cache_clear()
@@ -0,0 +1,37 @@
+"""Tests for the Forge error hierarchy and exception handler."""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from rtg_core.errors import ForgeError, NotFoundError, register_exception_handlers
+
+
+def _client(exc: ForgeError) -> TestClient:
+    app = FastAPI()
+    register_exception_handlers(app)
+
+    @app.get("/boom")
+    async def boom():
+        raise exc
+
+    return TestClient(app)
+
+
+def test_forge_error_handler_response_shape():
+    resp = _client(NotFoundError('Module "x" not found')).get("/boom")
+    assert resp.status_code == 404
+    assert resp.headers["content-type"] == "application/json"
+    assert resp.json() == {
+        "error": "NotFoundError",
+        "detail": 'Module "x" not found',
+        "status_code": 404,
+    }
+
+
+def test_forge_error_subclass_name():
+    class QuotaError(ForgeError):
+        pass
+
+    resp = _client(QuotaError("over quota", status_code=429)).get("/boom")
+    assert resp.status_code == 429
+    assert resp.json()["error"] == "QuotaError"
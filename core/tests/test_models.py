@@ -0,0 +1,18 @@
+"""Tests for shared base models."""
+
+from rtg_core.models import BaseModel
+
+
+class _Parent(BaseModel):
+    child: "_Child | None" = None
+
+
+class _Child(BaseModel):
+    value: int
+
+
+def test_complete_subclasses_builds_deferred_models():
+    assert not _Parent.__pydantic_complete__
+    BaseModel.complete_subclasses()
+    assert _Parent.__pydantic_complete__
+    assert _Parent(child={"value": 1}).child == _Child(value=1)
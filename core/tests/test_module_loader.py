@@ -38,3 +38,15 @@ def test_discover_modules_empty_dir(tmp_path: Path):
 def test_discover_modules_nonexistent():
     modules = discover_modules(Path("/nonexistent"))
     assert modules == []
+
+
+def test_discover_modules_many_keeps_sorted_order(tmp_path: Path):
+    names = [f"module_{i:02d}" for i in range(10)]
+    for name in reversed(names):
+        mod = tmp_path / name
+        mod.mkdir()
+        (mod / "module.toml").write_text(f'[module]\nname = "{name}"\n')
+
+    modules = discover_modules(tmp_path)
+    assert [m["module"]["name"] for m in modules] == names
+    assert modules[0]["_path"] == str(tmp_path / "module_00")
@@ -1,11 +1,13 @@
 """Tests for profile loading and validation."""
 
+import json
 from pathlib import Path
 
 import pytest
 
-from rtg_core.errors import NotFoundError
-from rtg_core.profile_loader import load_profile, validate_against_profile
+from rtg_core import profile_loader
+from rtg_core.errors import ConfigError, NotFoundError
+from rtg_core.profile_loader import clear_profile_cache, load_profile, validate_against_profile
 
 
 @pytest.fixture
@@ -41,11 +43,54 @@ def test_load_profile_success(profiles_dir: Path):
     assert "# Test Stack" in profile["stack_md"]
 
 
+def test_load_profile_without_docs(profiles_dir: Path):
+    profile = load_profile("test-profile", profiles_dir, include_docs=False)
+    assert "stack_md" not in profile
+    assert "database" in profile["constraints"]["required"]
+
+
 def test_load_profile_not_found(profiles_dir: Path):
     with pytest.raises(NotFoundError, match="Profile not found"):
         load_profile("nonexistent", profiles_dir)
 
 
+def test_load_profile_cache_returns_private_copy(profiles_dir: Path):
+    profile = load_profile("test-profile", profiles_dir)
+    profile["constraints"]["forbidden"]["orm"].append("fastapi")
+    again = load_profile("test-profile", profiles_dir)
+    assert again["constraints"]["forbidden"]["orm"] == ["sqlalchemy", "prisma"]
+
+
+def test_load_profile_returns_only_profile_data(profiles_dir: Path):
+    profile = load_profile("test-profile", profiles_dir)
+    assert set(profile) == {"profile", "constraints", "_path", "stack_md", "gotchas_md"}
+    assert json.loads(json.dumps(profile)) == profile
+
+
+def test_clear_profile_cache(profiles_dir: Path):
+    profile_toml = profiles_dir / "test-profile" / "profile.toml"
+    assert load_profile("test-profile", profiles_dir)["profile"]["version"] == "0.1.0"
+    profile_toml.write_text(profile_toml.read_text().replace("0.1.0", "0.2.0"))
+    assert load_profile("test-profile", profiles_dir)["profile"]["version"] == "0.1.0"
+    clear_profile_cache()
+    assert load_profile("test-profile", profiles_dir)["profile"]["version"] == "0.2.0"
+
+
+def test_load_profile_warns_on_large_constraint_table(profiles_dir: Path, monkeypatch):
+    monkeypatch.setattr(profile_loader, "_CONSTRAINT_WARN_LIMIT", 1)
+    with pytest.warns(UserWarning) as record:
+        load_profile("test-profile", profiles_dir)
+    messages = [str(w.message) for w in record]
+    assert any("[constraints.required]" in m for m in messages)
+    assert any("[constraints.forbidden]" in m for m in messages)
+
+
+def test_load_profile_rejects_oversized_constraint_table(profiles_dir: Path, monkeypatch):
+    monkeypatch.setattr(profile_loader, "_CONSTRAINT_MAX_ENTRIES", 1)
+    with pytest.raises(ConfigError, match="Too many"):
+        load_profile("test-profile", profiles_dir)
+
+
 def test_validate_against_profile_violations(profiles_dir: Path):
     profile = load_profile("test-profile", profiles_dir)
     result = validate_against_profile(["sqlalchemy", "fastapi"], profile)
@@ -108,3 +153,44 @@ def test_profile_extends_merges(extending_profiles_dir: Path):
     assert "api" in required
     # Child stack_md overrides base
     assert "# Child Stack" in profile["stack_md"]
+
+
+def test_merge_profiles_leaves_arguments_untouched():
+    base = {"profile": {"name": "base"}, "constraints": {"forbidden": {"orm": ["prisma"]}}}
+    override = {"profile": {"name": "child"}, "constraints": {"forbidden": {"css": ["emotion"]}}}
+    merged = profile_loader._merge_profiles(base, override)
+    assert merged["constraints"]["forbidden"] == {"orm": ["prisma"], "css": ["emotion"]}
+    assert override["constraints"] == {"forbidden": {"css": ["emotion"]}}
+    assert base["constraints"] == {"forbidden": {"orm": ["prisma"]}}
+
+
+def test_profile_extends_inherits_base_docs(extending_profiles_dir: Path):
+    (extending_profiles_dir / "child" / "STACK.md").unlink()
+    profile = load_profile("child", extending_profiles_dir)
+    assert "# Base Stack" in profile["stack_md"]
+
+
+def test_validate_against_plain_profile_dict():
+    profile = {
+        "constraints": {
+            "required": {"database": {"name": "Postgres", "reason": "SQL"}},
+            "forbidden": {"orm": ["Prisma"]},
+        }
+    }
+    result = validate_against_profile(["prisma", "postgresql"], profile)
+    assert result == {"violations": ["prisma"], "gaps": []}
+
+
+def test_profile_extends_chain_loaded_once(extending_profiles_dir: Path, monkeypatch):
+    calls = []
+    real_load_toml = profile_loader.load_toml
+
+    def counting_load_toml(path):
+        calls.append(Path(path).parent.name)
+        return real_load_toml(path)
+
+    monkeypatch.setattr(profile_loader, "load_toml", counting_load_toml)
+    first = load_profile("child", extending_profiles_dir)
+    second = load_profile("child", extending_profiles_dir)
+    assert first == second
+    assert sorted(calls) == ["base", "base", "child", "child"]
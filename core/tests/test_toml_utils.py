@@ -1,11 +1,12 @@
 """Tests for TOML loading and validation utilities."""
 
+import os
 from pathlib import Path
 
 import pytest
 
 from rtg_core.errors import ConfigError, ValidationError
-from rtg_core.toml_utils import load_toml, validate_toml
+from rtg_core.toml_utils import clear_toml_cache, load_toml, validate_toml
 
 
 @pytest.fixture
@@ -40,6 +41,29 @@ def test_load_toml_invalid_syntax(tmp_path: Path):
         load_toml(bad_file)
 
 
+def test_load_toml_cache_returns_private_copy(tmp_toml: Path):
+    first = load_toml(tmp_toml)
+    first["module"]["name"] = "mutated"
+    assert load_toml(tmp_toml)["module"]["name"] == "test"
+
+
+def test_load_toml_cache_invalidated_on_change(tmp_toml: Path):
+    assert load_toml(tmp_toml)["module"]["version"] == "0.1.0"
+    tmp_toml.write_text('[module]\nname = "test"\nversion = "0.2.0-rc"\n')
+    assert load_toml(tmp_toml)["module"]["version"] == "0.2.0-rc"
+
+
+def test_clear_toml_cache(tmp_toml: Path):
+    st = os.stat(tmp_toml)
+    assert load_toml(tmp_toml)["module"]["version"] == "0.1.0"
+    # Same size and mtime: only clearing the cache picks up the edit
+    tmp_toml.write_text('[module]\nname = "test"\nversion = "0.9.0"\n')
+    os.utime(tmp_toml, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert load_toml(tmp_toml)["module"]["version"] == "0.1.0"
+    clear_toml_cache()
+    assert load_toml(tmp_toml)["module"]["version"] == "0.9.0"
+
+
 def test_validate_toml_success():
     data = {"module": {"name": "test", "version": "0.1.0"}}
     errors = validate_toml(data, {"module.name": str, "module.version": str})
@@ -66,3 +90,8 @@ def test_validate_toml_multiple_types():
     data2 = {"value": 42}
     errors2 = validate_toml(data2, {"value": [str, int]})
     assert errors2 == []
+
+
+def test_validate_toml_multiple_types_mismatch():
+    with pytest.raises(ValidationError, match=r"should be one of \(str, int\)"):
+        validate_toml({"value": 1.5}, {"value": [str, int]})
@@ -0,0 +1,94 @@
+"""Shared file and JSON helpers for the intelligence modules.
+
+Every module that loads a skill's meta.toml or SKILL.md goes through these
+helpers, so one process (e.g. gather evidence, then compare practices) reads
+and parses each file only once. JSON goes through orjson when installed
+(forge-intelligence[fast]), else the stdlib encoder.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import os
+import tomllib
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+# Prefer the Rust-backed rtoml parser when installed (forge-intelligence[fast]);
+# it reads and parses the file without a Python-side decode.
+try:
+    import rtoml
+
+    def _parse_toml_file(path_str: str) -> dict:
+        return rtoml.load(Path(path_str))
+except ImportError:
+    def _parse_toml_file(path_str: str) -> dict:
+        with open(path_str, "rb") as f:
+            return tomllib.load(f)
+
+
+# Keyed on mtime as well as path so an edited file is never served stale.
+@lru_cache(maxsize=4096)
+def _load_toml_cached(path_str: str, mtime_ns: int) -> dict:
+    return _parse_toml_file(path_str)
+
+
+@lru_cache(maxsize=1024)
+def _read_md_cached(path_str: str, mtime_ns: int) -> str:
+    with open(path_str, encoding="utf-8", buffering=131072) as f:
+        return f.read()
+
+
+def load_toml(path: str | Path) -> dict:
+    """Load and parse a TOML file. Returns empty dict on failure.
+
+    Callers get a private copy, so mutating the result never leaks into the cache.
+    """
+    try:
+        path_str = os.fspath(path)
+        return copy.deepcopy(_load_toml_cached(path_str, os.stat(path_str).st_mtime_ns))
+    except Exception:
+        return {}
+
+
+def read_md(path: str | Path) -> str:
+    """Read a UTF-8 text file. Returns empty string on failure."""
+    try:
+        path_str = os.fspath(path)
+        return _read_md_cached(path_str, os.stat(path_str).st_mtime_ns)
+    except Exception:
+        return ""
+
+
+# orjson encodes and decodes large JSON payloads several times faster than the
+# stdlib; both produce the same indented text.
+try:
+    import orjson
+
+    def loads(data: bytes | str) -> Any:
+        """Decode JSON from raw file bytes or a string."""
+        return orjson.loads(data)
+
+    def dumps(obj: object) -> str:
+        """Encode obj as indented JSON text."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    def dump_to(obj: object, path: Path) -> None:
+        """Write obj to path as indented JSON."""
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+except ImportError:
+    def loads(data: bytes | str) -> Any:
+        """Decode JSON from raw file bytes or a string."""
+        return json.loads(data)
+
+    def dumps(obj: object) -> str:
+        """Encode obj as indented JSON text."""
+        return json.dumps(obj, indent=2)
+
+    def dump_to(obj: object, path: Path) -> None:
+        """Write obj to path as indented JSON."""
+        # Stream through a buffered handle rather than building the whole string
+        with open(path, "w", encoding="utf-8", buffering=131072) as f:
+            json.dump(obj, f, indent=2)
@@ -6,27 +6,18 @@ and community patterns to identify skills that may need updates.
 
 from __future__ import annotations
 
+import asyncio
 import json
+import os
 import sys
-import urllib.request
+import time
+import urllib.parse
 from pathlib import Path
 
-import tomli
-
-
-def _load_toml(path: Path) -> dict:
-    try:
-        return tomli.loads(path.read_text(encoding="utf-8"))
-    except Exception:
-        return {}
-
-
-def _read_md(path: Path) -> str:
-    try:
-        return path.read_text(encoding="utf-8")
-    except Exception:
-        return ""
+import httpx
 
+from ._io import dumps as _dumps
+from ._io import load_toml as _load_toml
 
 # Map of relevance tags to PyPI package names
 TAG_TO_PYPI: dict[str, str] = {
@@ -49,96 +40,242 @@ TAG_TO_NPM: dict[str, str] = {
 }
 
 
-def check_pypi_version(package: str) -> str | None:
-    """Fetch the latest version of a package from PyPI."""
-    url = f"https://pypi.org/pypi/{package}/json"
+# Registry lookups memoised per (registry, package) so skills that share tags
+# (fastapi, pydantic, ...) trigger one request per hour, not one per skill.
+_VERSION_TTL_SECONDS = 3600.0
+_version_cache: dict[tuple[str, str], tuple[float, str | None]] = {}
+
+
+def _registry_url(registry: str, package: str) -> str:
+    if registry == "pypi":
+        return f"https://pypi.org/pypi/{package}/json"
+    return f"https://registry.npmjs.org/{package}/latest"
+
+
+def _extract_version(registry: str, data: dict) -> str | None:
+    if registry == "pypi":
+        return data.get("info", {}).get("version")
+    return data.get("version")
+
+
+# On-disk cache shared across runs. RTG_UPSTREAM_CACHE_MODE selects the policy:
+#   normal   - use entries younger than 24h, fetch and store otherwise (default)
+#   replay   - only use cached entries, whatever their age; a miss is an error
+#   disabled - never read or write the disk cache
+_DISK_TTL_SECONDS = 24 * 3600
+
+
+def _cache_mode() -> str:
+    mode = os.environ.get("RTG_UPSTREAM_CACHE_MODE", "normal").lower()
+    if mode not in ("normal", "replay", "disabled"):
+        raise ValueError(f"Unknown RTG_UPSTREAM_CACHE_MODE: {mode!r}")
+    return mode
+
+
+def _disk_cache_path(registry: str, package: str) -> Path:
+    cache_home = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    # Scoped npm names ("@tanstack/react-query") must not create subdirectories
+    filename = urllib.parse.quote(package, safe="") + ".json"
+    return cache_home / "rtg-forge" / "upstream" / registry / filename
+
+
+def _read_disk_cache(registry: str, package: str, max_age: float | None) -> dict | None:
     try:
-        with urllib.request.urlopen(url, timeout=10) as resp:
-            data = json.loads(resp.read())
-            return data.get("info", {}).get("version")
-    except Exception:
+        entry = json.loads(_disk_cache_path(registry, package).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
         return None
+    if max_age is not None and time.time() - entry.get("fetched_at", 0) >= max_age:
+        return None
+    return entry
 
 
-def check_npm_version(package: str) -> str | None:
-    """Fetch the latest version of a package from npm registry."""
-    url = f"https://registry.npmjs.org/{package}/latest"
+def _write_disk_cache(registry: str, package: str, version: str | None) -> None:
+    path = _disk_cache_path(registry, package)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps({"version": version, "fetched_at": time.time()}), encoding="utf-8"
+        )
+    except OSError:
+        pass
+
+
+async def _fetch_version(client: httpx.AsyncClient, registry: str, package: str) -> str | None:
+    key = (registry, package)
+    cached = _version_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < _VERSION_TTL_SECONDS:
+        return cached[1]
+
+    mode = _cache_mode()
+    if mode != "disabled":
+        entry = _read_disk_cache(registry, package, None if mode == "replay" else _DISK_TTL_SECONDS)
+        if entry is not None:
+            _version_cache[key] = (time.monotonic(), entry.get("version"))
+            return entry.get("version")
+        if mode == "replay":
+            raise LookupError(
+                f"No cached {registry} version for {package!r} "
+                "(RTG_UPSTREAM_CACHE_MODE=replay)"
+            )
+
     try:
-        with urllib.request.urlopen(url, timeout=10) as resp:
-            data = json.loads(resp.read())
-            return data.get("version")
+        resp = await client.get(_registry_url(registry, package))
+        resp.raise_for_status()
+        version = _extract_version(registry, resp.json())
     except Exception:
+        # Failed lookups are not cached so the next run retries them
         return None
+    _version_cache[key] = (time.monotonic(), version)
+    if mode != "disabled":
+        _write_disk_cache(registry, package, version)
+    return version
 
 
-def check_skill_upstream(skill_name: str, forge_root: Path) -> dict:
-    """Check upstream versions for technologies in a skill's relevance tags.
+class _VersionLookup:
+    """Shares one in-flight task per (registry, package) within a run."""
 
-    Returns a dict with:
-    - skill_name
-    - tags checked
-    - current upstream versions found
-    - any version mentions in SKILL.md
-    """
-    skills_dir = forge_root / "skills"
-    skill_dir = None
-    skill_data = {}
+    def __init__(self, client: httpx.AsyncClient) -> None:
+        self._client = client
+        self._tasks: dict[tuple[str, str], asyncio.Task[str | None]] = {}
+
+    def get(self, registry: str, package: str) -> asyncio.Task[str | None]:
+        key = (registry, package)
+        if key not in self._tasks:
+            self._tasks[key] = asyncio.ensure_future(
+                _fetch_version(self._client, registry, package)
+            )
+        return self._tasks[key]
 
-    if skills_dir.is_dir():
-        for category_dir in skills_dir.iterdir():
-            if not category_dir.is_dir() or category_dir.name.startswith("_"):
+
+async def check_pypi_version_async(client: httpx.AsyncClient, package: str) -> str | None:
+    """Fetch the latest version of a package from PyPI."""
+    return await _fetch_version(client, "pypi", package)
+
+
+async def check_npm_version_async(client: httpx.AsyncClient, package: str) -> str | None:
+    """Fetch the latest version of a package from npm registry."""
+    return await _fetch_version(client, "npm", package)
+
+
+def check_pypi_version(package: str) -> str | None:
+    """Fetch the latest version of a package from PyPI."""
+    return asyncio.run(_fetch_one("pypi", package))
+
+
+def check_npm_version(package: str) -> str | None:
+    """Fetch the latest version of a package from npm registry."""
+    return asyncio.run(_fetch_one("npm", package))
+
+
+async def _fetch_one(registry: str, package: str) -> str | None:
+    async with httpx.AsyncClient(timeout=10) as client:
+        return await _fetch_version(client, registry, package)
+
+
+def _find_skill_dir(skill_name: str, forge_root: Path) -> tuple[Path, dict] | None:
+    skills_dir = forge_root / "skills"
+    if not skills_dir.is_dir():
+        return None
+    with os.scandir(skills_dir) as it:
+        for category in it:
+            if not category.is_dir(follow_symlinks=False) or category.name.startswith("_"):
                 continue
-            candidate = category_dir / skill_name
-            if (candidate / "meta.toml").exists():
-                skill_dir = candidate
-                skill_data = _load_toml(candidate / "meta.toml")
-                break
+            meta_path = os.path.join(category.path, skill_name, "meta.toml")
+            if os.path.isfile(meta_path):
+                return Path(category.path, skill_name), _load_toml(Path(meta_path))
+    return None
 
-    if skill_dir is None:
+
+async def _check_skill(skill_name: str, forge_root: Path, lookup: _VersionLookup) -> dict:
+    found = _find_skill_dir(skill_name, forge_root)
+    if found is None:
         return {"error": f"Skill '{skill_name}' not found."}
+    skill_dir, skill_data = found
 
     tags = skill_data.get("skill", {}).get("relevance_tags", [])
-    skill_content = _read_md(skill_dir / "SKILL.md")
-
-    upstream_versions: dict[str, str | None] = {}
 
+    packages: list[tuple[str, str]] = []
     for tag in tags:
         tag_lower = tag.lower()
         if tag_lower in TAG_TO_PYPI:
-            version = check_pypi_version(TAG_TO_PYPI[tag_lower])
-            if version:
-                upstream_versions[f"pypi:{TAG_TO_PYPI[tag_lower]}"] = version
+            packages.append(("pypi", TAG_TO_PYPI[tag_lower]))
         if tag_lower in TAG_TO_NPM:
-            version = check_npm_version(TAG_TO_NPM[tag_lower])
-            if version:
-                upstream_versions[f"npm:{TAG_TO_NPM[tag_lower]}"] = version
+            packages.append(("npm", TAG_TO_NPM[tag_lower]))
 
-    return {
+    versions = await asyncio.gather(
+        *(lookup.get(registry, pkg) for registry, pkg in packages), return_exceptions=True
+    )
+    upstream_versions: dict[str, str | None] = {}
+    upstream_errors: dict[str, str] = {}
+    for (registry, pkg), version in zip(packages, versions, strict=True):
+        if isinstance(version, LookupError):
+            # Replay-mode cache miss: report it for this package only
+            upstream_errors[f"{registry}:{pkg}"] = "not cached"
+        elif isinstance(version, BaseException):
+            raise version
+        elif version:
+            upstream_versions[f"{registry}:{pkg}"] = version
+
+    result = {
         "skill_name": skill_name,
         "skill_path": str(skill_dir),
         "tags_checked": tags,
         "upstream_versions": upstream_versions,
         "last_optimized": skill_data.get("optimization", {}).get("last_optimized", "unknown"),
     }
+    if upstream_errors:
+        result["upstream_errors"] = upstream_errors
+    return result
+
+
+async def _check_skills(skill_names: list[str], forge_root: Path) -> list[dict]:
+    async with httpx.AsyncClient(timeout=10) as client:
+        lookup = _VersionLookup(client)
+        return await asyncio.gather(
+            *(_check_skill(name, forge_root, lookup) for name in skill_names)
+        )
+
+
+def check_skill_upstream(skill_name: str, forge_root: Path) -> dict:
+    """Check upstream versions for technologies in a skill's relevance tags.
+
+    Returns a dict with:
+    - skill_name
+    - tags checked
+    - current upstream versions found
+    - any version mentions in SKILL.md
+    - upstream_errors, only when some packages had no replay-cache entry
+    """
+    return asyncio.run(_check_skills([skill_name], forge_root))[0]
 
 
 def check_all_skills(forge_root: Path) -> list[dict]:
-    """Check upstream for all skills in the forge."""
+    """Check upstream for all skills in the forge.
+
+    All registry lookups across all skills run concurrently, and each
+    (registry, package) pair is fetched at most once per run.
+    """
     skills_dir = forge_root / "skills"
     if not skills_dir.is_dir():
         return []
 
-    results = []
-    for category_dir in sorted(skills_dir.iterdir()):
-        if not category_dir.is_dir() or category_dir.name.startswith("_"):
+    skill_names = []
+    with os.scandir(skills_dir) as it:
+        categories = sorted(it, key=lambda e: e.name)
+    for category in categories:
+        if not category.is_dir(follow_symlinks=False) or category.name.startswith("_"):
             continue
-        for skill_dir in sorted(category_dir.iterdir()):
-            if (skill_dir / "meta.toml").exists():
-                result = check_skill_upstream(skill_dir.name, forge_root)
-                if "error" not in result:
-                    results.append(result)
+        with os.scandir(category.path) as it:
+            skill_entries = sorted(it, key=lambda e: e.name)
+        for skill_entry in skill_entries:
+            if os.path.isfile(os.path.join(skill_entry.path, "meta.toml")):
+                skill_names.append(skill_entry.name)
+
+    if not skill_names:
+        return []
 
-    return results
+    results = asyncio.run(_check_skills(skill_names, forge_root))
+    return [result for result in results if "error" not in result]
 
 
 def main() -> None:
@@ -147,10 +284,10 @@ def main() -> None:
 
     if len(sys.argv) > 1 and sys.argv[1] != "--all":
         result = check_skill_upstream(sys.argv[1], forge_root)
-        print(json.dumps(result, indent=2))
+        print(_dumps(result))
     else:
         results = check_all_skills(forge_root)
-        print(json.dumps(results, indent=2))
+        print(_dumps(results))
 
 
 if __name__ == "__main__":
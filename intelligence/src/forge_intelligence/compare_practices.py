@@ -9,30 +9,31 @@ from __future__ import annotations
 import json
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 
-import tomli
+from ._io import dumps as _dumps
+from ._io import read_md as _read_md
 
+# google-re2 (forge-intelligence[fast]) guarantees linear-time matching on
+# arbitrary SKILL.md content; the stdlib engine is the fallback.
+try:
+    import re2 as _regex
+except ImportError:
+    _regex = re
 
-def _load_toml(path: Path) -> dict:
-    try:
-        return tomli.loads(path.read_text(encoding="utf-8"))
-    except Exception:
-        return {}
+# Match patterns like: 1.2.3, >=1.0, v2.0, etc.
+_VERSION_RE = _regex.compile(r"(?:[vV]|>=?|<=?|~=|==)?\d+\.\d+(?:\.\d+)?")
 
 
-def _read_md(path: Path) -> str:
-    try:
-        return path.read_text(encoding="utf-8")
-    except Exception:
-        return ""
+@lru_cache(maxsize=256)
+def _cached_version_mentions(content: str) -> tuple[str, ...]:
+    return tuple(_VERSION_RE.findall(content))
 
 
 def extract_version_mentions(content: str) -> list[str]:
     """Extract version-like strings from skill content."""
-    # Match patterns like: 1.2.3, >=1.0, v2.0, etc.
-    pattern = r'(?:v|>=?|<=?|~=|==)?\d+\.\d+(?:\.\d+)?'
-    return re.findall(pattern, content)
+    return list(_cached_version_mentions(content))
 
 
 def compare_skill_practices(
@@ -101,7 +102,7 @@ def main() -> None:
     else:
         results = [compare_skill_practices(upstream_data, forge_root)]
 
-    print(json.dumps(results, indent=2))
+    print(_dumps(results))
 
 
 if __name__ == "__main__":
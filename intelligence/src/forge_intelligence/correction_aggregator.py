@@ -6,21 +6,26 @@ CLAUDE.md generation to work with accumulated correction data.
 
 from __future__ import annotations
 
-import json
+import os
+import re
+import sys
+import tomllib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from operator import itemgetter
 from pathlib import Path
 
-import tomli
+from ._io import dumps as _dumps
 
+# Below this many decision files a thread pool costs more than it saves.
+_PARALLEL_THRESHOLD = 4
 
-@dataclass
-class Observation:
-    date: str
-    project: str
-    file: str
+# Cheap byte-level test for a correction record, run before the TOML parser.
+_CORRECTION_TYPE_RE = re.compile(rb"""type\s*=\s*["']correction["']""")
 
 
-@dataclass
+@dataclass(slots=True)
 class Correction:
     name: str
     skill_applied: str
@@ -31,31 +36,53 @@ class Correction:
     total_observations: int
     first_observed: str
     last_observed: str
-    observations: list[Observation]
+    # Project of each observation, in record order (date/file are not needed downstream)
+    observation_projects: list[str]
     themes: list[str]
     origin: str
     predictability: str
     applies_to: list[str]
     description: str
     path: str
+    # Distinct non-empty projects in first-observed order
+    unique_projects: tuple[str, ...] = field(init=False, compare=False)
+    # Lowercased applies_to, computed once so filter_by_tech avoids per-call lowering
+    _applies_to_lc: frozenset[str] = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        self.unique_projects = tuple(dict.fromkeys(p for p in self.observation_projects if p))
+        self._applies_to_lc = frozenset(t.lower() for t in self.applies_to)
 
-@dataclass
+
+@dataclass(slots=True)
 class AggregatedStats:
     total_corrections: int = 0
     total_observations: int = 0
-    by_skill: dict[str, int] = field(default_factory=dict)
-    by_theme: dict[str, int] = field(default_factory=dict)
-    by_impact: dict[str, int] = field(default_factory=dict)
-    by_origin: dict[str, int] = field(default_factory=dict)
-    by_predictability: dict[str, int] = field(default_factory=dict)
+    by_skill: Counter[str] = field(default_factory=Counter)
+    by_theme: Counter[str] = field(default_factory=Counter)
+    by_impact: Counter[str] = field(default_factory=Counter)
+    by_origin: Counter[str] = field(default_factory=Counter)
+    by_predictability: Counter[str] = field(default_factory=Counter)
     corrections: list[Correction] = field(default_factory=list)
 
 
-def _load_toml(path: Path) -> dict:
-    """Load and parse a TOML file. Returns empty dict on failure."""
+def _intern(value: str) -> str:
+    """Intern a small-domain field so later equality checks hit the identity fast path."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _load_correction_toml(path: str) -> dict:
+    """Parse a decision.toml, returning an empty dict unless it may be a correction.
+
+    Files that never mention ``type = "correction"`` are skipped without
+    parsing; the caller still checks the parsed type as the source of truth.
+    """
     try:
-        return tomli.loads(path.read_text(encoding="utf-8"))
+        with open(path, "rb") as f:
+            raw = f.read()
+        if _CORRECTION_TYPE_RE.search(raw) is None:
+            return {}
+        return tomllib.loads(raw.decode("utf-8"))
     except Exception:
         return {}
 
@@ -69,78 +96,108 @@ def load_corrections(forge_root: Path) -> list[Correction]:
     if not decisions_dir.is_dir():
         return []
 
-    corrections: list[Correction] = []
+    # scandir entries carry their d_type, so is_dir() needs no extra stat
+    with os.scandir(decisions_dir) as it:
+        category_dirs = sorted(it, key=lambda e: e.name)
 
-    for category_dir in sorted(decisions_dir.iterdir()):
+    decision_dirs: list[os.DirEntry[str]] = []
+    toml_paths: list[str] = []
+    for category_dir in category_dirs:
         if not category_dir.is_dir() or category_dir.name.startswith(("_", ".")):
             continue
 
-        for decision_dir in sorted(category_dir.iterdir()):
-            toml_path = decision_dir / "decision.toml"
-            if not (decision_dir.is_dir() and toml_path.exists()):
+        with os.scandir(category_dir.path) as it:
+            entries = sorted(it, key=lambda e: e.name)
+
+        for decision_dir in entries:
+            if not decision_dir.is_dir():
                 continue
+            toml_path = os.path.join(decision_dir.path, "decision.toml")
+            if os.path.isfile(toml_path):
+                decision_dirs.append(decision_dir)
+                toml_paths.append(toml_path)
+
+    # Reads and parses overlap well across threads; results keep walk order.
+    if len(toml_paths) < _PARALLEL_THRESHOLD:
+        parsed = [_load_correction_toml(p) for p in toml_paths]
+    else:
+        workers = min(32, (os.cpu_count() or 1) * 4, len(toml_paths))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            parsed = list(pool.map(_load_correction_toml, toml_paths))
 
-            data = _load_toml(toml_path)
-            dec = data.get("decision", {})
+    corrections: list[Correction] = []
+    for decision_dir, data in zip(decision_dirs, parsed, strict=True):
+        dec = data.get("decision", {})
 
-            if dec.get("type") != "correction":
-                continue
+        if dec.get("type") != "correction":
+            continue
 
-            corr = data.get("correction", {})
-            freq = corr.get("frequency", {})
-            classification = corr.get("classification", {})
-            ctx = dec.get("context", {})
-
-            observations = [
-                Observation(
-                    date=obs.get("date", ""),
-                    project=obs.get("project", ""),
-                    file=obs.get("file", ""),
-                )
-                for obs in freq.get("observations", [])
-            ]
-
-            corrections.append(
-                Correction(
-                    name=dec.get("name", decision_dir.name),
-                    skill_applied=corr.get("skill_applied", ""),
-                    instinct_pattern=corr.get("instinct_pattern", ""),
-                    corrected_pattern=corr.get("corrected_pattern", ""),
-                    impact_level=corr.get("impact_level", "unknown"),
-                    severity=dec.get("severity", "unknown"),
-                    total_observations=freq.get("total_observations", 0),
-                    first_observed=freq.get("first_observed", ""),
-                    last_observed=freq.get("last_observed", ""),
-                    observations=observations,
-                    themes=classification.get("themes", []),
-                    origin=classification.get("origin", "unknown"),
-                    predictability=classification.get("predictability", "unknown"),
-                    applies_to=ctx.get("applies_to", []),
-                    description=dec.get("description", ""),
-                    path=str(decision_dir),
-                )
+        corr = data.get("correction", {})
+        freq = corr.get("frequency", {})
+        classification = corr.get("classification", {})
+        ctx = dec.get("context", {})
+
+        observation_projects = [obs.get("project", "") for obs in freq.get("observations", [])]
+
+        corrections.append(
+            Correction(
+                name=dec.get("name", decision_dir.name),
+                skill_applied=_intern(corr.get("skill_applied", "")),
+                instinct_pattern=corr.get("instinct_pattern", ""),
+                corrected_pattern=corr.get("corrected_pattern", ""),
+                impact_level=_intern(corr.get("impact_level", "unknown")),
+                severity=_intern(dec.get("severity", "unknown")),
+                total_observations=freq.get("total_observations", 0),
+                first_observed=freq.get("first_observed", ""),
+                last_observed=freq.get("last_observed", ""),
+                observation_projects=observation_projects,
+                themes=classification.get("themes", []),
+                origin=_intern(classification.get("origin", "unknown")),
+                predictability=_intern(classification.get("predictability", "unknown")),
+                applies_to=ctx.get("applies_to", []),
+                description=dec.get("description", ""),
+                path=decision_dir.path,
             )
+        )
 
     return corrections
 
 
+def filter_corrections(
+    corrections: list[Correction],
+    *,
+    skill: str | None = None,
+    min_freq: int | None = None,
+    technologies: list[str] | None = None,
+) -> list[Correction]:
+    """Filter corrections by any combination of skill, frequency, and technology.
+
+    All given conditions must hold. Runs as a single pass, so chaining several
+    criteria builds no intermediate lists.
+    """
+    tech_set = frozenset(t.lower() for t in technologies) if technologies is not None else None
+    return [
+        c
+        for c in corrections
+        if (skill is None or c.skill_applied == skill)
+        and (min_freq is None or c.total_observations >= min_freq)
+        and (tech_set is None or not tech_set.isdisjoint(c._applies_to_lc))
+    ]
+
+
 def filter_by_skill(corrections: list[Correction], skill_name: str) -> list[Correction]:
     """Filter corrections to those triggered by a specific skill."""
-    return [c for c in corrections if c.skill_applied == skill_name]
+    return filter_corrections(corrections, skill=skill_name)
 
 
 def filter_by_tech(corrections: list[Correction], technologies: list[str]) -> list[Correction]:
     """Filter corrections to those relevant to the given technologies."""
-    tech_set = {t.lower() for t in technologies}
-    return [
-        c for c in corrections
-        if any(tag.lower() in tech_set for tag in c.applies_to)
-    ]
+    return filter_corrections(corrections, technologies=technologies)
 
 
 def filter_by_min_frequency(corrections: list[Correction], min_freq: int) -> list[Correction]:
     """Filter corrections to those with at least min_freq observations."""
-    return [c for c in corrections if c.total_observations >= min_freq]
+    return filter_corrections(corrections, min_freq=min_freq)
 
 
 def rank_by_frequency(corrections: list[Correction]) -> list[Correction]:
@@ -155,58 +212,44 @@ def aggregate(corrections: list[Correction]) -> AggregatedStats:
     stats.corrections = rank_by_frequency(corrections)
 
     for c in corrections:
-        stats.total_observations += c.total_observations
-
-        stats.by_skill[c.skill_applied] = (
-            stats.by_skill.get(c.skill_applied, 0) + c.total_observations
-        )
-
+        obs = c.total_observations
+        stats.total_observations += obs
+        stats.by_skill[c.skill_applied] += obs
         for theme in c.themes:
-            stats.by_theme[theme] = stats.by_theme.get(theme, 0) + c.total_observations
-
-        stats.by_impact[c.impact_level] = (
-            stats.by_impact.get(c.impact_level, 0) + c.total_observations
-        )
+            stats.by_theme[theme] += obs
+        stats.by_impact[c.impact_level] += obs
+        stats.by_origin[c.origin] += obs
+        stats.by_predictability[c.predictability] += obs
 
-        stats.by_origin[c.origin] = (
-            stats.by_origin.get(c.origin, 0) + c.total_observations
-        )
+    return stats
 
-        stats.by_predictability[c.predictability] = (
-            stats.by_predictability.get(c.predictability, 0) + c.total_observations
-        )
 
-    return stats
+def to_dict(stats: AggregatedStats) -> dict:
+    """Convert aggregated stats to a JSON-compatible dict."""
+    return {
+        "total_corrections": stats.total_corrections,
+        "total_observations": stats.total_observations,
+        "by_skill": dict(sorted(stats.by_skill.items(), key=itemgetter(1), reverse=True)),
+        "by_theme": dict(sorted(stats.by_theme.items(), key=itemgetter(1), reverse=True)),
+        "by_impact": dict(stats.by_impact),
+        "by_origin": dict(stats.by_origin),
+        "by_predictability": dict(stats.by_predictability),
+        "corrections": [
+            {
+                "name": c.name,
+                "skill": c.skill_applied,
+                "instinct_pattern": c.instinct_pattern,
+                "corrected_pattern": c.corrected_pattern,
+                "impact_level": c.impact_level,
+                "total_observations": c.total_observations,
+                "predictability": c.predictability,
+                "themes": list(c.themes),
+            }
+            for c in stats.corrections
+        ],
+    }
 
 
 def to_json(stats: AggregatedStats) -> str:
     """Serialize aggregated stats to JSON."""
-    return json.dumps(
-        {
-            "total_corrections": stats.total_corrections,
-            "total_observations": stats.total_observations,
-            "by_skill": dict(
-                sorted(stats.by_skill.items(), key=lambda x: x[1], reverse=True)
-            ),
-            "by_theme": dict(
-                sorted(stats.by_theme.items(), key=lambda x: x[1], reverse=True)
-            ),
-            "by_impact": stats.by_impact,
-            "by_origin": stats.by_origin,
-            "by_predictability": stats.by_predictability,
-            "corrections": [
-                {
-                    "name": c.name,
-                    "skill": c.skill_applied,
-                    "instinct_pattern": c.instinct_pattern,
-                    "corrected_pattern": c.corrected_pattern,
-                    "impact_level": c.impact_level,
-                    "total_observations": c.total_observations,
-                    "predictability": c.predictability,
-                    "themes": c.themes,
-                }
-                for c in stats.corrections
-            ],
-        },
-        indent=2,
-    )
+    return _dumps(to_dict(stats))
@@ -12,17 +12,25 @@ from __future__ import annotations
 
 import json
 import sys
-from dataclasses import dataclass
+from collections import Counter
+from dataclasses import dataclass, field
 from pathlib import Path
 
+from ._io import dump_to as _dump_to
+from ._io import dumps as _dumps
+
 PERSPECTIVES = {
     "conservative",
     "progressive",
     "synthesizer",
 }
 
+# Rule inputs shared by the perspective ladders below.
+_BROAD_IMPACTS = frozenset({"architectural", "structural"})
+_PATTERN_PREDICTABILITY = frozenset({"high", "medium"})
+
 
-@dataclass
+@dataclass(slots=True)
 class Proposal:
     correction_name: str
     action: str  # ADOPT | INVESTIGATE | DEFER
@@ -30,13 +38,15 @@ class Proposal:
     confidence: str  # high | medium | low
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentOpinion:
     perspective: str
     skill_name: str
     summary: str
     proposals: list[Proposal]
     overall_recommendation: str
+    # Filled alongside proposals so the synthesizer can look them up directly
+    proposals_by_name: dict[str, Proposal] = field(default_factory=dict)
 
 
 def run_conservative(evidence: dict) -> AgentOpinion:
@@ -52,16 +62,17 @@ def run_conservative(evidence: dict) -> AgentOpinion:
     corrections = evidence.get("corrections", [])
 
     proposals: list[Proposal] = []
+    by_name: dict[str, Proposal] = {}
     for c in corrections:
         obs = c.get("total_observations", 0)
-        projects = c.get("projects", [])
+        n_projects = len(c.get("projects", []))
         impact = c.get("impact_level", "style")
         predictability = c.get("predictability", "low")
 
-        if obs >= 5 and len(projects) >= 2 and impact in ("architectural", "structural"):
+        if obs >= 5 and n_projects >= 2 and impact in _BROAD_IMPACTS:
             action = "INVESTIGATE"
             reasoning = (
-                f"Observed {obs} times across {len(projects)} projects at {impact} level. "
+                f"Observed {obs} times across {n_projects} projects at {impact} level. "
                 "Worth investigating but verify it's not project-specific."
             )
             confidence = "medium"
@@ -80,15 +91,18 @@ def run_conservative(evidence: dict) -> AgentOpinion:
             )
             confidence = "medium"
 
-        proposals.append(Proposal(
+        proposal = Proposal(
             correction_name=c.get("name", "unknown"),
             action=action,
             reasoning=reasoning,
             confidence=confidence,
-        ))
+        )
+        proposals.append(proposal)
+        by_name[proposal.correction_name] = proposal
 
-    adopt_count = sum(1 for p in proposals if p.action == "ADOPT")
-    investigate_count = sum(1 for p in proposals if p.action == "INVESTIGATE")
+    counts = Counter(p.action for p in proposals)
+    adopt_count = counts["ADOPT"]
+    investigate_count = counts["INVESTIGATE"]
 
     if adopt_count > 0:
         overall = f"Cautiously support {adopt_count} adoption(s), {investigate_count} investigation(s). Defer the rest."
@@ -103,6 +117,7 @@ def run_conservative(evidence: dict) -> AgentOpinion:
         summary=f"Reviewed {len(corrections)} corrections with conservative lens.",
         proposals=proposals,
         overall_recommendation=overall,
+        proposals_by_name=by_name,
     )
 
 
@@ -119,13 +134,14 @@ def run_progressive(evidence: dict) -> AgentOpinion:
     corrections = evidence.get("corrections", [])
 
     proposals: list[Proposal] = []
+    by_name: dict[str, Proposal] = {}
     for c in corrections:
         obs = c.get("total_observations", 0)
         origin = c.get("origin", "unknown")
         predictability = c.get("predictability", "low")
         impact = c.get("impact_level", "style")
 
-        if obs >= 3 and predictability in ("high", "medium"):
+        if obs >= 3 and predictability in _PATTERN_PREDICTABILITY:
             action = "ADOPT"
             reasoning = (
                 f"Observed {obs} times with {predictability} predictability. "
@@ -151,14 +167,16 @@ def run_progressive(evidence: dict) -> AgentOpinion:
             reasoning = f"Only {obs} observation(s) at {impact} level. Monitor for now."
             confidence = "low"
 
-        proposals.append(Proposal(
+        proposal = Proposal(
             correction_name=c.get("name", "unknown"),
             action=action,
             reasoning=reasoning,
             confidence=confidence,
-        ))
+        )
+        proposals.append(proposal)
+        by_name[proposal.correction_name] = proposal
 
-    adopt_count = sum(1 for p in proposals if p.action == "ADOPT")
+    adopt_count = Counter(p.action for p in proposals)["ADOPT"]
     overall = f"Recommend adopting {adopt_count} of {len(proposals)} corrections into the skill."
 
     return AgentOpinion(
@@ -167,6 +185,7 @@ def run_progressive(evidence: dict) -> AgentOpinion:
         summary=f"Reviewed {len(corrections)} corrections with progressive lens.",
         proposals=proposals,
         overall_recommendation=overall,
+        proposals_by_name=by_name,
     )
 
 
@@ -185,9 +204,14 @@ def run_synthesizer(
     skill_name = evidence.get("skill_name", "unknown")
     corrections = evidence.get("corrections", [])
 
-    # Index opinions by correction name
-    conservative_by_name = {p.correction_name: p for p in conservative_opinion.proposals}
-    progressive_by_name = {p.correction_name: p for p in progressive_opinion.proposals}
+    # The run_* agents index their proposals as they go; hand-built opinions
+    # may not, so fall back to indexing them here.
+    conservative_by_name = conservative_opinion.proposals_by_name or {
+        p.correction_name: p for p in conservative_opinion.proposals
+    }
+    progressive_by_name = progressive_opinion.proposals_by_name or {
+        p.correction_name: p for p in progressive_opinion.proposals
+    }
 
     proposals: list[Proposal] = []
     for c in corrections:
@@ -237,9 +261,10 @@ def run_synthesizer(
                 confidence="medium",
             ))
 
-    adopt_count = sum(1 for p in proposals if p.action == "ADOPT")
-    investigate_count = sum(1 for p in proposals if p.action == "INVESTIGATE")
-    defer_count = sum(1 for p in proposals if p.action == "DEFER")
+    counts = Counter(p.action for p in proposals)
+    adopt_count = counts["ADOPT"]
+    investigate_count = counts["INVESTIGATE"]
+    defer_count = counts["DEFER"]
 
     overall = (
         f"Synthesis: ADOPT {adopt_count}, INVESTIGATE {investigate_count}, "
@@ -291,6 +316,19 @@ def run_council(evidence: dict) -> dict:
     }
 
 
+# Small-domain fields the perspective rules compare against literals
+_INTERNED_FIELDS = ("impact_level", "predictability", "origin", "name")
+
+
+def _intern_fields(corrections: list[dict]) -> None:
+    """Intern repeated string values decoded from evidence.json in place."""
+    for c in corrections:
+        for key in _INTERNED_FIELDS:
+            value = c.get(key)
+            if isinstance(value, str):
+                c[key] = sys.intern(value)
+
+
 def main() -> None:
     """CLI entry point: council_agent <evidence.json> [output.json]."""
     if len(sys.argv) < 2:
@@ -301,14 +339,14 @@ def main() -> None:
     output_path = Path(sys.argv[2]) if len(sys.argv) > 2 else None
 
     evidence = json.loads(evidence_path.read_text(encoding="utf-8"))
+    _intern_fields(evidence.get("corrections", []))
     result = run_council(evidence)
 
-    output = json.dumps(result, indent=2)
     if output_path:
-        output_path.write_text(output, encoding="utf-8")
+        _dump_to(result, output_path)
         print(f"Council result written to {output_path}")
     else:
-        print(output)
+        print(_dumps(result))
 
 
 if __name__ == "__main__":
@@ -6,48 +6,49 @@ whether a skill should be updated.
 
 from __future__ import annotations
 
-import json
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
-import tomli
-
+from ._io import dump_to as _dump_to
+from ._io import dumps as _dumps
+from ._io import load_toml as _load_toml
+from ._io import read_md as _read_md
 from .correction_aggregator import (
     aggregate,
-    filter_by_skill,
+    filter_corrections,
     load_corrections,
-    to_json,
+    to_dict,
 )
 
 
-def _load_toml(path: Path) -> dict:
+@lru_cache(maxsize=1)
+def _skill_index(forge_root_str: str) -> dict[str, Path]:
+    """Map every skill name to its directory, scanning skills/<category>/ once."""
+    index: dict[str, Path] = {}
     try:
-        return tomli.loads(path.read_text(encoding="utf-8"))
-    except Exception:
-        return {}
-
+        with os.scandir(os.path.join(forge_root_str, "skills")) as it:
+            categories = sorted(it, key=lambda e: e.name)
+    except OSError:
+        return index
 
-def _read_md(path: Path) -> str:
-    try:
-        return path.read_text(encoding="utf-8")
-    except Exception:
-        return ""
+    for category in categories:
+        if not category.is_dir() or category.name.startswith("_"):
+            continue
+        with os.scandir(category.path) as it:
+            for skill in it:
+                if skill.is_dir() and os.path.isfile(os.path.join(skill.path, "meta.toml")):
+                    index.setdefault(skill.name, Path(skill.path))
+    return index
 
 
 def _find_skill(name: str, forge_root: Path) -> tuple[dict, Path] | None:
     """Find a skill by name across all category directories."""
-    skills_dir = forge_root / "skills"
-    if not skills_dir.is_dir():
+    skill_dir = _skill_index(str(forge_root)).get(name)
+    if skill_dir is None:
         return None
-
-    for category_dir in skills_dir.iterdir():
-        if not category_dir.is_dir() or category_dir.name.startswith("_"):
-            continue
-        skill_dir = category_dir / name
-        toml_path = skill_dir / "meta.toml"
-        if toml_path.exists():
-            return _load_toml(toml_path), skill_dir
-    return None
+    return _load_toml(skill_dir / "meta.toml"), skill_dir
 
 
 def gather_evidence(skill_name: str, forge_root: Path) -> dict:
@@ -69,7 +70,7 @@ def gather_evidence(skill_name: str, forge_root: Path) -> dict:
 
     # Load and filter corrections
     all_corrections = load_corrections(forge_root)
-    skill_corrections = filter_by_skill(all_corrections, skill_name)
+    skill_corrections = filter_corrections(all_corrections, skill=skill_name)
     stats = aggregate(skill_corrections)
 
     return {
@@ -91,11 +92,11 @@ def gather_evidence(skill_name: str, forge_root: Path) -> dict:
                 "origin": c.origin,
                 "first_observed": c.first_observed,
                 "last_observed": c.last_observed,
-                "projects": list({o.project for o in c.observations if o.project}),
+                "projects": list(c.unique_projects),
             }
             for c in stats.corrections
         ],
-        "aggregated_stats": json.loads(to_json(stats)),
+        "aggregated_stats": to_dict(stats),
     }
 
 
@@ -111,12 +112,11 @@ def main() -> None:
 
     evidence = gather_evidence(skill_name, forge_root)
 
-    output = json.dumps(evidence, indent=2)
     if output_path:
-        output_path.write_text(output, encoding="utf-8")
+        _dump_to(evidence, output_path)
         print(f"Evidence written to {output_path}")
     else:
-        print(output)
+        print(_dumps(evidence))
 
 
 if __name__ == "__main__":
@@ -6,12 +6,22 @@ and generates a CLAUDE.md file with empirically-ranked patterns.
 
 from __future__ import annotations
 
-import json
+import heapq
+import io
+import os
+import re
+import stat
 import sys
+import tempfile
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
+from typing import TYPE_CHECKING, TextIO
 
-import tomli
-
+from ._io import load_toml as _load_toml
+from ._io import loads as _loads
 from .correction_aggregator import (
     aggregate,
     filter_by_tech,
@@ -19,17 +29,58 @@ from .correction_aggregator import (
     rank_by_frequency,
 )
 
-
-def _load_toml(path: Path) -> dict:
-    try:
-        return tomli.loads(path.read_text(encoding="utf-8"))
-    except Exception:
-        return {}
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# How many skills the "Recommended Skills" section lists
+_MAX_RECOMMENDED_SKILLS = 10
+
+# package.json dependency name -> technology tag
+_NPM_TECH = {
+    "react": "react",
+    "next": "nextjs",
+    "vue": "vue",
+    "typescript": "typescript",
+    "vite": "vite",
+    "tailwindcss": "tailwind",
+    "@tanstack/react-query": "tanstack-query",
+    "@supabase/supabase-js": "supabase",
+    "zod": "zod",
+}
+
+# Normalized pyproject dependency name -> technology tag. Looked up by exact
+# name, so this path needs no multi-pattern matcher; pyahocorasick (rtg-core
+# [fast]) only serves the profile matcher, where required names are substrings.
+_PY_TECH = {
+    "fastapi": "fastapi",
+    "pydantic": "pydantic",
+    "langgraph": "langgraph",
+    "langchain": "langchain",
+    "supabase": "supabase",
+    "httpx": "httpx",
+    "django": "django",
+    "flask": "flask",
+    "langfuse": "langfuse",
+}
+
+# Leading distribution name of a PEP 508 requirement string
+_REQ_NAME_RE = re.compile(r"\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+_NAME_SEP_RE = re.compile(r"[-_.]+")
+
+
+def _requirement_names(deps: list[str]) -> set[str]:
+    """Normalized (PEP 503) distribution names of PEP 508 requirement strings."""
+    names: set[str] = set()
+    for dep in deps:
+        m = _REQ_NAME_RE.match(dep) if isinstance(dep, str) else None
+        if m:
+            names.add(_NAME_SEP_RE.sub("-", m.group(1)).lower())
+    return names
 
 
 def _read_json(path: Path) -> dict | list | None:
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return _loads(path.read_bytes())
     except Exception:
         return None
 
@@ -38,212 +89,289 @@ def detect_tech_stack(project_root: Path) -> list[str]:
     """Detect technologies used in a project by scanning config files."""
     technologies: list[str] = []
 
+    # One readdir answers every top-level existence check below
+    try:
+        with os.scandir(project_root) as it:
+            top = {entry.name: entry for entry in it}
+    except OSError:
+        top = {}
+
     # package.json
-    pkg_json = project_root / "package.json"
-    if pkg_json.exists():
-        data = _read_json(pkg_json)
+    if "package.json" in top:
+        data = _read_json(project_root / "package.json")
         if isinstance(data, dict):
             all_deps = {}
             all_deps.update(data.get("dependencies", {}))
             all_deps.update(data.get("devDependencies", {}))
 
-            dep_map = {
-                "react": "react",
-                "next": "nextjs",
-                "vue": "vue",
-                "typescript": "typescript",
-                "vite": "vite",
-                "tailwindcss": "tailwind",
-                "@tanstack/react-query": "tanstack-query",
-                "@supabase/supabase-js": "supabase",
-                "zod": "zod",
-            }
-
-            for dep, tech in dep_map.items():
+            for dep, tech in _NPM_TECH.items():
                 if dep in all_deps:
                     technologies.append(tech)
 
     # pyproject.toml
-    pyproject = project_root / "pyproject.toml"
-    if pyproject.exists():
-        data = _load_toml(pyproject)
-        deps = data.get("project", {}).get("dependencies", [])
-        dep_str = " ".join(deps).lower()
-
-        py_map = {
-            "fastapi": "fastapi",
-            "pydantic": "pydantic",
-            "langgraph": "langgraph",
-            "langchain": "langchain",
-            "supabase": "supabase",
-            "httpx": "httpx",
-            "django": "django",
-            "flask": "flask",
-            "langfuse": "langfuse",
-        }
-
-        for dep, tech in py_map.items():
-            if dep in dep_str:
-                technologies.append(tech)
+    if "pyproject.toml" in top:
+        data = _load_toml(project_root / "pyproject.toml")
+        names = _requirement_names(data.get("project", {}).get("dependencies", []))
+        # Exact name matches, so e.g. "fastapi-users" alone does not imply fastapi
+        technologies.extend(tech for dep, tech in _PY_TECH.items() if dep in names)
 
         technologies.append("python")
 
     # requirements.txt fallback
-    reqs = project_root / "requirements.txt"
-    if reqs.exists() and "python" not in technologies:
+    if "requirements.txt" in top and "python" not in technologies:
         technologies.append("python")
 
     # tsconfig.json
-    if (project_root / "tsconfig.json").exists() and "typescript" not in technologies:
+    if "tsconfig.json" in top and "typescript" not in technologies:
         technologies.append("typescript")
 
     # tailwind config
     for name in ("tailwind.config.js", "tailwind.config.ts", "tailwind.config.mjs"):
-        if (project_root / name).exists() and "tailwind" not in technologies:
+        if name in top and "tailwind" not in technologies:
             technologies.append("tailwind")
 
     # Supabase directory
-    if (project_root / "supabase").is_dir() and "supabase" not in technologies:
+    supabase_dir = top.get("supabase")
+    if supabase_dir is not None and supabase_dir.is_dir() and "supabase" not in technologies:
         technologies.append("supabase")
 
     return technologies
 
 
+def _scandir(path: str | Path) -> Iterator[os.DirEntry[str]]:
+    """Yield directory entries in filesystem order, closing the handle when done."""
+    with os.scandir(path) as it:
+        yield from it
+
+
+@dataclass(frozen=True, slots=True)
+class _SkillEntry:
+    """The meta.toml fields skill ranking needs. Shared between calls, so immutable."""
+
+    name: str
+    description: str
+    tier: str
+    category: str
+    priority_weight: int
+    tags: tuple[str, ...]
+    tag_set: frozenset[str]
+
+
+@lru_cache(maxsize=1024)
+def _skill_entry(meta_path: str, mtime_ns: int, category: str, dir_name: str) -> _SkillEntry:
+    """Parse a skill's meta.toml once per mtime, with relevance tags pre-lowered."""
+    sk = _load_toml(meta_path).get("skill", {})
+    tags = tuple(t.lower() for t in sk.get("relevance_tags", []))
+    return _SkillEntry(
+        name=sk.get("name", dir_name),
+        description=sk.get("description", ""),
+        tier=sk.get("tier", "unknown"),
+        category=category,
+        priority_weight=sk.get("priority_weight", 0),
+        tags=tags,
+        tag_set=frozenset(tags),
+    )
+
+
+def _scan_all_skills(forge_root_str: str) -> list[_SkillEntry]:
+    """List every skills/<category>/<name>/meta.toml under a forge.
+
+    Entries come back in (category, directory) order. The walk and one stat
+    per skill run on every call, so added, removed and edited skills always
+    show up; parsing is cached per file and mtime, so generating CLAUDE.md
+    for many projects against the same forge parses each meta.toml once.
+    """
+    found: list[tuple[tuple[str, str], _SkillEntry]] = []
+    try:
+        category_dirs = list(_scandir(os.path.join(forge_root_str, "skills")))
+    except OSError:
+        return []
+
+    for category_dir in category_dirs:
+        if not category_dir.is_dir() or category_dir.name.startswith("_"):
+            continue
+        for skill_dir in _scandir(category_dir.path):
+            meta_path = os.path.join(skill_dir.path, "meta.toml")
+            try:
+                st = os.stat(meta_path)
+            except OSError:
+                continue
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            entry = _skill_entry(meta_path, st.st_mtime_ns, category_dir.name, skill_dir.name)
+            found.append(((category_dir.name, skill_dir.name), entry))
+
+    found.sort(key=itemgetter(0))
+    return [skill for _, skill in found]
+
+
 def find_relevant_skills(
     technologies: list[str],
     forge_root: Path,
+    top_k: int | None = None,
 ) -> list[dict]:
-    """Find skills relevant to the detected technologies."""
-    skills_dir = forge_root / "skills"
-    if not skills_dir.is_dir():
-        return []
+    """Find skills relevant to the detected technologies.
 
-    tech_set = {t.lower() for t in technologies}
+    Results are ordered by relevance score; pass ``top_k`` to keep only the
+    best matches without sorting the whole list.
+    """
+    tech_set = frozenset(t.lower() for t in technologies)
     relevant: list[tuple[int, dict]] = []
 
-    for category_dir in sorted(skills_dir.iterdir()):
-        if not category_dir.is_dir() or category_dir.name.startswith("_"):
-            continue
-        for skill_dir in sorted(category_dir.iterdir()):
-            meta_path = skill_dir / "meta.toml"
-            if not meta_path.exists():
-                continue
-
-            data = _load_toml(meta_path)
-            sk = data.get("skill", {})
-            tags = [t.lower() for t in sk.get("relevance_tags", [])]
-
-            overlap = len(tech_set & set(tags))
-            if overlap > 0:
-                weight = sk.get("priority_weight", 0)
-                relevant.append((overlap * weight, {
-                    "name": sk.get("name", skill_dir.name),
-                    "description": sk.get("description", ""),
-                    "tier": sk.get("tier", "unknown"),
-                    "category": category_dir.name,
-                    "tags": tags,
-                }))
-
-    relevant.sort(key=lambda x: x[0], reverse=True)
+    for skill in _scan_all_skills(str(forge_root)):
+        # isdisjoint short-circuits without building a set; only skills
+        # that do match pay for the intersection.
+        if not tech_set.isdisjoint(skill.tag_set):
+            overlap = len(tech_set & skill.tag_set)
+            relevant.append((overlap * skill.priority_weight, {
+                "name": skill.name,
+                "description": skill.description,
+                "tier": skill.tier,
+                "category": skill.category,
+                "tags": list(skill.tags),
+            }))
+
+    # Both selections are stable, so equal scores keep the scan's
+    # (category, directory) order.
+    if top_k is not None:
+        return [s for _, s in heapq.nlargest(top_k, relevant, key=itemgetter(0))]
+    relevant.sort(key=itemgetter(0), reverse=True)
     return [s for _, s in relevant]
 
 
-def generate_claude_md(
+def write_claude_md(
+    out: TextIO,
     project_root: Path,
     forge_root: Path,
-) -> str:
-    """Generate CLAUDE.md content for a project.
+) -> None:
+    """Write CLAUDE.md content for a project to ``out``.
 
-    Detects tech stack, matches corrections and skills, produces
-    ranked guidance content.
+    Detects tech stack, matches corrections and skills, writes
+    ranked guidance content section by section.
     """
     technologies = detect_tech_stack(project_root)
     corrections = load_corrections(forge_root)
     relevant_corrections = filter_by_tech(corrections, technologies)
     ranked = rank_by_frequency(relevant_corrections)
-    skills = find_relevant_skills(technologies, forge_root)
+    skills = find_relevant_skills(technologies, forge_root, top_k=_MAX_RECOMMENDED_SKILLS)
 
-    lines: list[str] = []
+    def line(text: str = "") -> None:
+        out.write(text)
+        out.write("\n")
 
     # Header
-    lines.append("# CLAUDE.md")
-    lines.append("")
+    line("# CLAUDE.md")
+    line()
 
     # Project overview
-    lines.append("## Project Overview")
-    lines.append("")
+    line("## Project Overview")
+    line()
     if technologies:
-        lines.append(f"**Detected technologies:** {', '.join(technologies)}")
+        line(f"**Detected technologies:** {', '.join(technologies)}")
     else:
-        lines.append("_No technologies auto-detected. Add manually._")
-    lines.append("")
+        line("_No technologies auto-detected. Add manually._")
+    line()
 
     # Patterns Claude Gets Wrong Here
-    lines.append("## Patterns Claude Gets Wrong Here")
-    lines.append("")
+    line("## Patterns Claude Gets Wrong Here")
+    line()
     if ranked:
-        lines.append(
+        line(
             "_Ranked by observation frequency — most common mistakes first._"
         )
-        lines.append("")
+        line()
         for i, c in enumerate(ranked, 1):
-            lines.append(f"### {i}. {c.description or c.name}")
-            lines.append("")
-            lines.append(f"**Frequency:** observed {c.total_observations} time(s)")
-            lines.append(f"**Impact:** {c.impact_level} | **Predictability:** {c.predictability}")
-            lines.append("")
-            lines.append(f"**What Claude tends to do:** {c.instinct_pattern}")
-            lines.append("")
-            lines.append(f"**What to do instead:** {c.corrected_pattern}")
-            lines.append("")
-            lines.append(f"**Skill:** `{c.skill_applied}`")
-            lines.append("")
+            line(f"### {i}. {c.description or c.name}")
+            line()
+            line(f"**Frequency:** observed {c.total_observations} time(s)")
+            line(f"**Impact:** {c.impact_level} | **Predictability:** {c.predictability}")
+            line()
+            line(f"**What Claude tends to do:** {c.instinct_pattern}")
+            line()
+            line(f"**What to do instead:** {c.corrected_pattern}")
+            line()
+            line(f"**Skill:** `{c.skill_applied}`")
+            line()
     else:
-        lines.append(
+        line(
             "_No corrections recorded yet for this tech stack. "
             "Use `/capture-correction` to start building empirical data._"
         )
-        lines.append("")
+        line()
 
     # Recommended Skills
-    lines.append("## Recommended Skills")
-    lines.append("")
+    line("## Recommended Skills")
+    line()
     if skills:
-        for s in skills[:10]:
-            lines.append(f"- **{s['name']}** ({s['tier']}) — {s['description']}")
+        for s in skills:
+            line(f"- **{s['name']}** ({s['tier']}) — {s['description']}")
     else:
-        lines.append("_No matching skills found for this tech stack._")
-    lines.append("")
+        line("_No matching skills found for this tech stack._")
+    line()
 
     # Key Conventions (from corrections themes)
     if ranked:
-        all_themes: dict[str, int] = {}
+        all_themes: Counter[str] = Counter()
         for c in ranked:
             for theme in c.themes:
-                all_themes[theme] = all_themes.get(theme, 0) + c.total_observations
+                all_themes[theme] += c.total_observations
 
         if all_themes:
-            lines.append("## Key Themes")
-            lines.append("")
-            lines.append(
+            line("## Key Themes")
+            line()
+            line(
                 "_Recurring themes from correction data, ranked by frequency._"
             )
-            lines.append("")
-            for theme, count in sorted(
-                all_themes.items(), key=lambda x: x[1], reverse=True
-            ):
-                lines.append(f"- **{theme}** ({count} observation(s))")
-            lines.append("")
+            line()
+            for theme, count in all_themes.most_common():
+                line(f"- **{theme}** ({count} observation(s))")
+            line()
 
     # Footer
-    lines.append("---")
-    lines.append("")
-    lines.append(
+    line("---")
+    line()
+    out.write(
         "_Generated by RTG Forge from empirical correction data. "
         "Update with `/generate-claude-md`._"
     )
 
-    return "\n".join(lines)
+
+def generate_claude_md(
+    project_root: Path,
+    forge_root: Path,
+) -> str:
+    """Generate CLAUDE.md content for a project.
+
+    Detects tech stack, matches corrections and skills, produces
+    ranked guidance content.
+    """
+    buf = io.StringIO()
+    write_claude_md(buf, project_root, forge_root)
+    return buf.getvalue()
+
+
+def write_claude_md_file(output_path: Path, project_root: Path, forge_root: Path) -> None:
+    """Write CLAUDE.md to ``output_path``, replacing any existing file only on success.
+
+    Content streams into a temporary file in the same directory, which is
+    renamed over ``output_path`` once complete, so a failure partway leaves
+    the old file untouched.
+    """
+    try:
+        mode = stat.S_IMODE(os.stat(output_path).st_mode)
+    except FileNotFoundError:
+        mode = 0o644
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{output_path.name}.", suffix=".tmp", dir=output_path.parent
+    )
+    try:
+        with open(fd, "w", encoding="utf-8") as f:
+            write_claude_md(f, project_root, forge_root)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
 
 
 def main() -> None:
@@ -252,8 +380,7 @@ def main() -> None:
     forge_root = Path(sys.argv[2]) if len(sys.argv) > 2 else Path.cwd()
     output_path = Path(sys.argv[3]) if len(sys.argv) > 3 else project_root / "CLAUDE.md"
 
-    content = generate_claude_md(project_root, forge_root)
-    output_path.write_text(content, encoding="utf-8")
+    write_claude_md_file(output_path, project_root, forge_root)
     print(f"CLAUDE.md written to {output_path}")
 
 
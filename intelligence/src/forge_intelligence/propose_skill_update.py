@@ -6,12 +6,12 @@ that can be turned into git branches and pull requests.
 
 from __future__ import annotations
 
-import json
 import sys
 from dataclasses import dataclass
 from pathlib import Path
 
-import tomli
+from ._io import dumps as _dumps
+from ._io import loads as _loads
 
 
 @dataclass
@@ -25,20 +25,6 @@ class SkillProposal:
     summary: str
 
 
-def _load_toml(path: Path) -> dict:
-    try:
-        return tomli.loads(path.read_text(encoding="utf-8"))
-    except Exception:
-        return {}
-
-
-def _read_md(path: Path) -> str:
-    try:
-        return path.read_text(encoding="utf-8")
-    except Exception:
-        return ""
-
-
 def propose_from_council(council_result: dict, forge_root: Path) -> SkillProposal:
     """Generate a skill update proposal from council synthesis.
 
@@ -122,10 +108,10 @@ def main() -> None:
     forge_root = Path(sys.argv[2]) if len(sys.argv) > 2 else Path.cwd()
     output_path = Path(sys.argv[3]) if len(sys.argv) > 3 else None
 
-    council_result = json.loads(council_path.read_text(encoding="utf-8"))
+    council_result = _loads(council_path.read_bytes())
     proposal = propose_from_council(council_result, forge_root)
 
-    output = json.dumps(proposal_to_dict(proposal), indent=2)
+    output = _dumps(proposal_to_dict(proposal))
     if output_path:
         output_path.write_text(output, encoding="utf-8")
         print(f"Proposal written to {output_path}")
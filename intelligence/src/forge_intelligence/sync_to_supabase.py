@@ -1,39 +1,45 @@
 """Sync forge knowledge from disk (TOML + MD files) to Supabase tables.
 
 Reads all skills, modules, profiles, and decisions from the forge root
-and upserts them into the corresponding forge_* tables.
+and upserts them into the corresponding forge_* tables. A content hash of
+each entry's files is kept in .forge-sync-cache.json at the forge root, so
+entries unchanged since the last successful sync are skipped.
 
 Usage:
-    python -m forge_intelligence.sync_to_supabase [--forge-root /path/to/forge]
+    python -m forge_intelligence.sync_to_supabase [--forge-root /path/to/forge] [--full]
 """
 
 from __future__ import annotations
 
 import argparse
+import contextlib
+import hashlib
+import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import tomli
+from postgrest.types import ReturnMethod
 from supabase import Client, create_client
 
+from ._io import load_toml as _load_toml
+from ._io import read_md as _read_md
 
-def _load_toml(path: Path) -> dict:
-    try:
-        return tomli.loads(path.read_text(encoding="utf-8"))
-    except Exception:
-        return {}
-
-
-def _read_md(path: Path) -> str:
-    try:
-        return path.read_text(encoding="utf-8")
-    except Exception:
-        return ""
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
 
 
 def _get_client() -> Client:
+    """Create the one Supabase client a sync run shares across all tables.
+
+    Its PostgREST session is a single pooled httpx.Client opened with
+    http2=True, so the concurrent syncs multiplex their batched requests over
+    one TLS connection instead of handshaking per request. HTTP/2 needs the
+    h2 package, which the httpx[http2] dependency provides.
+    """
     url = os.environ.get("SUPABASE_URL", "")
     key = os.environ.get("SUPABASE_SERVICE_KEY", "")
     if not url or not key:
@@ -45,58 +51,201 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+# Rows per PostgREST request; keeps request bodies well under gateway limits.
+_BATCH_SIZE = 500
+
+# Names per id lookup; the filter travels in the URL, so keep it short.
+_LOOKUP_BATCH_SIZE = 100
+
+# Below this many manifests a thread pool costs more than it saves.
+_PARALLEL_THRESHOLD = 4
+
+
+def _batches(items: list, size: int = _BATCH_SIZE) -> Iterator[list]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _upsert_rows(client: Client, table: str, rows: list[dict]) -> None:
+    """Upsert rows on ``name`` in batched requests.
+
+    Postgres rejects a single upsert that touches the same key twice, so
+    duplicate names collapse to the last row, as sequential upserts would.
+    Rows are not echoed back; callers that need ids look them up in bulk.
+    """
+    rows = list({row["name"]: row for row in rows}.values())
+    for batch in _batches(rows):
+        client.table(table).upsert(
+            batch, on_conflict="name", returning=ReturnMethod.minimal
+        ).execute()
+
+
+def _ids_by_name(client: Client, table: str, names: list[str]) -> dict[str, str]:
+    """Look up row ids for *names* with one select per batch."""
+    ids: dict[str, str] = {}
+    for batch in _batches(names, _LOOKUP_BATCH_SIZE):
+        resp = client.table(table).select("id,name").in_("name", batch).execute()
+        ids.update((r["name"], r["id"]) for r in resp.data or [])
+    return ids
+
+
+def _load_tomls(paths: list[Path]) -> list[dict]:
+    """Load many TOML files, on a thread pool when there are enough to pay off."""
+    if len(paths) < _PARALLEL_THRESHOLD:
+        return [_load_toml(p) for p in paths]
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+        return list(pool.map(_load_toml, paths))
+
+
+# ---------------------------------------------------------------------------
+# Incremental sync cache
+# ---------------------------------------------------------------------------
+
+_SYNC_CACHE_FILE = ".forge-sync-cache.json"
+
+# Bump when the row layout changes so every entry is pushed again.
+_SYNC_CACHE_VERSION = 1
+
+
+def _load_sync_cache(forge_root: Path) -> dict[str, str]:
+    """Load the source_path -> content hash map from the last sync."""
+    try:
+        data = json.loads((forge_root / _SYNC_CACHE_FILE).read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _SYNC_CACHE_VERSION:
+        return {}
+    entries = data.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def _save_sync_cache(forge_root: Path, cache: dict[str, str]) -> None:
+    payload = {"version": _SYNC_CACHE_VERSION, "entries": dict(sorted(cache.items()))}
+    (forge_root / _SYNC_CACHE_FILE).write_text(
+        json.dumps(payload, indent=2) + "\n", encoding="utf-8"
+    )
+
+
+def _content_hash(paths: Iterable[Path]) -> str:
+    """SHA-256 over the bytes of every file that feeds a row.
+
+    Each file is framed by its name and length, so moving content between
+    files or deleting one changes the digest.
+    """
+    h = hashlib.sha256()
+    for p in paths:
+        try:
+            data = p.read_bytes()
+        except OSError:
+            h.update(b"-" + p.name.encode() + b"\0")
+            continue
+        h.update(b"+" + p.name.encode() + b"\0" + len(data).to_bytes(8, "little"))
+        h.update(data)
+    return h.hexdigest()
+
+
+def _is_unchanged(
+    cache: dict[str, str] | None, pending: dict[str, str], source_path: str, paths: Iterable[Path]
+) -> bool:
+    """Compare an entry's files against the cache; record new hashes in *pending*.
+
+    With no cache every entry counts as changed and nothing is hashed.
+    """
+    if cache is None:
+        return False
+    digest = _content_hash(paths)
+    if cache.get(source_path) == digest:
+        return True
+    pending[source_path] = digest
+    return False
+
+
+def _scandir(path: str | Path) -> Iterator[os.DirEntry[str]]:
+    """Yield directory entries in filesystem order, closing the handle when done.
+
+    Upserts key on ``name``, so the walks need no particular order, and
+    DirEntry.is_dir() reuses the file type readdir already returned, so they
+    avoid a stat per entry.
+    """
+    with os.scandir(path) as it:
+        yield from it
+
+
 # ---------------------------------------------------------------------------
 # Skills
 # ---------------------------------------------------------------------------
 
 
-def sync_skills(forge_root: Path, client: Client) -> int:
-    """Sync skills/<category>/<name>/ to forge_skills table. Returns count."""
+def sync_skills(
+    forge_root: Path,
+    client: Client,
+    cache: dict[str, str] | None = None,
+    synced_at: str | None = None,
+) -> int:
+    """Sync skills/<category>/<name>/ to forge_skills table. Returns count.
+
+    When *cache* is given, skills whose files match their cached hash are
+    skipped, and the cache is updated once the upsert succeeds.
+    """
+    synced_at = synced_at or _now_iso()
     skills_dir = forge_root / "skills"
     if not skills_dir.is_dir():
         return 0
 
-    count = 0
-    for category_dir in sorted(skills_dir.iterdir()):
+    candidates: list[tuple[str, Path, str]] = []
+    toml_paths: list[Path] = []
+    pending: dict[str, str] = {}
+    for category_dir in _scandir(skills_dir):
         if not category_dir.is_dir() or category_dir.name.startswith("_"):
             continue
-        for skill_dir in sorted(category_dir.iterdir()):
-            meta_path = skill_dir / "meta.toml"
-            if not skill_dir.is_dir() or not meta_path.exists():
+        for entry in _scandir(category_dir.path):
+            meta_path = os.path.join(entry.path, "meta.toml")
+            if not entry.is_dir() or not os.path.isfile(meta_path):
                 continue
+            skill_dir = Path(entry.path)
+            # Forge-relative path, built from the names the walk already has
+            source_path = os.path.join("skills", category_dir.name, entry.name)
+            hashed = [Path(meta_path), skill_dir / "SKILL.md"]
+            if _is_unchanged(cache, pending, source_path, hashed):
+                continue
+            candidates.append((category_dir.name, skill_dir, source_path))
+            toml_paths.append(Path(meta_path))
+
+    rows: list[dict] = []
+    for (category_name, skill_dir, source_path), data in zip(
+        candidates, _load_tomls(toml_paths), strict=True
+    ):
+        sk = data.get("skill", {})
+        rels = data.get("relationships", {})
+        tracking = data.get("tracking", {})
+        optimization = data.get("optimization", {})
+        skill_md = _read_md(skill_dir / "SKILL.md")
 
-            data = _load_toml(meta_path)
-            sk = data.get("skill", {})
-            rels = data.get("relationships", {})
-            tracking = data.get("tracking", {})
-            optimization = data.get("optimization", {})
-            skill_md = _read_md(skill_dir / "SKILL.md")
-
-            row = {
-                "name": sk.get("name", skill_dir.name),
-                "version": sk.get("version", "0.1.0"),
-                "tier": sk.get("tier", "foundation"),
-                "category": sk.get("category", category_dir.name),
-                "priority_weight": sk.get("priority_weight", 50),
-                "description": sk.get("description", ""),
-                "relevance_tags": sk.get("relevance_tags", []),
-                "prerequisites": rels.get("prerequisites", []),
-                "complements": rels.get("complements", []),
-                "supersedes": rels.get("supersedes", []),
-                "common_mistakes": tracking.get("common_mistakes", []),
-                "optimization": optimization,
-                "skill_md": skill_md,
-                "source_path": str(skill_dir.relative_to(forge_root)),
-                "synced_at": _now_iso(),
-            }
+        row = {
+            "name": sk.get("name", skill_dir.name),
+            "version": sk.get("version", "0.1.0"),
+            "tier": sk.get("tier", "foundation"),
+            "category": sk.get("category", category_name),
+            "priority_weight": sk.get("priority_weight", 50),
+            "description": sk.get("description", ""),
+            "relevance_tags": sk.get("relevance_tags", []),
+            "prerequisites": rels.get("prerequisites", []),
+            "complements": rels.get("complements", []),
+            "supersedes": rels.get("supersedes", []),
+            "common_mistakes": tracking.get("common_mistakes", []),
+            "optimization": optimization,
+            "skill_md": skill_md,
+            "source_path": source_path,
+            "synced_at": synced_at,
+        }
 
-            client.table("forge_skills").upsert(
-                row, on_conflict="name"
-            ).execute()
-            count += 1
-            print(f"  [skill] {row['name']}")
+        rows.append(row)
+        print(f"  [skill] {row['name']}")
 
-    return count
+    _upsert_rows(client, "forge_skills", rows)
+    if cache is not None:
+        cache.update(pending)
+    return len(rows)
 
 
 # ---------------------------------------------------------------------------
@@ -107,23 +256,33 @@ _SOURCE_FILES = ["__init__.py", "router.py", "service.py", "models.py", "config.
 _SOURCE_DIRS = ["graph", "migrations", "tests"]
 
 
-def _collect_source_files(mod_dir: Path) -> dict[str, str]:
-    """Read all source files into a flat {path: content} dict."""
-    files: dict[str, str] = {}
+def _source_file_paths(mod_dir: Path) -> list[tuple[str, Path]]:
+    """List a module's source files as (relative path, path) pairs."""
+    paths: list[tuple[str, Path]] = []
+    prefix_len = len(str(mod_dir)) + len(os.sep)
     for name in _SOURCE_FILES:
         p = mod_dir / name
         if p.exists():
-            files[name] = p.read_text(encoding="utf-8")
+            paths.append((name, p))
     for dir_name in _SOURCE_DIRS:
         sub = mod_dir / dir_name
         if sub.is_dir():
             for f in sorted(sub.rglob("*")):
                 if f.is_file():
-                    try:
-                        rel = str(f.relative_to(mod_dir))
-                        files[rel] = f.read_text(encoding="utf-8")
-                    except UnicodeDecodeError:
-                        pass  # Skip binary files
+                    paths.append((str(f)[prefix_len:], f))
+    return paths
+
+
+def _collect_source_files(
+    mod_dir: Path, paths: list[tuple[str, Path]] | None = None
+) -> dict[str, str]:
+    """Read all source files into a flat {path: content} dict."""
+    if paths is None:
+        paths = _source_file_paths(mod_dir)
+    files: dict[str, str] = {}
+    for rel, p in paths:
+        with contextlib.suppress(UnicodeDecodeError):  # Skip binary files
+            files[rel] = p.read_text(encoding="utf-8")
     return files
 
 
@@ -132,19 +291,37 @@ def _collect_source_files(mod_dir: Path) -> dict[str, str]:
 # ---------------------------------------------------------------------------
 
 
-def sync_modules(forge_root: Path, client: Client) -> int:
-    """Sync modules/<name>/ to forge_modules table. Returns count."""
+def sync_modules(
+    forge_root: Path,
+    client: Client,
+    cache: dict[str, str] | None = None,
+    synced_at: str | None = None,
+) -> int:
+    """Sync modules/<name>/ to forge_modules table. Returns count.
+
+    When *cache* is given, unchanged modules (manifest, MODULE.md and source
+    files) are skipped, and the cache is updated once the upsert succeeds.
+    """
+    synced_at = synced_at or _now_iso()
     modules_dir = forge_root / "modules"
     if not modules_dir.is_dir():
         return 0
 
-    count = 0
-    for mod_dir in sorted(modules_dir.iterdir()):
-        toml_path = mod_dir / "module.toml"
-        if not mod_dir.is_dir() or not toml_path.exists():
+    rows: list[dict] = []
+    pending: dict[str, str] = {}
+    for entry in _scandir(modules_dir):
+        toml_path = os.path.join(entry.path, "module.toml")
+        if not entry.is_dir() or not os.path.isfile(toml_path):
+            continue
+
+        mod_dir = Path(entry.path)
+        source_path = os.path.join("modules", entry.name)
+        source_files = _source_file_paths(mod_dir)
+        hashed = [Path(toml_path), mod_dir / "MODULE.md", *(p for _, p in source_files)]
+        if _is_unchanged(cache, pending, source_path, hashed):
             continue
 
-        data = _load_toml(toml_path)
+        data = _load_toml(Path(toml_path))
         mod = data.get("module", {})
         deps = mod.get("dependencies", {})
         api = mod.get("api", {})
@@ -182,18 +359,18 @@ def sync_modules(forge_root: Path, client: Client) -> int:
             "health_test_coverage": health.get("test_coverage", 0),
             "health_known_issues": health.get("known_issues", []),
             "module_md": module_md,
-            "source_files": _collect_source_files(mod_dir),
-            "source_path": str(mod_dir.relative_to(forge_root)),
-            "synced_at": _now_iso(),
+            "source_files": _collect_source_files(mod_dir, source_files),
+            "source_path": source_path,
+            "synced_at": synced_at,
         }
 
-        client.table("forge_modules").upsert(
-            row, on_conflict="name"
-        ).execute()
-        count += 1
+        rows.append(row)
         print(f"  [module] {row['name']}")
 
-    return count
+    _upsert_rows(client, "forge_modules", rows)
+    if cache is not None:
+        cache.update(pending)
+    return len(rows)
 
 
 # ---------------------------------------------------------------------------
@@ -201,19 +378,46 @@ def sync_modules(forge_root: Path, client: Client) -> int:
 # ---------------------------------------------------------------------------
 
 
-def sync_profiles(forge_root: Path, client: Client) -> int:
-    """Sync profiles/<name>/ to forge_profiles + forge_profile_constraints. Returns count."""
+def sync_profiles(
+    forge_root: Path,
+    client: Client,
+    cache: dict[str, str] | None = None,
+    synced_at: str | None = None,
+) -> int:
+    """Sync profiles/<name>/ to forge_profiles + forge_profile_constraints. Returns count.
+
+    When *cache* is given, profiles whose files (including constraints.toml)
+    are unchanged are skipped, and the cache is updated once both tables
+    have been written.
+    """
+    synced_at = synced_at or _now_iso()
     profiles_dir = forge_root / "profiles"
     if not profiles_dir.is_dir():
         return 0
 
-    count = 0
-    for prof_dir in sorted(profiles_dir.iterdir()):
-        profile_toml = prof_dir / "profile.toml"
-        if not prof_dir.is_dir() or not profile_toml.exists() or prof_dir.name.startswith("_"):
+    profile_rows: list[dict] = []
+    prof_dirs: list[tuple[Path, str]] = []
+    pending: dict[str, str] = {}
+    for entry in _scandir(profiles_dir):
+        if not entry.is_dir() or entry.name.startswith("_"):
+            continue
+        profile_toml = os.path.join(entry.path, "profile.toml")
+        if not os.path.isfile(profile_toml):
+            continue
+
+        prof_dir = Path(entry.path)
+        source_path = os.path.join("profiles", entry.name)
+        hashed = [
+            Path(profile_toml),
+            prof_dir / "STACK.md",
+            prof_dir / "GOTCHAS.md",
+            prof_dir / "gotchas" / "GOTCHAS.md",
+            prof_dir / "constraints.toml",
+        ]
+        if _is_unchanged(cache, pending, source_path, hashed):
             continue
 
-        data = _load_toml(profile_toml)
+        data = _load_toml(Path(profile_toml))
         prof = data.get("profile", {})
         base = data.get("base", {})
         maintainer = data.get("maintainer", {})
@@ -235,45 +439,55 @@ def sync_profiles(forge_root: Path, client: Client) -> int:
             "maintainer_last_reviewed": maintainer.get("last_reviewed", ""),
             "stack_md": stack_md,
             "gotchas_md": gotchas_md,
-            "source_path": str(prof_dir.relative_to(forge_root)),
-            "synced_at": _now_iso(),
+            "source_path": source_path,
+            "synced_at": synced_at,
         }
 
-        resp = client.table("forge_profiles").upsert(
-            profile_row, on_conflict="name"
-        ).execute()
-
-        # Get the profile ID for constraints
-        profile_id = resp.data[0]["id"] if resp.data else None
-
-        if profile_id:
-            # Sync constraints
-            constraints_data = _load_toml(prof_dir / "constraints.toml")
-            constraints = constraints_data.get("constraints", {})
-            if constraints:
-                constraint_row = {
-                    "profile_id": profile_id,
-                    "description": constraints.get("description", ""),
-                    "required": constraints.get("required", {}),
-                    "allowed": constraints.get("allowed", {}),
-                    "forbidden": constraints.get("forbidden", {}),
-                    "overrides": constraints.get("overrides", {}),
-                    "source_path": str((prof_dir / "constraints.toml").relative_to(forge_root)),
-                    "synced_at": _now_iso(),
-                }
-
-                # Upsert by profile_id — delete existing and insert fresh
-                client.table("forge_profile_constraints").delete().eq(
-                    "profile_id", profile_id
-                ).execute()
-                client.table("forge_profile_constraints").insert(
-                    constraint_row
-                ).execute()
-
-        count += 1
+        profile_rows.append(profile_row)
+        prof_dirs.append((prof_dir, source_path))
         print(f"  [profile] {profile_row['name']}")
 
-    return count
+    _upsert_rows(client, "forge_profiles", profile_rows)
+    if not profile_rows:
+        return 0
+
+    # Get the profile IDs for constraints
+    id_by_name = _ids_by_name(
+        client, "forge_profiles", list(dict.fromkeys(r["name"] for r in profile_rows))
+    )
+
+    constraint_rows: list[dict] = []
+    for profile_row, (prof_dir, source_path) in zip(profile_rows, prof_dirs, strict=True):
+        profile_id = id_by_name.get(profile_row["name"])
+        if not profile_id:
+            continue
+
+        constraints_data = _load_toml(prof_dir / "constraints.toml")
+        constraints = constraints_data.get("constraints", {})
+        if constraints:
+            constraint_rows.append({
+                "profile_id": profile_id,
+                "description": constraints.get("description", ""),
+                "required": constraints.get("required", {}),
+                "allowed": constraints.get("allowed", {}),
+                "forbidden": constraints.get("forbidden", {}),
+                "overrides": constraints.get("overrides", {}),
+                "source_path": os.path.join(source_path, "constraints.toml"),
+                "synced_at": synced_at,
+            })
+
+    # Upsert by profile_id — delete existing and insert fresh
+    for batch in _batches(constraint_rows):
+        client.table("forge_profile_constraints").delete(returning=ReturnMethod.minimal).in_(
+            "profile_id", [r["profile_id"] for r in batch]
+        ).execute()
+        client.table("forge_profile_constraints").insert(
+            batch, returning=ReturnMethod.minimal
+        ).execute()
+
+    if cache is not None:
+        cache.update(pending)
+    return len(profile_rows)
 
 
 # ---------------------------------------------------------------------------
@@ -281,72 +495,94 @@ def sync_profiles(forge_root: Path, client: Client) -> int:
 # ---------------------------------------------------------------------------
 
 
-def sync_decisions(forge_root: Path, client: Client) -> int:
-    """Sync decisions/<category>/<name>/ to forge_decisions table. Returns count."""
+def sync_decisions(
+    forge_root: Path,
+    client: Client,
+    cache: dict[str, str] | None = None,
+    synced_at: str | None = None,
+) -> int:
+    """Sync decisions/<category>/<name>/ to forge_decisions table. Returns count.
+
+    When *cache* is given, decisions whose files match their cached hash are
+    skipped, and the cache is updated once the upsert succeeds.
+    """
+    synced_at = synced_at or _now_iso()
     decisions_dir = forge_root / "decisions"
     if not decisions_dir.is_dir():
         return 0
 
-    count = 0
-    for category_dir in sorted(decisions_dir.iterdir()):
+    candidates: list[tuple[str, Path, str]] = []
+    toml_paths: list[Path] = []
+    pending: dict[str, str] = {}
+    for category_dir in _scandir(decisions_dir):
         if not category_dir.is_dir() or category_dir.name.startswith(("_", ".")):
             continue
-        for decision_dir in sorted(category_dir.iterdir()):
-            toml_path = decision_dir / "decision.toml"
-            if not decision_dir.is_dir() or not toml_path.exists():
+        for entry in _scandir(category_dir.path):
+            toml_path = os.path.join(entry.path, "decision.toml")
+            if not entry.is_dir() or not os.path.isfile(toml_path):
+                continue
+            decision_dir = Path(entry.path)
+            source_path = os.path.join("decisions", category_dir.name, entry.name)
+            hashed = [Path(toml_path), decision_dir / "DECISION.md"]
+            if _is_unchanged(cache, pending, source_path, hashed):
                 continue
+            candidates.append((category_dir.name, decision_dir, source_path))
+            toml_paths.append(Path(toml_path))
+
+    rows: list[dict] = []
+    for (category_name, decision_dir, source_path), data in zip(
+        candidates, _load_tomls(toml_paths), strict=True
+    ):
+        dec = data.get("decision", {})
+        ctx = dec.get("context", {})
+        choice = dec.get("choice", {})
+        evidence = dec.get("evidence", {})
+        correction = data.get("correction", {})
+        freq = correction.get("frequency", {})
+        classification = correction.get("classification", {})
+        decision_md = _read_md(decision_dir / "DECISION.md")
 
-            data = _load_toml(toml_path)
-            dec = data.get("decision", {})
-            ctx = dec.get("context", {})
-            choice = dec.get("choice", {})
-            evidence = dec.get("evidence", {})
-            correction = data.get("correction", {})
-            freq = correction.get("frequency", {})
-            classification = correction.get("classification", {})
-            decision_md = _read_md(decision_dir / "DECISION.md")
-
-            row = {
-                "name": dec.get("name", decision_dir.name),
-                "version": dec.get("version", "0.1.0"),
-                "type": dec.get("type", "correction"),
-                "status": dec.get("status", "active"),
-                "severity": dec.get("severity", "structural"),
-                "description": dec.get("description", ""),
-                "created_date": dec.get("created", ""),
-                "last_observed": dec.get("last_observed", ""),
-                "category": category_dir.name,
-                "context_applies_to": ctx.get("applies_to", []),
-                "context_profiles": ctx.get("profiles", ["rtg-default"]),
-                "context_trigger": ctx.get("trigger", ""),
-                "choice_chosen": choice.get("chosen", ""),
-                "choice_rejected": choice.get("rejected", []),
-                "evidence_skills": evidence.get("skills", []),
-                "evidence_modules": evidence.get("modules", []),
-                "evidence_related_decisions": evidence.get("related_decisions", []),
-                "correction_skill_applied": correction.get("skill_applied"),
-                "correction_instinct_pattern": correction.get("instinct_pattern"),
-                "correction_corrected_pattern": correction.get("corrected_pattern"),
-                "correction_impact_level": correction.get("impact_level"),
-                "correction_total_observations": freq.get("total_observations", 0),
-                "correction_first_observed": freq.get("first_observed"),
-                "correction_last_observed": freq.get("last_observed"),
-                "correction_observations": freq.get("observations", []),
-                "correction_themes": classification.get("themes", []),
-                "correction_origin": classification.get("origin"),
-                "correction_predictability": classification.get("predictability"),
-                "decision_md": decision_md,
-                "source_path": str(decision_dir.relative_to(forge_root)),
-                "synced_at": _now_iso(),
-            }
+        row = {
+            "name": dec.get("name", decision_dir.name),
+            "version": dec.get("version", "0.1.0"),
+            "type": dec.get("type", "correction"),
+            "status": dec.get("status", "active"),
+            "severity": dec.get("severity", "structural"),
+            "description": dec.get("description", ""),
+            "created_date": dec.get("created", ""),
+            "last_observed": dec.get("last_observed", ""),
+            "category": category_name,
+            "context_applies_to": ctx.get("applies_to", []),
+            "context_profiles": ctx.get("profiles", ["rtg-default"]),
+            "context_trigger": ctx.get("trigger", ""),
+            "choice_chosen": choice.get("chosen", ""),
+            "choice_rejected": choice.get("rejected", []),
+            "evidence_skills": evidence.get("skills", []),
+            "evidence_modules": evidence.get("modules", []),
+            "evidence_related_decisions": evidence.get("related_decisions", []),
+            "correction_skill_applied": correction.get("skill_applied"),
+            "correction_instinct_pattern": correction.get("instinct_pattern"),
+            "correction_corrected_pattern": correction.get("corrected_pattern"),
+            "correction_impact_level": correction.get("impact_level"),
+            "correction_total_observations": freq.get("total_observations", 0),
+            "correction_first_observed": freq.get("first_observed"),
+            "correction_last_observed": freq.get("last_observed"),
+            "correction_observations": freq.get("observations", []),
+            "correction_themes": classification.get("themes", []),
+            "correction_origin": classification.get("origin"),
+            "correction_predictability": classification.get("predictability"),
+            "decision_md": decision_md,
+            "source_path": source_path,
+            "synced_at": synced_at,
+        }
 
-            client.table("forge_decisions").upsert(
-                row, on_conflict="name"
-            ).execute()
-            count += 1
-            print(f"  [decision] {row['name']} ({category_dir.name})")
+        rows.append(row)
+        print(f"  [decision] {row['name']} ({category_name})")
 
-    return count
+    _upsert_rows(client, "forge_decisions", rows)
+    if cache is not None:
+        cache.update(pending)
+    return len(rows)
 
 
 # ---------------------------------------------------------------------------
@@ -354,16 +590,36 @@ def sync_decisions(forge_root: Path, client: Client) -> int:
 # ---------------------------------------------------------------------------
 
 
-def sync_all(forge_root: Path) -> dict[str, int]:
-    """Run full sync from disk to Supabase. Returns counts per entity type."""
+def sync_all(forge_root: Path, *, full: bool = False) -> dict[str, int]:
+    """Run sync from disk to Supabase. Returns counts of entries pushed per type.
+
+    Entries unchanged since the last sync are skipped unless *full* is set.
+    """
     client = _get_client()
     print(f"Syncing forge knowledge from {forge_root} to Supabase...\n")
-
-    counts = {}
-    counts["skills"] = sync_skills(forge_root, client)
-    counts["modules"] = sync_modules(forge_root, client)
-    counts["profiles"] = sync_profiles(forge_root, client)
-    counts["decisions"] = sync_decisions(forge_root, client)
+    cache = {} if full else _load_sync_cache(forge_root)
+    # One timestamp for the whole run, so every row it writes shares synced_at.
+    synced_at = _now_iso()
+
+    # Each entity type writes to its own tables, so the syncs overlap their
+    # network round-trips on a shared client.
+    syncs = {
+        "skills": sync_skills,
+        "modules": sync_modules,
+        "profiles": sync_profiles,
+        "decisions": sync_decisions,
+    }
+    # Each sync only adds its own source paths to the cache after its writes
+    # succeed, so the file is saved even when another entity type fails.
+    try:
+        with ThreadPoolExecutor(max_workers=len(syncs)) as pool:
+            futures = {
+                name: pool.submit(fn, forge_root, client, cache, synced_at)
+                for name, fn in syncs.items()
+            }
+            counts = {name: future.result() for name, future in futures.items()}
+    finally:
+        _save_sync_cache(forge_root, cache)
 
     print(f"\nSync complete: {counts}")
     return counts
@@ -385,6 +641,11 @@ def _resolve_forge_root(path: str | None) -> Path:
 def main() -> None:
     parser = argparse.ArgumentParser(description="Sync forge knowledge to Supabase")
     parser.add_argument("--forge-root", help="Path to forge root directory")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help=f"Ignore {_SYNC_CACHE_FILE} and push every entry",
+    )
     args = parser.parse_args()
 
     forge_root = _resolve_forge_root(args.forge_root)
@@ -392,7 +653,7 @@ def main() -> None:
         print(f"Error: forge.toml not found in {forge_root}", file=sys.stderr)
         sys.exit(1)
 
-    sync_all(forge_root)
+    sync_all(forge_root, full=args.full)
 
 
 if __name__ == "__main__":
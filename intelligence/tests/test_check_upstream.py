@@ -0,0 +1,86 @@
+"""Tests for the upstream checker's registry cache modes."""
+
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from forge_intelligence import check_upstream
+
+
+@pytest.fixture
+def forge_root(tmp_path: Path) -> Path:
+    """Forge with two skills: one tagged fastapi + react, one tagged pydantic."""
+    root = tmp_path / "forge"
+    for name, tags in (("api-patterns", '["fastapi", "react"]'), ("models", '["pydantic"]')):
+        skill_dir = root / "skills" / "stack" / name
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "meta.toml").write_text(
+            f'[skill]\nname = "{name}"\nrelevance_tags = {tags}\n'
+        )
+    return root
+
+
+@pytest.fixture
+def registry(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Serve every registry lookup as version 9.9.9; returns the URLs requested."""
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        if "pypi.org" in request.url.host:
+            return httpx.Response(200, json={"info": {"version": "9.9.9"}})
+        return httpx.Response(200, json={"version": "9.9.9"})
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        check_upstream.httpx,
+        "AsyncClient",
+        lambda **kw: real_client(transport=httpx.MockTransport(handler), **kw),
+    )
+    monkeypatch.setattr(check_upstream, "_version_cache", {})
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    return requested
+
+
+def _seed_disk_cache(registry: str, package: str, version: str) -> Path:
+    path = check_upstream._disk_cache_path(registry, package)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # fetched_at 0: far older than the normal-mode TTL
+    path.write_text(json.dumps({"version": version, "fetched_at": 0}))
+    return path
+
+
+def test_replay_uses_cached_entries_of_any_age(forge_root, registry, monkeypatch):
+    monkeypatch.setenv("RTG_UPSTREAM_CACHE_MODE", "replay")
+    _seed_disk_cache("pypi", "fastapi", "0.1.0")
+    _seed_disk_cache("npm", "react", "18.0.0")
+
+    result = check_upstream.check_skill_upstream("api-patterns", forge_root)
+    assert result["upstream_versions"] == {"pypi:fastapi": "0.1.0", "npm:react": "18.0.0"}
+    assert "upstream_errors" not in result
+    assert registry == []
+
+
+def test_replay_miss_is_reported_per_package(forge_root, registry, monkeypatch):
+    monkeypatch.setenv("RTG_UPSTREAM_CACHE_MODE", "replay")
+    _seed_disk_cache("pypi", "fastapi", "0.1.0")
+    _seed_disk_cache("pypi", "pydantic", "2.0.0")
+
+    results = {r["skill_name"]: r for r in check_upstream.check_all_skills(forge_root)}
+    assert results["api-patterns"]["upstream_versions"] == {"pypi:fastapi": "0.1.0"}
+    assert results["api-patterns"]["upstream_errors"] == {"npm:react": "not cached"}
+    assert results["models"]["upstream_versions"] == {"pypi:pydantic": "2.0.0"}
+    assert registry == []
+
+
+def test_disabled_ignores_and_leaves_disk_cache(forge_root, registry, monkeypatch):
+    monkeypatch.setenv("RTG_UPSTREAM_CACHE_MODE", "disabled")
+    cached = _seed_disk_cache("pypi", "pydantic", "2.0.0")
+
+    result = check_upstream.check_skill_upstream("models", forge_root)
+    assert result["upstream_versions"] == {"pypi:pydantic": "9.9.9"}
+    assert len(registry) == 1
+    assert json.loads(cached.read_text())["version"] == "2.0.0"
+    assert not check_upstream._disk_cache_path("npm", "react").exists()
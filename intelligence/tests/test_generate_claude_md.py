@@ -0,0 +1,80 @@
+"""Tests for skill matching in the CLAUDE.md generator."""
+
+import dataclasses
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from forge_intelligence import generate_claude_md
+from forge_intelligence.generate_claude_md import _scan_all_skills, find_relevant_skills
+
+
+def _write_skill(root: Path, category: str, name: str, tags: list[str], weight: int = 50) -> Path:
+    skill_dir = root / "skills" / category / name
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    meta = skill_dir / "meta.toml"
+    meta.write_text(
+        f'[skill]\nname = "{name}"\ntier = "foundation"\n'
+        f"priority_weight = {weight}\nrelevance_tags = {json.dumps(tags)}\n"
+    )
+    return meta
+
+
+@pytest.fixture
+def forge_root(tmp_path: Path) -> Path:
+    _write_skill(tmp_path, "stack", "fastapi-patterns", ["Python", "FastAPI"], weight=80)
+    _write_skill(tmp_path, "practices", "testing", ["python"], weight=40)
+    return tmp_path
+
+
+def _names(skills: list[dict]) -> list[str]:
+    return [s["name"] for s in skills]
+
+
+def test_find_relevant_skills_ranks_by_overlap_and_weight(forge_root: Path) -> None:
+    skills = find_relevant_skills(["python", "fastapi"], forge_root)
+    assert _names(skills) == ["fastapi-patterns", "testing"]
+    assert skills[0]["tags"] == ["python", "fastapi"]
+
+
+def test_edited_and_added_skills_are_picked_up(forge_root: Path) -> None:
+    assert _names(find_relevant_skills(["react"], forge_root)) == []
+
+    meta = _write_skill(forge_root, "practices", "testing", ["react"])
+    st = os.stat(meta)
+    # Make sure the edit lands on a new mtime even on coarse-grained filesystems
+    os.utime(meta, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    _write_skill(forge_root, "stack", "react-patterns", ["react"], weight=90)
+
+    assert _names(find_relevant_skills(["react"], forge_root)) == ["react-patterns", "testing"]
+
+
+def test_scanned_entries_are_read_only(forge_root: Path) -> None:
+    entry = _scan_all_skills(str(forge_root))[0]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        entry.priority_weight = 0
+
+
+def test_failed_generation_keeps_existing_file(
+    forge_root: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    output = tmp_path / "CLAUDE.md"
+    output.write_text("# Hand-edited\n")
+
+    def fail(*args: object, **kwargs: object) -> list:
+        raise RuntimeError("unreadable skill")
+
+    monkeypatch.setattr(generate_claude_md, "find_relevant_skills", fail)
+    with pytest.raises(RuntimeError):
+        generate_claude_md.write_claude_md_file(output, tmp_path, forge_root)
+    assert output.read_text() == "# Hand-edited\n"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["CLAUDE.md", "skills"]
+
+
+def test_generated_file_replaces_existing(forge_root: Path, tmp_path: Path) -> None:
+    output = tmp_path / "CLAUDE.md"
+    output.write_text("# Old\n")
+    generate_claude_md.write_claude_md_file(output, tmp_path, forge_root)
+    assert output.read_text().startswith("# CLAUDE.md\n")
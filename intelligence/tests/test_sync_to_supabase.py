@@ -0,0 +1,185 @@
+"""Tests for the disk -> Supabase sync, run against an in-memory fake client."""
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from forge_intelligence import sync_to_supabase as sync
+
+
+class _Response:
+    def __init__(self, data: list[dict]) -> None:
+        self.data = data
+
+
+class _Query:
+    def __init__(self, client: "FakeClient", table: str) -> None:
+        self._client = client
+        self._table = table
+        self._op = ""
+        self._payload: list[dict] = []
+        self._in: tuple[str, list] | None = None
+
+    def upsert(self, rows, *, on_conflict="", returning=None):
+        self._op, self._payload = "upsert", rows
+        return self
+
+    def insert(self, rows, *, returning=None):
+        self._op, self._payload = "insert", rows
+        return self
+
+    def delete(self, *, returning=None):
+        self._op = "delete"
+        return self
+
+    def select(self, columns):
+        self._op = "select"
+        return self
+
+    def in_(self, column, values):
+        self._in = (column, list(values))
+        return self
+
+    def execute(self) -> _Response:
+        return self._client._execute(self)
+
+
+class FakeClient:
+    """Records every request and keeps upserted rows keyed by name."""
+
+    def __init__(self, fail_tables: frozenset[str] = frozenset()) -> None:
+        self.fail_tables = fail_tables
+        self.rows: dict[str, dict[str, dict]] = {}
+        self.calls: list[tuple[str, str, int]] = []
+        self._lock = threading.Lock()
+
+    def table(self, name: str) -> _Query:
+        return _Query(self, name)
+
+    def _execute(self, q: _Query) -> _Response:
+        with self._lock:
+            self.calls.append((q._table, q._op, len(q._payload)))
+            table = self.rows.setdefault(q._table, {})
+            if q._op == "upsert":
+                if q._table in self.fail_tables:
+                    raise RuntimeError(f"upsert into {q._table} failed")
+                for row in q._payload:
+                    table[row["name"]] = {"id": f"{q._table}:{row['name']}", **row}
+            elif q._op == "insert":
+                for row in q._payload:
+                    table[str(len(table))] = row
+            elif q._op == "select":
+                column, values = q._in
+                return _Response([r for r in table.values() if r.get(column) in values])
+            return _Response([])
+
+    def upserted(self, table: str) -> int:
+        """Rows sent to table's upsert requests so far."""
+        return sum(n for t, op, n in self.calls if t == table and op == "upsert")
+
+
+@pytest.fixture
+def forge_root(tmp_path: Path) -> Path:
+    root = tmp_path / "forge"
+    root.mkdir()
+    (root / "forge.toml").write_text('[forge]\nname = "test-forge"\n')
+    for category, name in (("stack", "python-patterns"), ("core", "testing")):
+        skill = root / "skills" / category / name
+        skill.mkdir(parents=True)
+        (skill / "meta.toml").write_text(f'[skill]\nname = "{name}"\n')
+        (skill / "SKILL.md").write_text(f"# {name}\n")
+    module = root / "modules" / "enrichment"
+    module.mkdir(parents=True)
+    (module / "module.toml").write_text('[module]\nname = "enrichment"\n')
+    (module / "service.py").write_text("VALUE = 1\n")
+    profile = root / "profiles" / "rtg-default"
+    profile.mkdir(parents=True)
+    (profile / "profile.toml").write_text('[profile]\nname = "rtg-default"\n')
+    (profile / "constraints.toml").write_text('[constraints]\ndescription = "Defaults"\n')
+    decision = root / "decisions" / "corrections" / "use-httpx"
+    decision.mkdir(parents=True)
+    (decision / "decision.toml").write_text('[decision]\nname = "use-httpx"\n')
+    return root
+
+
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch) -> FakeClient:
+    fake = FakeClient()
+    monkeypatch.setattr(sync, "_get_client", lambda: fake)
+    return fake
+
+
+def _cached_paths(forge_root: Path) -> set[str]:
+    data = json.loads((forge_root / sync._SYNC_CACHE_FILE).read_text())
+    return set(data["entries"])
+
+
+class TestBatching:
+    def test_upsert_rows_batches_and_dedupes_names(self) -> None:
+        fake = FakeClient()
+        rows = [{"name": f"row-{i}", "v": 0} for i in range(1201)]
+        rows.append({"name": "row-0", "v": 1})
+        sync._upsert_rows(fake, "forge_skills", rows)
+        assert [n for _, _, n in fake.calls] == [500, 500, 201]
+        assert fake.rows["forge_skills"]["row-0"]["v"] == 1
+
+    def test_ids_by_name_batches_lookups(self) -> None:
+        fake = FakeClient()
+        sync._upsert_rows(fake, "forge_profiles", [{"name": f"p{i}"} for i in range(250)])
+        fake.calls.clear()
+        ids = sync._ids_by_name(fake, "forge_profiles", [f"p{i}" for i in range(250)])
+        assert len(ids) == 250
+        assert [op for _, op, _ in fake.calls] == ["select"] * 3
+
+
+class TestIncrementalSync:
+    def test_first_sync_pushes_everything_concurrently(self, forge_root, client) -> None:
+        counts = sync.sync_all(forge_root)
+        assert counts == {"skills": 2, "modules": 1, "profiles": 1, "decisions": 1}
+        synced_at = {
+            row["synced_at"] for table in client.rows.values() for row in table.values()
+        }
+        assert len(synced_at) == 1
+        assert len(client.rows["forge_profile_constraints"]) == 1
+        assert _cached_paths(forge_root) == {
+            "skills/stack/python-patterns",
+            "skills/core/testing",
+            "modules/enrichment",
+            "profiles/rtg-default",
+            "decisions/corrections/use-httpx",
+        }
+
+    def test_unchanged_entries_are_skipped(self, forge_root, client) -> None:
+        sync.sync_all(forge_root)
+        client.calls.clear()
+        counts = sync.sync_all(forge_root)
+        assert counts == {"skills": 0, "modules": 0, "profiles": 0, "decisions": 0}
+        assert client.upserted("forge_skills") == 0
+
+    def test_changed_entry_is_pushed_again(self, forge_root, client) -> None:
+        sync.sync_all(forge_root)
+        (forge_root / "skills" / "core" / "testing" / "SKILL.md").write_text("# edited\n")
+        (forge_root / "modules" / "enrichment" / "service.py").write_text("VALUE = 2\n")
+        client.calls.clear()
+        counts = sync.sync_all(forge_root)
+        assert counts == {"skills": 1, "modules": 1, "profiles": 0, "decisions": 0}
+        assert client.rows["forge_skills"]["testing"]["skill_md"] == "# edited\n"
+
+    def test_full_ignores_cache(self, forge_root, client) -> None:
+        sync.sync_all(forge_root)
+        counts = sync.sync_all(forge_root, full=True)
+        assert counts == {"skills": 2, "modules": 1, "profiles": 1, "decisions": 1}
+
+    def test_failed_upsert_does_not_cache_its_entries(self, forge_root, client) -> None:
+        client.fail_tables = frozenset({"forge_skills"})
+        with pytest.raises(RuntimeError, match="forge_skills"):
+            sync.sync_all(forge_root)
+        cached = _cached_paths(forge_root)
+        assert not any(path.startswith("skills/") for path in cached)
+        assert "modules/enrichment" in cached
+
+        client.fail_tables = frozenset()
+        counts = sync.sync_all(forge_root)
+        assert counts == {"skills": 2, "modules": 0, "profiles": 0, "decisions": 0}
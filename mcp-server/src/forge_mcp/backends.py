@@ -9,15 +9,41 @@ Select via FORGE_BACKEND env var: "file" (default) or "supabase".
 
 from __future__ import annotations
 
+import functools
 import os
+import pickle
 import re
+import threading
+import time
+import tomllib
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
+from typing import Any
 
-import tomli
 import tomli_w
 
+# Prefer the Rust-backed rtoml parser when installed (forge-mcp[fast]); it
+# reads and parses the file without a Python-side decode.
+try:
+    import rtoml
+
+    def _parse_toml_file(path: Path) -> dict:
+        return rtoml.load(path)
+except ImportError:
+    def _parse_toml_file(path: Path) -> dict:
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+
+# Likewise orjson for decoding Supabase scan results.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 
 # ---------------------------------------------------------------------------
 # Abstract base
@@ -40,6 +66,13 @@ class ForgeBackend(ABC):
     @abstractmethod
     def get_module_sources(self, name: str) -> dict[str, str]: ...
 
+    def find_module_with_md(self, name: str) -> tuple[dict, str, str] | None:
+        """find_module plus MODULE.md; backends override to read both at once."""
+        result = self.find_module(name)
+        if result is None:
+            return None
+        return *result, self.get_module_md(name)
+
     # -- Skills --
     @abstractmethod
     def scan_skills(self) -> list[dict]: ...
@@ -50,6 +83,13 @@ class ForgeBackend(ABC):
     @abstractmethod
     def get_skill_md(self, name: str) -> str: ...
 
+    def find_skill_with_md(self, name: str) -> tuple[dict, str, str] | None:
+        """find_skill plus SKILL.md; backends override to read both at once."""
+        result = self.find_skill(name)
+        if result is None:
+            return None
+        return *result, self.get_skill_md(name)
+
     # -- Profiles --
     @abstractmethod
     def scan_profiles(self) -> list[dict]: ...
@@ -76,9 +116,20 @@ class ForgeBackend(ABC):
     @abstractmethod
     def get_decision_md(self, name: str) -> str: ...
 
+    def find_decision_with_md(self, name: str) -> tuple[dict, str, str] | None:
+        """find_decision plus DECISION.md; backends override to read both at once."""
+        result = self.find_decision(name)
+        if result is None:
+            return None
+        return *result, self.get_decision_md(name)
+
     @abstractmethod
     def record_correction(self, data: dict) -> str: ...
 
+    def record_corrections(self, items: list[dict]) -> list[str]:
+        """record_correction for each item in order; backends may batch the writes."""
+        return [self.record_correction(data) for data in items]
+
     # -- Validation --
     @abstractmethod
     def validate_module_files(self, name: str) -> dict | None: ...
@@ -91,21 +142,32 @@ class ForgeBackend(ABC):
 
 def _get_forge_root() -> Path:
     """Return the forge root directory."""
-    env_root = os.environ.get("FORGE_ROOT")
+    return _resolve_forge_root(os.environ.get("FORGE_ROOT"), os.getcwd())
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_forge_root(env_root: str | None, cwd: str) -> Path:
+    """FORGE_ROOT if set, else the nearest ancestor of cwd holding forge.toml.
+
+    Cached per (FORGE_ROOT, cwd), so only the first backend pays for the walk.
+    """
     if env_root:
         return Path(env_root)
 
-    current = Path.cwd()
-    for parent in [current, *current.parents]:
-        if (parent / "forge.toml").exists():
-            return parent
-    return current
+    current = cwd
+    while True:
+        if os.path.exists(os.path.join(current, "forge.toml")):
+            return Path(current)
+        parent = os.path.dirname(current)
+        if parent == current:
+            return Path(cwd)
+        current = parent
 
 
 def _load_toml(path: Path) -> dict:
     """Load and parse a TOML file. Returns empty dict on failure."""
     try:
-        return tomli.loads(path.read_text(encoding="utf-8"))
+        return _parse_toml_file(path)
     except Exception:
         return {}
 
@@ -118,33 +180,324 @@ def _read_md(path: Path) -> str:
         return ""
 
 
+# Characters a slug drops outright. \w matches exactly the characters
+# str.isalnum() accepts, plus "_"; only needed once text leaves ASCII.
+_SLUG_DROP_RE = re.compile(r"[^\w \-]+")
+# ASCII in one str.translate pass: punctuation dropped, space and "_" to "-".
+_SLUG_TABLE = {i: None for i in range(128) if not (chr(i).isalnum() or chr(i) in " _-")}
+_SLUG_TABLE.update({ord(" "): "-", ord("_"): "-"})
+_SLUG_RUN_RE = re.compile(r"-{2,}")
+
+
+def _slugify(text: str) -> str:
+    """Slug for a correction's decision name from the first 60 characters of text.
+
+    Keeps alphanumerics (including non-ASCII), turns each run of spaces,
+    underscores and hyphens into one hyphen, and drops everything else.
+    """
+    slug = text.lower()[:60]
+    if not slug.isascii():
+        slug = _SLUG_DROP_RE.sub("", slug)
+    return _SLUG_RUN_RE.sub("-", slug.translate(_SLUG_TABLE)).strip("-")
+
+
+# Below this many cache misses a thread pool costs more than it saves.
+_PARALLEL_THRESHOLD = 4
+
+
+_CORRECTION_MD_TEMPLATE = """\
+# Decision: {decision_name}
+
+## Summary
+
+Claude's default instinct is to {instinct_pattern}. \
+The skill `{skill_name}` corrects this to {corrected_pattern}.
+
+## Context
+
+{context}
+
+## Instinct Pattern (Before)
+
+{instinct_pattern}
+
+## Corrected Pattern (After)
+
+{corrected_pattern}
+
+## Reasoning
+
+The corrected pattern follows the guidelines established in the `{skill_name}` skill. \
+The instinct pattern was identified as a {origin} \
+that impacts code at the {impact_level} level.
+
+## Observations
+
+| Date | Project | File | Notes |
+|------|---------|------|-------|
+| {today} | {project} | {file} | Initial observation |
+"""
+
+
+def _render_correction_md(
+    *,
+    decision_name: str,
+    skill_name: str,
+    instinct_pattern: str,
+    corrected_pattern: str,
+    context: str,
+    project: str,
+    file: str,
+    origin: str,
+    impact_level: str,
+    today: str,
+) -> str:
+    """Fill the DECISION.md template for a newly recorded correction."""
+    return _CORRECTION_MD_TEMPLATE.format_map({
+        "decision_name": decision_name,
+        "skill_name": skill_name,
+        "instinct_pattern": instinct_pattern,
+        "corrected_pattern": corrected_pattern,
+        "context": context or f"Observed while working on {project or 'a project'}.",
+        "origin": origin.replace("-", " "),
+        "impact_level": impact_level,
+        "today": today,
+        "project": project or "unknown",
+        "file": file or "unknown",
+    })
+
+
+def _correction_name(data: dict) -> str:
+    """Decision name a correction is recorded under: its slugified instinct."""
+    return _slugify(data["instinct_pattern"]) or data["skill_name"]
+
+
+def _observation(data: dict, today: str) -> dict:
+    return {"date": today, "project": data.get("project", ""), "file": data.get("file", "")}
+
+
+def _build_correction_payload(
+    data: dict, decision_name: str, today: str, applies_to: list[str]
+) -> tuple[dict, str]:
+    """Build a new correction from record_correction tool args.
+
+    Returns (decision.toml record, DECISION.md content); the backends differ
+    only in how they persist them. Callers already hold decision_name from
+    their existence check and compute today once, so neither is redone here.
+    """
+    skill_name = data["skill_name"]
+    instinct_pattern = data["instinct_pattern"]
+    corrected_pattern = data["corrected_pattern"]
+    impact_level = data.get("impact_level", "structural")
+    project = data.get("project", "")
+    file = data.get("file", "")
+    severity = data.get("severity", "") or impact_level
+    themes = data.get("themes", "")
+    origin = data.get("origin", "model-instinct")
+    theme_list = [t.strip() for t in themes.split(",") if t.strip()] if themes else []
+
+    record = {
+        "decision": {
+            "name": decision_name,
+            "version": "0.1.0",
+            "type": "correction",
+            "status": "active",
+            "severity": severity,
+            "description": f"Correction: {instinct_pattern[:80]}",
+            "created": today,
+            "last_observed": today,
+            "context": {
+                "applies_to": applies_to,
+                "profiles": ["rtg-default"],
+                "trigger": instinct_pattern,
+            },
+            "choice": {
+                "chosen": corrected_pattern,
+                "rejected": [
+                    {"option": instinct_pattern, "reason": f"Corrected by skill {skill_name}"},
+                ],
+            },
+            "evidence": {
+                "skills": [skill_name],
+                "modules": [],
+                "related_decisions": [],
+            },
+        },
+        "correction": {
+            "skill_applied": skill_name,
+            "instinct_pattern": instinct_pattern,
+            "corrected_pattern": corrected_pattern,
+            "impact_level": impact_level,
+            "frequency": {
+                "total_observations": 1,
+                "first_observed": today,
+                "last_observed": today,
+                "observations": [_observation(data, today)],
+            },
+            "classification": {
+                "themes": theme_list,
+                "origin": origin,
+                "predictability": data.get("predictability", "medium"),
+            },
+        },
+    }
+
+    md_content = _render_correction_md(
+        decision_name=decision_name,
+        skill_name=skill_name,
+        instinct_pattern=instinct_pattern,
+        corrected_pattern=corrected_pattern,
+        context=data.get("context", ""),
+        project=project,
+        file=file,
+        origin=origin,
+        impact_level=impact_level,
+        today=today,
+    )
+    return record, md_content
+
+
+def _sorted_entries(path: str | Path) -> list[os.DirEntry[str]]:
+    """List a directory with os.scandir, sorted by name.
+
+    DirEntry.is_dir() reuses the file type readdir already returned, so the
+    scans avoid a stat per entry. A missing directory lists as empty.
+    """
+    try:
+        with os.scandir(path) as it:
+            return sorted(it, key=lambda e: e.name)
+    except OSError:
+        return []
+
+
 class FileBackend(ForgeBackend):
-    """Reads forge knowledge from TOML + Markdown files on disk."""
+    """Reads forge knowledge from TOML + Markdown files on disk.
+
+    Scans return complete manifests, not header fields: search and
+    recommendation tools read nested tables (``ai``, ``correction.frequency``)
+    straight from scan results. Warm scans skip parsing via the per-file cache.
+    """
 
     def __init__(self) -> None:
         self.root = _get_forge_root()
+        # Parsed manifests keyed by path, tagged with the (mtime_ns, size) they
+        # were read at. The data is kept pickled: unpickling hands every caller
+        # a private copy several times faster than deepcopy or a re-parse.
+        self._toml_cache: dict[str, tuple[int, int, bytes]] = {}
+        # Two-level trees (skills/, decisions/) indexed as entry name -> candidate
+        # directories, tagged with the mtime_ns of every directory that was listed.
+        self._dir_indexes: dict[
+            str, tuple[list[tuple[str, int]], dict[str, list[str]]]
+        ] = {}
+
+    def _load_toml(self, path: str | Path) -> dict:
+        """Load a TOML file, parsing it again only after it changes on disk.
+
+        Returns empty dict on failure.
+        """
+        key = os.fspath(path)
+        try:
+            st = os.stat(key)
+        except OSError:
+            return {}
+        data = self._cache_hit(key, st)
+        return data if data is not None else self._parse_and_cache(key, st)
+
+    def _load_tomls(self, paths: list[str]) -> list[dict]:
+        """Load many TOML files; cache misses are parsed on a thread pool when
+        there are enough of them to pay off."""
+        results: list[dict] = []
+        misses: list[tuple[int, str, os.stat_result]] = []
+        for key in paths:
+            try:
+                st = os.stat(key)
+            except OSError:
+                results.append({})
+                continue
+            data = self._cache_hit(key, st)
+            if data is None:
+                misses.append((len(results), key, st))
+                data = {}
+            results.append(data)
+
+        if len(misses) < _PARALLEL_THRESHOLD:
+            for i, key, st in misses:
+                results[i] = self._parse_and_cache(key, st)
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(misses))) as pool:
+                parsed = pool.map(lambda m: self._parse_and_cache(m[1], m[2]), misses)
+                for (i, _, _), data in zip(misses, parsed, strict=True):
+                    results[i] = data
+        return results
+
+    def _cache_hit(self, key: str, st: os.stat_result) -> dict | None:
+        cached = self._toml_cache.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return pickle.loads(cached[2])
+        return None
+
+    def _parse_and_cache(self, key: str, st: os.stat_result) -> dict:
+        data = _load_toml(Path(key))
+        self._toml_cache[key] = (
+            st.st_mtime_ns, st.st_size, pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+        )
+        return data
+
+    def _dir_index(self, base: Path, skip: tuple[str, ...]) -> dict[str, list[str]]:
+        """Map entry name -> ``base/<category>/<name>`` directories, in category order.
+
+        The index is rebuilt only when ``base`` or one of its category
+        directories changes mtime, so a lookup costs one stat per category
+        instead of a directory listing plus a probe per category.
+        """
+        key = os.fspath(base)
+        cached = self._dir_indexes.get(key)
+        if cached is not None:
+            stamps, index = cached
+            try:
+                if all(os.stat(p).st_mtime_ns == m for p, m in stamps):
+                    return index
+            except OSError:
+                pass
+
+        try:
+            stamps = [(key, os.stat(key).st_mtime_ns)]
+        except OSError:
+            self._dir_indexes.pop(key, None)
+            return {}
+        index: dict[str, list[str]] = {}
+        for category_dir in _sorted_entries(base):
+            if not category_dir.is_dir() or category_dir.name.startswith(skip):
+                continue
+            stamps.append((category_dir.path, category_dir.stat().st_mtime_ns))
+            for entry in _sorted_entries(category_dir.path):
+                if entry.is_dir():
+                    index.setdefault(entry.name, []).append(entry.path)
+        self._dir_indexes[key] = (stamps, index)
+        return index
 
     # -- Modules --
 
     def scan_modules(self) -> list[dict]:
-        modules_dir = self.root / "modules"
-        if not modules_dir.is_dir():
-            return []
-        results: list[dict] = []
-        for mod_dir in sorted(modules_dir.iterdir()):
-            toml_path = mod_dir / "module.toml"
-            if mod_dir.is_dir() and toml_path.exists():
-                data = _load_toml(toml_path)
-                data["_path"] = str(mod_dir)
-                data["_name"] = mod_dir.name
-                results.append(data)
+        found: list[os.DirEntry[str]] = []
+        toml_paths: list[str] = []
+        for mod_dir in _sorted_entries(self.root / "modules"):
+            toml_path = os.path.join(mod_dir.path, "module.toml")
+            if mod_dir.is_dir() and os.path.isfile(toml_path):
+                found.append(mod_dir)
+                toml_paths.append(toml_path)
+
+        results = self._load_tomls(toml_paths)
+        for mod_dir, data in zip(found, results, strict=True):
+            data["_path"] = mod_dir.path
+            data["_name"] = mod_dir.name
         return results
 
     def find_module(self, name: str) -> tuple[dict, str] | None:
         mod_dir = self.root / "modules" / name
         toml_path = mod_dir / "module.toml"
         if toml_path.exists():
-            return _load_toml(toml_path), str(mod_dir)
+            return self._load_toml(toml_path), str(mod_dir)
         return None
 
     def get_module_md(self, name: str) -> str:
@@ -174,34 +527,29 @@ class FileBackend(ForgeBackend):
     # -- Skills --
 
     def scan_skills(self) -> list[dict]:
-        skills_dir = self.root / "skills"
-        if not skills_dir.is_dir():
-            return []
-        results: list[dict] = []
-        for category_dir in sorted(skills_dir.iterdir()):
+        found: list[tuple[str, os.DirEntry[str]]] = []
+        toml_paths: list[str] = []
+        for category_dir in _sorted_entries(self.root / "skills"):
             if not category_dir.is_dir() or category_dir.name.startswith("_"):
                 continue
-            for skill_dir in sorted(category_dir.iterdir()):
-                toml_path = skill_dir / "meta.toml"
-                if skill_dir.is_dir() and toml_path.exists():
-                    data = _load_toml(toml_path)
-                    data["_path"] = str(skill_dir)
-                    data["_name"] = skill_dir.name
-                    data["_category_dir"] = category_dir.name
-                    results.append(data)
+            for skill_dir in _sorted_entries(category_dir.path):
+                toml_path = os.path.join(skill_dir.path, "meta.toml")
+                if skill_dir.is_dir() and os.path.isfile(toml_path):
+                    found.append((category_dir.name, skill_dir))
+                    toml_paths.append(toml_path)
+
+        results = self._load_tomls(toml_paths)
+        for (category_name, skill_dir), data in zip(found, results, strict=True):
+            data["_path"] = skill_dir.path
+            data["_name"] = skill_dir.name
+            data["_category_dir"] = category_name
         return results
 
     def find_skill(self, name: str) -> tuple[dict, str] | None:
-        skills_dir = self.root / "skills"
-        if not skills_dir.is_dir():
-            return None
-        for category_dir in skills_dir.iterdir():
-            if not category_dir.is_dir() or category_dir.name.startswith("_"):
-                continue
-            skill_dir = category_dir / name
-            toml_path = skill_dir / "meta.toml"
-            if toml_path.exists():
-                return _load_toml(toml_path), str(skill_dir)
+        for skill_dir in self._dir_index(self.root / "skills", ("_",)).get(name, ()):
+            toml_path = os.path.join(skill_dir, "meta.toml")
+            if os.path.isfile(toml_path):
+                return self._load_toml(toml_path), skill_dir
         return None
 
     def get_skill_md(self, name: str) -> str:
@@ -211,27 +559,37 @@ class FileBackend(ForgeBackend):
         _, skill_dir = result
         return _read_md(Path(skill_dir) / "SKILL.md")
 
+    def find_skill_with_md(self, name: str) -> tuple[dict, str, str] | None:
+        result = self.find_skill(name)
+        if result is None:
+            return None
+        data, skill_dir = result
+        return data, skill_dir, _read_md(Path(skill_dir) / "SKILL.md")
+
     # -- Profiles --
 
     def scan_profiles(self) -> list[dict]:
-        profiles_dir = self.root / "profiles"
-        if not profiles_dir.is_dir():
-            return []
-        results: list[dict] = []
-        for prof_dir in sorted(profiles_dir.iterdir()):
-            toml_path = prof_dir / "profile.toml"
-            if prof_dir.is_dir() and toml_path.exists() and not prof_dir.name.startswith("_"):
-                data = _load_toml(toml_path)
-                data["_path"] = str(prof_dir)
-                data["_name"] = prof_dir.name
-                results.append(data)
+        found: list[os.DirEntry[str]] = []
+        toml_paths: list[str] = []
+        for prof_dir in _sorted_entries(self.root / "profiles"):
+            if prof_dir.name.startswith("_") or not prof_dir.is_dir():
+                continue
+            toml_path = os.path.join(prof_dir.path, "profile.toml")
+            if os.path.isfile(toml_path):
+                found.append(prof_dir)
+                toml_paths.append(toml_path)
+
+        results = self._load_tomls(toml_paths)
+        for prof_dir, data in zip(found, results, strict=True):
+            data["_path"] = prof_dir.path
+            data["_name"] = prof_dir.name
         return results
 
     def find_profile(self, name: str) -> tuple[dict, str] | None:
         prof_dir = self.root / "profiles" / name
         toml_path = prof_dir / "profile.toml"
         if toml_path.exists():
-            return _load_toml(toml_path), str(prof_dir)
+            return self._load_toml(toml_path), str(prof_dir)
         return None
 
     def get_stack_md(self, name: str) -> str:
@@ -241,39 +599,35 @@ class FileBackend(ForgeBackend):
         return _read_md(self.root / "profiles" / name / "GOTCHAS.md")
 
     def get_constraints(self, name: str) -> dict:
-        return _load_toml(self.root / "profiles" / name / "constraints.toml")
+        return self._load_toml(self.root / "profiles" / name / "constraints.toml")
 
     # -- Decisions --
 
     def scan_decisions(self) -> list[dict]:
-        decisions_dir = self.root / "decisions"
-        if not decisions_dir.is_dir():
-            return []
-        results: list[dict] = []
-        for category_dir in sorted(decisions_dir.iterdir()):
+        found: list[tuple[str, os.DirEntry[str]]] = []
+        toml_paths: list[str] = []
+        for category_dir in _sorted_entries(self.root / "decisions"):
             if not category_dir.is_dir() or category_dir.name.startswith(("_", ".")):
                 continue
-            for decision_dir in sorted(category_dir.iterdir()):
-                toml_path = decision_dir / "decision.toml"
-                if decision_dir.is_dir() and toml_path.exists():
-                    data = _load_toml(toml_path)
-                    data["_path"] = str(decision_dir)
-                    data["_name"] = decision_dir.name
-                    data["_category_dir"] = category_dir.name
-                    results.append(data)
+            for decision_dir in _sorted_entries(category_dir.path):
+                toml_path = os.path.join(decision_dir.path, "decision.toml")
+                if decision_dir.is_dir() and os.path.isfile(toml_path):
+                    found.append((category_dir.name, decision_dir))
+                    toml_paths.append(toml_path)
+
+        results = self._load_tomls(toml_paths)
+        for (category_name, decision_dir), data in zip(found, results, strict=True):
+            data["_path"] = decision_dir.path
+            data["_name"] = decision_dir.name
+            data["_category_dir"] = category_name
         return results
 
     def find_decision(self, name: str) -> tuple[dict, str] | None:
-        decisions_dir = self.root / "decisions"
-        if not decisions_dir.is_dir():
-            return None
-        for category_dir in decisions_dir.iterdir():
-            if not category_dir.is_dir() or category_dir.name.startswith(("_", ".")):
-                continue
-            decision_dir = category_dir / name
-            toml_path = decision_dir / "decision.toml"
-            if toml_path.exists():
-                return _load_toml(toml_path), str(decision_dir)
+        decisions = self._dir_index(self.root / "decisions", ("_", "."))
+        for decision_dir in decisions.get(name, ()):
+            toml_path = os.path.join(decision_dir, "decision.toml")
+            if os.path.isfile(toml_path):
+                return self._load_toml(toml_path), decision_dir
         return None
 
     def get_decision_md(self, name: str) -> str:
@@ -283,39 +637,20 @@ class FileBackend(ForgeBackend):
         _, decision_dir = result
         return _read_md(Path(decision_dir) / "DECISION.md")
 
+    def find_decision_with_md(self, name: str) -> tuple[dict, str, str] | None:
+        result = self.find_decision(name)
+        if result is None:
+            return None
+        data, decision_dir = result
+        return data, decision_dir, _read_md(Path(decision_dir) / "DECISION.md")
+
     def record_correction(self, data: dict) -> str:
         """Record a correction to disk. data keys mirror record_correction tool args."""
-        skill_name = data["skill_name"]
-        instinct_pattern = data["instinct_pattern"]
-        corrected_pattern = data["corrected_pattern"]
-        impact_level = data.get("impact_level", "structural")
-        project = data.get("project", "")
-        file = data.get("file", "")
-        context = data.get("context", "")
-        severity = data.get("severity", "") or impact_level
-        themes = data.get("themes", "")
-        origin = data.get("origin", "model-instinct")
-        predictability = data.get("predictability", "medium")
-
         decisions_dir = self.root / "decisions" / "corrections"
         decisions_dir.mkdir(parents=True, exist_ok=True)
 
         today = date.today().isoformat()
-        theme_list = [t.strip() for t in themes.split(",") if t.strip()] if themes else []
-
-        # Slugify instinct_pattern for decision name
-        slug_base = instinct_pattern.lower()[:60]
-        slug = ""
-        for ch in slug_base:
-            if ch.isalnum():
-                slug += ch
-            elif ch in (" ", "_", "-"):
-                if slug and slug[-1] != "-":
-                    slug += "-"
-        slug = slug.strip("-")
-        if not slug:
-            slug = skill_name
-        decision_name = slug
+        decision_name = _correction_name(data)
 
         # Check if correction already exists
         existing = self.find_decision(decision_name)
@@ -326,7 +661,7 @@ class FileBackend(ForgeBackend):
 
             total = freq.get("total_observations", 0) + 1
             observations = freq.get("observations", [])
-            observations.append({"date": today, "project": project, "file": file})
+            observations.append(_observation(data, today))
 
             freq["total_observations"] = total
             freq["last_observed"] = today
@@ -338,8 +673,8 @@ class FileBackend(ForgeBackend):
             dec["last_observed"] = today
             edata["decision"] = dec
 
-            toml_path = Path(decision_dir) / "decision.toml"
-            toml_path.write_bytes(tomli_w.dumps(edata).encode())
+            with open(Path(decision_dir) / "decision.toml", "wb") as f:
+                tomli_w.dump(edata, f)
 
             return (
                 f"Updated existing correction '{decision_name}' — "
@@ -351,96 +686,23 @@ class FileBackend(ForgeBackend):
         decision_dir_path.mkdir(parents=True, exist_ok=True)
 
         # Determine applies_to from skill metadata
+        skill_name = data["skill_name"]
         skill_result = self.find_skill(skill_name)
         applies_to: list[str] = []
         if skill_result:
             skill_data, _ = skill_result
             applies_to = skill_data.get("skill", {}).get("relevance_tags", [])[:5]
 
-        record = {
-            "decision": {
-                "name": decision_name,
-                "version": "0.1.0",
-                "type": "correction",
-                "status": "active",
-                "severity": severity,
-                "description": f"Correction: {instinct_pattern[:80]}",
-                "created": today,
-                "last_observed": today,
-                "context": {
-                    "applies_to": applies_to,
-                    "profiles": ["rtg-default"],
-                    "trigger": instinct_pattern,
-                },
-                "choice": {
-                    "chosen": corrected_pattern,
-                    "rejected": [
-                        {"option": instinct_pattern, "reason": f"Corrected by skill {skill_name}"},
-                    ],
-                },
-                "evidence": {
-                    "skills": [skill_name],
-                    "modules": [],
-                    "related_decisions": [],
-                },
-            },
-            "correction": {
-                "skill_applied": skill_name,
-                "instinct_pattern": instinct_pattern,
-                "corrected_pattern": corrected_pattern,
-                "impact_level": impact_level,
-                "frequency": {
-                    "total_observations": 1,
-                    "first_observed": today,
-                    "last_observed": today,
-                    "observations": [
-                        {"date": today, "project": project, "file": file},
-                    ],
-                },
-                "classification": {
-                    "themes": theme_list,
-                    "origin": origin,
-                    "predictability": predictability,
-                },
-            },
-        }
-
-        toml_path = decision_dir_path / "decision.toml"
-        toml_path.write_bytes(tomli_w.dumps(record).encode())
-
-        md_content = f"""# Decision: {decision_name}
-
-## Summary
-
-Claude's default instinct is to {instinct_pattern}. The skill `{skill_name}` corrects this to {corrected_pattern}.
+        record, md_content = _build_correction_payload(data, decision_name, today, applies_to)
 
-## Context
-
-{context or f"Observed while working on {project or 'a project'}."}
-
-## Instinct Pattern (Before)
-
-{instinct_pattern}
-
-## Corrected Pattern (After)
-
-{corrected_pattern}
-
-## Reasoning
-
-The corrected pattern follows the guidelines established in the `{skill_name}` skill. The instinct pattern was identified as a {origin.replace('-', ' ')} that impacts code at the {impact_level} level.
-
-## Observations
-
-| Date | Project | File | Notes |
-|------|---------|------|-------|
-| {today} | {project or 'unknown'} | {file or 'unknown'} | Initial observation |
-"""
-        (decision_dir_path / "DECISION.md").write_text(md_content, encoding="utf-8")
+        with open(decision_dir_path / "decision.toml", "wb") as f:
+            tomli_w.dump(record, f)
+        with open(decision_dir_path / "DECISION.md", "wb") as f:
+            f.write(md_content.encode("utf-8"))
 
         return (
             f"Created new correction '{decision_name}' in decisions/corrections/. "
-            f"Skill: {skill_name}, Impact: {impact_level}."
+            f"Skill: {skill_name}, Impact: {record['correction']['impact_level']}."
         )
 
     # -- Validation --
@@ -469,44 +731,305 @@ The corrected pattern follows the guidelines established in the `{skill_name}` s
 # Supabase backend — reads from forge_* tables
 # ---------------------------------------------------------------------------
 
+# Read results are reused for this many seconds (FORGE_CACHE_TTL; 0 disables),
+# so tool chains within one session stop repeating round-trips while rows
+# synced from disk still show up within a minute.
+_DEFAULT_CACHE_TTL = 60.0
+_READ_CACHE_MAXSIZE = 512
+
+# Columns the _row_to_* converters read. Metadata queries select just these so
+# the Markdown and source blobs only cross the wire when a caller asks for them.
+_MODULE_META_COLS = (
+    "name,version,description,status,category,author,"
+    "deps_python,deps_services,deps_modules,api_prefix,api_auth_required,"
+    "db_tables,db_requires_rls,ai_use_when,ai_input_summary,ai_output_summary,"
+    "ai_complexity,ai_estimated_setup_minutes,ai_related_modules,ai_decisions,"
+    "ai_companions_backend,ai_companions_frontend_views,"
+    "ai_companions_frontend_components,ai_companions_frontend_hooks,"
+    "health_last_validated,health_test_coverage,health_known_issues,source_path"
+)
+_SKILL_META_COLS = (
+    "name,version,tier,category,priority_weight,description,relevance_tags,"
+    "prerequisites,complements,supersedes,common_mistakes,optimization,source_path"
+)
+_PROFILE_META_COLS = (
+    "name,display_name,version,description,maturity,vendor,vendor_url,"
+    "extends,maintainer_team,maintainer_last_reviewed,source_path"
+)
+_DECISION_META_COLS = (
+    "name,version,type,status,severity,description,created_date,last_observed,"
+    "category,context_applies_to,context_profiles,context_trigger,"
+    "choice_chosen,choice_rejected,evidence_skills,evidence_modules,"
+    "evidence_related_decisions,correction_skill_applied,"
+    "correction_instinct_pattern,correction_corrected_pattern,"
+    "correction_impact_level,correction_total_observations,"
+    "correction_first_observed,correction_last_observed,correction_observations,"
+    "correction_themes,correction_origin,correction_predictability,source_path"
+)
+
+
+def _cached_read(table: str) -> Callable:
+    """Serve a SupabaseBackend read from the backend's TTL cache.
+
+    Entries are keyed by (table, method, *args), so writes can drop every
+    cached read of the table they touched.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(self: SupabaseBackend, *args: Any) -> Any:
+            return self._cached((table, fn.__name__, *args), lambda: fn(self, *args))
+
+        return wrapper
+
+    return decorator
+
+
+# Rows per request: bulk correction inserts, and names per in_() filter (these
+# go in the URL, so the lookups stay well under typical URL length limits).
+_INSERT_BATCH_SIZE = 1000
+_LOOKUP_BATCH_SIZE = 100
+# Rows per page for table scans. PostgREST caps responses at its max-rows
+# setting (1000 on Supabase), so an unpaged select silently truncates.
+_SCAN_PAGE_SIZE = 1000
+
+
+def _exec(query: Any) -> Any:
+    """Execute a postgrest select, decoding the body with orjson.
+
+    postgrest validates every body through a pydantic JSON adapter, which on
+    a few hundred KB of scan results is ~10x slower than orjson.loads. Error
+    responses go through query.execute() instead, which retries and raises
+    APIError as usual.
+    """
+    import httpx
+    from postgrest import APIResponse
+
+    resp = query.request.send(httpx.Headers())
+    if not resp.is_success:
+        return query.execute()
+    total = resp.headers.get("content-range", "").rpartition("/")[2]
+    return APIResponse.model_construct(
+        data=_json_loads(resp.content), count=int(total) if total.isdigit() else None
+    )
+
+
+# HTTP limits for the long-running server: enough pooled connections for
+# concurrent tool calls and bulk imports, and a bound on how long one request
+# may hang.
+_HTTP_POOL_SIZE = 50
+_HTTP_TIMEOUT = 30.0
+
+
+def _http_client() -> Any:
+    """The httpx.Client SupabaseBackend hands supabase-py for all its requests.
+
+    Passed through the client options, so postgrest clients supabase-py
+    rebuilds (e.g. after an auth event) keep the same pool and timeout.
+    """
+    import httpx
+
+    return httpx.Client(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=_HTTP_POOL_SIZE, max_keepalive_connections=_HTTP_POOL_SIZE
+        ),
+        timeout=_HTTP_TIMEOUT,
+        follow_redirects=True,
+    )
+
+
+def _cache_ttl_from_env() -> float:
+    """FORGE_CACHE_TTL in seconds, or the default when unset or not a number."""
+    try:
+        return float(os.environ.get("FORGE_CACHE_TTL", _DEFAULT_CACHE_TTL))
+    except ValueError:
+        return _DEFAULT_CACHE_TTL
+
 
 class SupabaseBackend(ForgeBackend):
-    """Reads forge knowledge from Supabase forge_* tables."""
+    """Reads forge knowledge from Supabase forge_* tables.
 
-    def __init__(self) -> None:
-        from supabase import Client, create_client
+    ``cache_ttl`` overrides FORGE_CACHE_TTL for this backend's read cache.
+    """
+
+    def __init__(self, cache_ttl: float | None = None) -> None:
+        from supabase import Client, ClientOptions, create_client
 
         url = os.environ.get("SUPABASE_URL", "")
         key = os.environ.get("SUPABASE_SERVICE_KEY", "")
         if not url or not key:
             raise RuntimeError("SUPABASE_URL and SUPABASE_SERVICE_KEY must be set for supabase backend")
-        self._client: Client = create_client(url, key)
+        self._client: Client = create_client(
+            url, key, options=ClientOptions(httpx_client=_http_client())
+        )
+        self._cache_ttl = _cache_ttl_from_env() if cache_ttl is None else cache_ttl
+        # key -> (expires_at, pickled result), oldest first. Results are kept
+        # pickled so every caller gets a private copy it may mutate.
+        self._cache: OrderedDict[tuple, tuple[float, bytes]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Misses being fetched right now; concurrent identical reads wait on
+        # the same future instead of issuing their own request.
+        self._inflight: dict[tuple, Future[bytes]] = {}
+        # Bumped whenever cached reads are dropped. A fetch that overlapped a
+        # drop of its table doesn't store its result, and later callers don't
+        # join it, since it may predate the write.
+        self._clears = 0
+        self._invalidations: dict[str, int] = {}
+        # Cleared the first time the database turns out not to have
+        # forge_append_observation, so later corrections skip straight to
+        # the fallback.
+        self._append_rpc = True
+        # Likewise for forge_import_corrections.
+        self._import_rpc = True
+
+    def _cached(self, key: tuple, fetch: Callable[[], Any]) -> Any:
+        if self._cache_ttl <= 0:
+            return fetch()
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] > now:
+                self._cache.move_to_end(key)
+                return pickle.loads(entry[1])
+            pending = self._inflight.get(key)
+            if pending is None:
+                self._inflight[key] = future = Future()
+                generation = self._generation(key[0])
+        if pending is not None:
+            return pickle.loads(pending.result())
+
+        try:
+            value = fetch()
+            blob = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        except BaseException as e:
+            with self._cache_lock:
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+            future.set_exception(e)
+            raise
+        with self._cache_lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+            # A write to the table while we fetched may not be in the result.
+            if self._generation(key[0]) == generation:
+                self._cache[key] = (now + self._cache_ttl, blob)
+                self._cache.move_to_end(key)
+                while len(self._cache) > _READ_CACHE_MAXSIZE:
+                    self._cache.popitem(last=False)
+        future.set_result(blob)
+        return value
+
+    def _generation(self, table: str) -> tuple[int, int]:
+        """How many times ``table``'s cached reads were dropped; call with the lock held."""
+        return self._clears, self._invalidations.get(table, 0)
+
+    def _iter_rows(
+        self, table: str, columns: str, order: tuple[str, ...] = ("name",)
+    ) -> Iterator[dict]:
+        """Yield every row of table, one range() page per request.
+
+        Rows come in ``order`` (which must end in a unique column, for stable
+        pages); scans pass the order FileBackend lists directories in.
+
+        Neither a short page nor the page size tells where the table ends once
+        the server's max-rows is below _SCAN_PAGE_SIZE, so the first page asks
+        for the exact row count: one count over a forge table is cheaper than
+        the empty trailing request paging without it would need on every scan.
+        Offsets advance by rows received. If the server sends no count, paging
+        runs until an empty page.
+        """
+        offset = 0
+        total = None
+        while True:
+            query = self._client.table(table).select(
+                columns, count="exact" if offset == 0 else None
+            )
+            for column in order:
+                query = query.order(column)
+            resp = _exec(query.range(offset, offset + _SCAN_PAGE_SIZE - 1))
+            if offset == 0:
+                total = resp.count
+            if not resp.data:
+                return
+            yield from resp.data
+            offset += len(resp.data)
+            if total is not None and offset >= total:
+                return
+
+    def cache_clear(self) -> None:
+        """Drop every cached read, e.g. after syncing the tables out of band."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._inflight.clear()
+            self._clears += 1
+
+    def _invalidate(self, table: str) -> None:
+        """Drop every cached read of ``table``, including reads still in flight."""
+        with self._cache_lock:
+            for key in [k for k in self._cache if k[0] == table]:
+                del self._cache[key]
+            for key in [k for k in self._inflight if k[0] == table]:
+                del self._inflight[key]
+            self._invalidations[table] = self._invalidations.get(table, 0) + 1
 
     # -- Modules --
 
+    @_cached_read("forge_modules")
     def scan_modules(self) -> list[dict]:
-        resp = self._client.table("forge_modules").select("*").execute()
-        return [self._row_to_module(r) for r in resp.data]
+        rows = self._iter_rows("forge_modules", _MODULE_META_COLS)
+        return [self._row_to_module(r) for r in rows]
 
+    @_cached_read("forge_modules")
     def find_module(self, name: str) -> tuple[dict, str] | None:
-        resp = self._client.table("forge_modules").select("*").eq("name", name).execute()
+        resp = (
+            self._client.table("forge_modules")
+            .select(_MODULE_META_COLS)
+            .eq("name", name)
+            .execute()
+        )
         if not resp.data:
             return None
         row = resp.data[0]
         return self._row_to_module(row), row.get("source_path", f"modules/{name}")
 
+    @_cached_read("forge_modules")
+    def find_module_with_md(self, name: str) -> tuple[dict, str, str] | None:
+        resp = (
+            self._client.table("forge_modules")
+            .select(f"{_MODULE_META_COLS},module_md")
+            .eq("name", name)
+            .execute()
+        )
+        if not resp.data:
+            return None
+        row = resp.data[0]
+        return (
+            self._row_to_module(row),
+            row.get("source_path", f"modules/{name}"),
+            row.get("module_md", ""),
+        )
+
+    @_cached_read("forge_modules")
     def get_module_md(self, name: str) -> str:
         resp = self._client.table("forge_modules").select("module_md").eq("name", name).execute()
         if not resp.data:
             return ""
         return resp.data[0].get("module_md", "")
 
+    @_cached_read("forge_modules")
     def get_module_sources(self, name: str) -> dict[str, str]:
         resp = self._client.table("forge_modules").select("source_files").eq("name", name).execute()
         if not resp.data:
             return {}
         return resp.data[0].get("source_files", {}) or {}
 
+    # The _row_to_* converters only run when the read cache misses, right after
+    # a network round trip, and cost 1.5-4us per row: a 500-row scan spends
+    # ~2ms here. They stay plain dict literals rather than generated code.
+    # Their keys are code constants, already interned, and results must stay
+    # plain dicts: the read cache pickles them (a MappingProxyType can't be
+    # pickled), and both backends promise callers dicts they may modify.
     @staticmethod
     def _row_to_module(row: dict) -> dict:
         """Reconstruct the nested dict structure tools expect from a flat DB row."""
@@ -558,17 +1081,42 @@ class SupabaseBackend(ForgeBackend):
 
     # -- Skills --
 
+    @_cached_read("forge_skills")
     def scan_skills(self) -> list[dict]:
-        resp = self._client.table("forge_skills").select("*").execute()
-        return [self._row_to_skill(r) for r in resp.data]
+        rows = self._iter_rows("forge_skills", _SKILL_META_COLS, ("category", "name"))
+        return [self._row_to_skill(r) for r in rows]
 
+    @_cached_read("forge_skills")
     def find_skill(self, name: str) -> tuple[dict, str] | None:
-        resp = self._client.table("forge_skills").select("*").eq("name", name).execute()
+        resp = (
+            self._client.table("forge_skills")
+            .select(_SKILL_META_COLS)
+            .eq("name", name)
+            .execute()
+        )
         if not resp.data:
             return None
         row = resp.data[0]
         return self._row_to_skill(row), row.get("source_path", f"skills/{row.get('category', 'unknown')}/{name}")
 
+    @_cached_read("forge_skills")
+    def find_skill_with_md(self, name: str) -> tuple[dict, str, str] | None:
+        resp = (
+            self._client.table("forge_skills")
+            .select(f"{_SKILL_META_COLS},skill_md")
+            .eq("name", name)
+            .execute()
+        )
+        if not resp.data:
+            return None
+        row = resp.data[0]
+        return (
+            self._row_to_skill(row),
+            row.get("source_path", f"skills/{row.get('category', 'unknown')}/{name}"),
+            row.get("skill_md", ""),
+        )
+
+    @_cached_read("forge_skills")
     def get_skill_md(self, name: str) -> str:
         resp = self._client.table("forge_skills").select("skill_md").eq("name", name).execute()
         if not resp.data:
@@ -603,36 +1151,47 @@ class SupabaseBackend(ForgeBackend):
 
     # -- Profiles --
 
+    @_cached_read("forge_profiles")
     def scan_profiles(self) -> list[dict]:
-        resp = self._client.table("forge_profiles").select("*").execute()
-        return [self._row_to_profile(r) for r in resp.data]
+        rows = self._iter_rows("forge_profiles", _PROFILE_META_COLS)
+        return [self._row_to_profile(r) for r in rows]
 
+    @_cached_read("forge_profiles")
     def find_profile(self, name: str) -> tuple[dict, str] | None:
-        resp = self._client.table("forge_profiles").select("*").eq("name", name).execute()
+        resp = (
+            self._client.table("forge_profiles")
+            .select(_PROFILE_META_COLS)
+            .eq("name", name)
+            .execute()
+        )
         if not resp.data:
             return None
         row = resp.data[0]
         return self._row_to_profile(row), row.get("source_path", f"profiles/{name}")
 
+    @_cached_read("forge_profiles")
     def get_stack_md(self, name: str) -> str:
         resp = self._client.table("forge_profiles").select("stack_md").eq("name", name).execute()
         if not resp.data:
             return ""
         return resp.data[0].get("stack_md", "")
 
+    @_cached_read("forge_profiles")
     def get_gotchas_md(self, name: str) -> str:
         resp = self._client.table("forge_profiles").select("gotchas_md").eq("name", name).execute()
         if not resp.data:
             return ""
         return resp.data[0].get("gotchas_md", "")
 
+    @_cached_read("forge_profiles")
     def get_constraints(self, name: str) -> dict:
-        # First look up the profile to get its ID
-        prof_resp = self._client.table("forge_profiles").select("id").eq("name", name).execute()
-        if not prof_resp.data:
-            return {}
-        profile_id = prof_resp.data[0]["id"]
-        resp = self._client.table("forge_profile_constraints").select("*").eq("profile_id", profile_id).execute()
+        # Embed the parent profile so one request filters constraints by profile name
+        resp = (
+            self._client.table("forge_profile_constraints")
+            .select("description,required,allowed,forbidden,forge_profiles!inner(name)")
+            .eq("forge_profiles.name", name)
+            .execute()
+        )
         if not resp.data:
             return {}
         row = resp.data[0]
@@ -670,17 +1229,42 @@ class SupabaseBackend(ForgeBackend):
 
     # -- Decisions --
 
+    @_cached_read("forge_decisions")
     def scan_decisions(self) -> list[dict]:
-        resp = self._client.table("forge_decisions").select("*").execute()
-        return [self._row_to_decision(r) for r in resp.data]
+        rows = self._iter_rows("forge_decisions", _DECISION_META_COLS, ("category", "name"))
+        return [self._row_to_decision(r) for r in rows]
 
+    @_cached_read("forge_decisions")
     def find_decision(self, name: str) -> tuple[dict, str] | None:
-        resp = self._client.table("forge_decisions").select("*").eq("name", name).execute()
+        resp = (
+            self._client.table("forge_decisions")
+            .select(_DECISION_META_COLS)
+            .eq("name", name)
+            .execute()
+        )
         if not resp.data:
             return None
         row = resp.data[0]
         return self._row_to_decision(row), row.get("source_path", f"decisions/{row.get('category', 'unknown')}/{name}")
 
+    @_cached_read("forge_decisions")
+    def find_decision_with_md(self, name: str) -> tuple[dict, str, str] | None:
+        resp = (
+            self._client.table("forge_decisions")
+            .select(f"{_DECISION_META_COLS},decision_md")
+            .eq("name", name)
+            .execute()
+        )
+        if not resp.data:
+            return None
+        row = resp.data[0]
+        return (
+            self._row_to_decision(row),
+            row.get("source_path", f"decisions/{row.get('category', 'unknown')}/{name}"),
+            row.get("decision_md", ""),
+        )
+
+    @_cached_read("forge_decisions")
     def get_decision_md(self, name: str) -> str:
         resp = self._client.table("forge_decisions").select("decision_md").eq("name", name).execute()
         if not resp.data:
@@ -743,149 +1327,251 @@ class SupabaseBackend(ForgeBackend):
 
     def record_correction(self, data: dict) -> str:
         """Record a correction to Supabase."""
-        skill_name = data["skill_name"]
-        instinct_pattern = data["instinct_pattern"]
-        corrected_pattern = data["corrected_pattern"]
-        impact_level = data.get("impact_level", "structural")
-        project = data.get("project", "")
-        file = data.get("file", "")
-        context = data.get("context", "")
-        severity = data.get("severity", "") or impact_level
-        themes = data.get("themes", "")
-        origin = data.get("origin", "model-instinct")
-        predictability = data.get("predictability", "medium")
-
         today = date.today().isoformat()
-        theme_list = [t.strip() for t in themes.split(",") if t.strip()] if themes else []
-
-        # Slugify
-        slug_base = instinct_pattern.lower()[:60]
-        slug = ""
-        for ch in slug_base:
-            if ch.isalnum():
-                slug += ch
-            elif ch in (" ", "_", "-"):
-                if slug and slug[-1] != "-":
-                    slug += "-"
-        slug = slug.strip("-")
-        if not slug:
-            slug = skill_name
-        decision_name = slug
-
-        # Check if correction already exists
-        resp = self._client.table("forge_decisions").select("*").eq("name", decision_name).execute()
-
-        if resp.data:
-            row = resp.data[0]
-            total = (row.get("correction_total_observations", 0) or 0) + 1
-            observations = row.get("correction_observations", []) or []
-            observations.append({"date": today, "project": project, "file": file})
-
-            self._client.table("forge_decisions").update({
-                "correction_total_observations": total,
-                "correction_last_observed": today,
-                "correction_observations": observations,
-                "last_observed": today,
-            }).eq("name", decision_name).execute()
-
-            return (
-                f"Updated existing correction '{decision_name}' — "
-                f"now at {total} observations."
-            )
-
-        # Determine applies_to from skill metadata
-        skill_resp = self._client.table("forge_skills").select("relevance_tags").eq("name", skill_name).execute()
-        applies_to: list[str] = []
-        if skill_resp.data:
-            applies_to = (skill_resp.data[0].get("relevance_tags", []) or [])[:5]
-
-        md_content = f"""# Decision: {decision_name}
-
-## Summary
-
-Claude's default instinct is to {instinct_pattern}. The skill `{skill_name}` corrects this to {corrected_pattern}.
-
-## Context
-
-{context or f"Observed while working on {project or 'a project'}."}
-
-## Instinct Pattern (Before)
-
-{instinct_pattern}
-
-## Corrected Pattern (After)
+        decision_name = _correction_name(data)
+
+        # Append to an existing correction, if there is one
+        observation = _observation(data, today)
+        total = self._append_observation(decision_name, observation, today)
+        if total is None:
+            # Determine applies_to from skill metadata
+            skill_name = data["skill_name"]
+            skill_resp = self._client.table("forge_skills").select("relevance_tags").eq("name", skill_name).execute()
+            applies_to: list[str] = []
+            if skill_resp.data:
+                applies_to = (skill_resp.data[0].get("relevance_tags", []) or [])[:5]
+
+            record, md_content = _build_correction_payload(data, decision_name, today, applies_to)
+            if self._insert_corrections([self._correction_row(record, md_content)]):
+                self._invalidate("forge_decisions")
+                return (
+                    f"Created new correction '{decision_name}' in Supabase. "
+                    f"Skill: {skill_name}, Impact: {record['correction']['impact_level']}."
+                )
+            # Created concurrently since the append attempt: add to that one.
+            total = self._append_observation(decision_name, observation, today)
+
+        self._invalidate("forge_decisions")
+        return (
+            f"Updated existing correction '{decision_name}' — "
+            f"now at {total} observations."
+        )
 
-{corrected_pattern}
+    def record_corrections(self, items: list[dict]) -> list[str]:
+        """Record many corrections, inserting the new ones in batched requests.
 
-## Reasoning
+        Same results as record_correction per item in order, but existence and
+        skill tags are looked up once per batch and new decisions are inserted
+        _INSERT_BATCH_SIZE rows per request instead of one request each.
+        """
+        today = date.today().isoformat()
+        names = [_correction_name(data) for data in items]
+        existing = {
+            row["name"] for row in self._select_in("forge_decisions", "name", set(names))
+        }
 
-The corrected pattern follows the guidelines established in the `{skill_name}` skill. The instinct pattern was identified as a {origin.replace('-', ' ')} that impacts code at the {impact_level} level.
+        # The first item for each name not stored yet creates it; later ones append.
+        creates: dict[str, int] = {}
+        for i, name in enumerate(names):
+            if name not in existing and name not in creates:
+                creates[name] = i
 
-## Observations
+        skill_names = {items[i]["skill_name"] for i in creates.values()}
+        tags = {
+            row["name"]: (row.get("relevance_tags", []) or [])[:5]
+            for row in self._select_in("forge_skills", "name,relevance_tags", skill_names)
+        }
+        created: dict[int, dict] = {}
+        rows: list[dict] = []
+        for name, i in creates.items():
+            data = items[i]
+            record, md_content = _build_correction_payload(
+                data, name, today, tags.get(data["skill_name"], [])
+            )
+            created[i] = record
+            rows.append(self._correction_row(record, md_content))
+        inserted: set[str] = set()
+        for start in range(0, len(rows), _INSERT_BATCH_SIZE):
+            inserted.update(self._insert_corrections(rows[start:start + _INSERT_BATCH_SIZE]))
+        # Rows created concurrently since the existence check were skipped by
+        # the upsert; their items append to those rows instead.
+        created = {i: record for i, record in created.items() if names[i] in inserted}
+
+        results: list[str] = []
+        for i, (name, data) in enumerate(zip(names, items, strict=True)):
+            if i in created:
+                results.append(
+                    f"Created new correction '{name}' in Supabase. "
+                    f"Skill: {data['skill_name']}, "
+                    f"Impact: {created[i]['correction']['impact_level']}."
+                )
+                continue
+            total = self._append_observation(name, _observation(data, today), today)
+            if total is None:
+                # Deleted since the existence check: create it the slow way.
+                results.append(self.record_correction(data))
+                continue
+            results.append(
+                f"Updated existing correction '{name}' — now at {total} observations."
+            )
+        if items:
+            self._invalidate("forge_decisions")
+        return results
 
-| Date | Project | File | Notes |
-|------|---------|------|-------|
-| {today} | {project or 'unknown'} | {file or 'unknown'} | Initial observation |
-"""
+    def _insert_corrections(self, rows: list[dict]) -> list[str]:
+        """Insert new correction rows, skipping existing names; returns the names inserted.
+
+        Uses the forge_import_corrections function (installed by
+        supabase/migrations/) so the batch is one set-based insert; falls back
+        to an ignore-duplicates upsert where it isn't installed. Either way the response has to name
+        the rows written, so unlike the other writes this can't ask for
+        return=minimal.
+        """
+        from postgrest.exceptions import APIError
+
+        if self._import_rpc:
+            try:
+                return self._client.rpc("forge_import_corrections", {"rows": rows}).execute().data
+            except APIError as e:
+                if e.code != "PGRST202":  # function not found
+                    raise
+                self._import_rpc = False
+
+        resp = self._client.table("forge_decisions").upsert(
+            rows, on_conflict="name", ignore_duplicates=True
+        ).execute()
+        return [row["name"] for row in resp.data]
+
+    def _select_in(self, table: str, columns: str, names: set[str]) -> list[dict]:
+        """Rows of table whose name is in names, _LOOKUP_BATCH_SIZE names per request."""
+        ordered = sorted(names)
+        rows: list[dict] = []
+        for start in range(0, len(ordered), _LOOKUP_BATCH_SIZE):
+            resp = (
+                self._client.table(table)
+                .select(columns)
+                .in_("name", ordered[start:start + _LOOKUP_BATCH_SIZE])
+                .execute()
+            )
+            rows.extend(resp.data)
+        return rows
 
-        self._client.table("forge_decisions").insert({
-            "name": decision_name,
-            "version": "0.1.0",
-            "type": "correction",
-            "status": "active",
-            "severity": severity,
-            "description": f"Correction: {instinct_pattern[:80]}",
-            "created_date": today,
-            "last_observed": today,
+    @staticmethod
+    def _correction_row(record: dict, md_content: str) -> dict:
+        """Flatten a new correction's decision.toml record into a forge_decisions row.
+
+        The dict is the JSON payload postgrest sends as is; an intermediate row
+        object would only add a construction and a copy per row.
+        """
+        dec = record["decision"]
+        corr = record["correction"]
+        freq = corr["frequency"]
+        cls = corr["classification"]
+        return {
+            "name": dec["name"],
+            "version": dec["version"],
+            "type": dec["type"],
+            "status": dec["status"],
+            "severity": dec["severity"],
+            "description": dec["description"],
+            "created_date": dec["created"],
+            "last_observed": dec["last_observed"],
             "category": "corrections",
-            "context_applies_to": applies_to,
-            "context_profiles": ["rtg-default"],
-            "context_trigger": instinct_pattern,
-            "choice_chosen": corrected_pattern,
-            "choice_rejected": [
-                {"option": instinct_pattern, "reason": f"Corrected by skill {skill_name}"},
-            ],
-            "evidence_skills": [skill_name],
-            "evidence_modules": [],
-            "evidence_related_decisions": [],
-            "correction_skill_applied": skill_name,
-            "correction_instinct_pattern": instinct_pattern,
-            "correction_corrected_pattern": corrected_pattern,
-            "correction_impact_level": impact_level,
-            "correction_total_observations": 1,
-            "correction_first_observed": today,
-            "correction_last_observed": today,
-            "correction_observations": [
-                {"date": today, "project": project, "file": file},
-            ],
-            "correction_themes": theme_list,
-            "correction_origin": origin,
-            "correction_predictability": predictability,
+            "context_applies_to": dec["context"]["applies_to"],
+            "context_profiles": dec["context"]["profiles"],
+            "context_trigger": dec["context"]["trigger"],
+            "choice_chosen": dec["choice"]["chosen"],
+            "choice_rejected": dec["choice"]["rejected"],
+            "evidence_skills": dec["evidence"]["skills"],
+            "evidence_modules": dec["evidence"]["modules"],
+            "evidence_related_decisions": dec["evidence"]["related_decisions"],
+            "correction_skill_applied": corr["skill_applied"],
+            "correction_instinct_pattern": corr["instinct_pattern"],
+            "correction_corrected_pattern": corr["corrected_pattern"],
+            "correction_impact_level": corr["impact_level"],
+            "correction_total_observations": freq["total_observations"],
+            "correction_first_observed": freq["first_observed"],
+            "correction_last_observed": freq["last_observed"],
+            "correction_observations": freq["observations"],
+            "correction_themes": cls["themes"],
+            "correction_origin": cls["origin"],
+            "correction_predictability": cls["predictability"],
             "decision_md": md_content,
-        }).execute()
+        }
 
-        return (
-            f"Created new correction '{decision_name}' in Supabase. "
-            f"Skill: {skill_name}, Impact: {impact_level}."
-        )
+    def _append_observation(self, name: str, observation: dict, today: str) -> int | None:
+        """Append one observation to correction ``name`` and bump its counters.
+
+        Returns the new observation total, or None if no such decision exists.
+        Uses the forge_append_observation function (installed by
+        supabase/migrations/) so the update is one atomic round trip that never
+        ships the existing array; falls back to read-modify-write where it
+        isn't installed.
+        """
+        from postgrest.exceptions import APIError
+        from postgrest.types import ReturnMethod
+
+        if self._append_rpc:
+            try:
+                resp = self._client.rpc(
+                    "forge_append_observation",
+                    {"name": name, "obs": observation, "today": today},
+                ).execute()
+                return resp.data
+            except APIError as e:
+                if e.code != "PGRST202":  # function not found
+                    raise
+                self._append_rpc = False
+
+        resp = self._client.table("forge_decisions").select(
+            "correction_total_observations,correction_observations"
+        ).eq("name", name).execute()
+        if not resp.data:
+            return None
+        row = resp.data[0]
+        total = (row.get("correction_total_observations", 0) or 0) + 1
+        observations = row.get("correction_observations", []) or []
+        observations.append(observation)
+
+        self._client.table("forge_decisions").update({
+            "correction_total_observations": total,
+            "correction_last_observed": today,
+            "correction_observations": observations,
+            "last_observed": today,
+        }, returning=ReturnMethod.minimal).eq("name", name).execute()
+        return total
 
     # -- Validation --
 
+    # All files are in the DB, so content-backed checks pass; filesystem files
+    # and directories can't be validated in cloud mode.
+    _CLOUD_CHECKS: dict[str, str] = {
+        "module.toml": "pass",
+        "MODULE.md": "pass",
+        **dict.fromkeys(
+            ["__init__.py", "router.py", "service.py", "models.py", "config.py",
+             "migrations/", "tests/"],
+            "N/A (cloud mode)",
+        ),
+    }
+
     def validate_module_files(self, name: str) -> dict | None:
         """In cloud mode, we can only check that the module exists."""
-        resp = self._client.table("forge_modules").select("name").eq("name", name).execute()
-        if not resp.data:
+        if not self._module_exists(name):
             return None
-        # All files are in the DB, so we report pass for content-backed checks
-        checks: dict[str, str] = {}
-        for fname in ["module.toml", "MODULE.md"]:
-            checks[fname] = "pass"
-        # Can't validate filesystem files in cloud mode
-        for fname in ["__init__.py", "router.py", "service.py", "models.py", "config.py"]:
-            checks[fname] = "N/A (cloud mode)"
-        for dname in ["migrations/", "tests/"]:
-            checks[dname] = "N/A (cloud mode)"
-        return checks
+        return dict(self._CLOUD_CHECKS)
+
+    @_cached_read("forge_modules")
+    def _module_exists(self, name: str) -> bool:
+        # HEAD request: PostgREST reports the match count in Content-Range
+        # and sends no body.
+        resp = (
+            self._client.table("forge_modules")
+            .select("name", count="exact", head=True)
+            .eq("name", name)
+            .execute()
+        )
+        return bool(resp.count)
 
 
 # ---------------------------------------------------------------------------
@@ -894,8 +1580,16 @@ The corrected pattern follows the guidelines established in the `{skill_name}` s
 
 
 def get_backend() -> ForgeBackend:
-    """Return the configured backend based on FORGE_BACKEND env var."""
-    backend_type = os.environ.get("FORGE_BACKEND", "file").lower()
+    """Return the configured backend based on FORGE_BACKEND env var.
+
+    One instance per backend type is shared, along with its caches and HTTP
+    session; call _create_backend.cache_clear() to get a fresh one.
+    """
+    return _create_backend(os.environ.get("FORGE_BACKEND", "file").lower())
+
+
+@functools.cache
+def _create_backend(backend_type: str) -> ForgeBackend:
     if backend_type == "supabase":
         return SupabaseBackend()
     return FileBackend()
@@ -86,11 +86,11 @@ def get_module(name: str, profile: str = "rtg-default") -> str:
         name: Module directory name (e.g. "stakeholder_enrichment").
         profile: Profile context.
     """
-    result = _backend.find_module(name)
+    result = _backend.find_module_with_md(name)
     if result is None:
         return f"Module '{name}' not found."
 
-    data, _ = result
+    data, _, md_content = result
     mod = data.get("module", {})
 
     lines = [f"# Module: {mod.get('name', name)}\n"]
@@ -157,7 +157,6 @@ def get_module(name: str, profile: str = "rtg-default") -> str:
                 lines.append(f"- **{h.get('name', '?')}** — {h.get('description', '')}")
 
     # Append MODULE.md content
-    md_content = _backend.get_module_md(name)
     if md_content:
         lines.append("\n---\n")
         lines.append(md_content)
@@ -247,11 +246,11 @@ def get_module_setup(name: str, profile: str = "rtg-default") -> str:
         name: Module directory name.
         profile: Profile context.
     """
-    result = _backend.find_module(name)
+    result = _backend.find_module_with_md(name)
     if result is None:
         return f"Module '{name}' not found."
 
-    data, _ = result
+    data, _, md_content = result
     mod = data.get("module", {})
 
     lines = [f"# Setup: {mod.get('name', name)}\n"]
@@ -271,7 +270,6 @@ def get_module_setup(name: str, profile: str = "rtg-default") -> str:
         lines.append("")
 
     # Extract Setup section from MODULE.md
-    md_content = _backend.get_module_md(name)
     if md_content:
         # Try to extract just the Setup section
         in_setup = False
@@ -440,11 +438,11 @@ def get_skill(name: str, profile: str = "rtg-default") -> str:
         name: Skill directory name (e.g. "python-clean-architecture").
         profile: Profile context.
     """
-    result = _backend.find_skill(name)
+    result = _backend.find_skill_with_md(name)
     if result is None:
         return f"Skill '{name}' not found."
 
-    data, _ = result
+    data, _, md_content = result
     sk = data.get("skill", {})
 
     lines = [f"# Skill: {sk.get('name', name)}\n"]
@@ -474,7 +472,6 @@ def get_skill(name: str, profile: str = "rtg-default") -> str:
             lines.append(f"- {mistake}")
 
     # Append SKILL.md content
-    md_content = _backend.get_skill_md(name)
     if md_content:
         lines.append("\n---\n")
         lines.append(md_content)
@@ -830,11 +827,11 @@ def get_decision(name: str, profile: str = "rtg-default") -> str:
         name: Decision directory name (e.g. "direct-api-in-components").
         profile: Profile context.
     """
-    result = _backend.find_decision(name)
+    result = _backend.find_decision_with_md(name)
     if result is None:
         return f"Decision '{name}' not found."
 
-    data, _ = result
+    data, _, md_content = result
     dec = data.get("decision", {})
 
     lines = [f"# Decision: {dec.get('name', name)}\n"]
@@ -919,7 +916,6 @@ def get_decision(name: str, profile: str = "rtg-default") -> str:
             )
 
     # Append DECISION.md content
-    md_content = _backend.get_decision_md(name)
     if md_content:
         lines.append("\n---\n")
         lines.append(md_content)
@@ -0,0 +1,194 @@
+"""In-memory stand-in for a Supabase project, for SupabaseBackend tests.
+
+Requests go through the real postgrest client to an httpx.MockTransport that
+answers the subset of PostgREST the backend uses: plain column selects with
+eq/in filters, order, offset/limit, exact counts and HEAD; upserts; filtered
+PATCHes; and RPCs to functions registered in ``FakeSupabase.functions``.
+"""
+
+from __future__ import annotations
+
+import copy
+import csv
+import json
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+from postgrest import SyncPostgrestClient
+
+# Query parameters that are not column filters.
+_RESERVED_PARAMS = {"select", "order", "offset", "limit", "on_conflict", "columns"}
+
+
+class SqlError(Exception):
+    """Raised by a registered function to fail its RPC with a Postgres error."""
+
+    def __init__(self, code: str, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+
+
+class FakeSupabase:
+    """A tiny PostgREST server over in-memory tables.
+
+    ``max_rows`` caps every response like PostgREST's db-max-rows setting.
+    Clearing ``exact_counts`` ignores count=exact, like a proxy that drops
+    the Prefer header.
+    ``before_response`` is called with each request after its response is
+    computed, so a test can hold a request in flight.
+    """
+
+    def __init__(self, max_rows: int | None = None) -> None:
+        self.tables: dict[str, list[dict]] = {}
+        self.functions: dict[str, Callable[[dict[str, list[dict]], dict], Any]] = {}
+        self.requests: list[httpx.Request] = []
+        self.max_rows = max_rows
+        self.exact_counts = True
+        self.before_response: Callable[[httpx.Request], None] | None = None
+        self.options: Any = None
+
+    def create_client(self, url: str, key: str, options: Any = None) -> FakeClient:
+        """Drop-in for supabase.create_client; the options are kept for inspection."""
+        self.options = options
+        return FakeClient(self)
+
+    def requests_to(self, path: str) -> list[httpx.Request]:
+        return [r for r in self.requests if r.url.path == f"/rest/v1/{path}"]
+
+    # -- Request handling --
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path.removeprefix("/rest/v1/")
+        if path.startswith("rpc/"):
+            response = self._rpc(path.removeprefix("rpc/"), request)
+        elif request.method in ("GET", "HEAD"):
+            response = self._select(path, request)
+        elif request.method == "POST":
+            response = self._upsert(path, request)
+        elif request.method == "PATCH":
+            response = self._update(path, request)
+        else:
+            raise AssertionError(f"unsupported request: {request.method} {request.url}")
+        if self.before_response is not None:
+            self.before_response(request)
+        return response
+
+    def _rpc(self, name: str, request: httpx.Request) -> httpx.Response:
+        fn = self.functions.get(name)
+        if fn is None:
+            return httpx.Response(404, json={
+                "code": "PGRST202",
+                "message": f"Could not find the function public.{name} in the schema cache",
+                "details": None,
+                "hint": None,
+            })
+        try:
+            result = fn(self.tables, json.loads(request.content))
+        except SqlError as e:
+            return httpx.Response(400, json={
+                "code": e.code, "message": str(e), "details": None, "hint": None,
+            })
+        return httpx.Response(200, json=result)
+
+    def _select(self, table: str, request: httpx.Request) -> httpx.Response:
+        if table not in self.tables:
+            return httpx.Response(404, json={
+                "code": "PGRST205",
+                "message": f"Could not find the table 'public.{table}' in the schema cache",
+                "details": None,
+                "hint": None,
+            })
+        params = request.url.params
+        rows = [r for r in self.tables[table] if _matches(r, params)]
+        for term in reversed(params.get("order", "").split(",")):
+            if term:
+                column, _, direction = term.partition(".")
+                rows.sort(key=lambda r: r.get(column), reverse=direction == "desc")
+        total = len(rows)
+        offset = int(params.get("offset", 0))
+        limit = int(params["limit"]) if "limit" in params else total
+        if self.max_rows is not None:
+            limit = min(limit, self.max_rows)
+        page = [_project(r, params.get("select", "*")) for r in rows[offset:offset + limit]]
+
+        prefer = request.headers.get("prefer", "")
+        count = str(total) if self.exact_counts and "count=exact" in prefer else "*"
+        span = f"{offset}-{offset + len(page) - 1}" if page else "*"
+        headers = {"content-range": f"{span}/{count}"}
+        if request.method == "HEAD":
+            return httpx.Response(200, headers=headers)
+        return httpx.Response(200, json=page, headers=headers)
+
+    def _upsert(self, table: str, request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        rows = self.tables.setdefault(table, [])
+        key = request.url.params.get("on_conflict")
+        prefer = request.headers.get("prefer", "")
+        written = []
+        for new in payload if isinstance(payload, list) else [payload]:
+            existing = next((r for r in rows if key and r.get(key) == new.get(key)), None)
+            if existing is None:
+                rows.append(new)
+                written.append(new)
+            elif "resolution=ignore-duplicates" not in prefer:
+                existing.update(new)
+                written.append(existing)
+        return _written(prefer, written, status=201)
+
+    def _update(self, table: str, request: httpx.Request) -> httpx.Response:
+        changes = json.loads(request.content)
+        written = []
+        for row in self.tables.get(table, []):
+            if _matches(row, request.url.params):
+                row.update(copy.deepcopy(changes))
+                written.append(row)
+        return _written(request.headers.get("prefer", ""), written, status=200)
+
+
+class FakeClient:
+    """The slice of supabase.Client that SupabaseBackend touches."""
+
+    def __init__(self, server: FakeSupabase) -> None:
+        self.postgrest = SyncPostgrestClient(
+            "http://fake.supabase.co/rest/v1",
+            http_client=httpx.Client(transport=httpx.MockTransport(server.handle)),
+        )
+
+    def table(self, name: str) -> Any:
+        return self.postgrest.from_(name)
+
+    def rpc(self, fn: str, params: dict | None = None) -> Any:
+        return self.postgrest.rpc(fn, params or {})
+
+
+def _matches(row: dict, params: httpx.QueryParams) -> bool:
+    for column, condition in params.multi_items():
+        if column in _RESERVED_PARAMS:
+            continue
+        op, _, value = condition.partition(".")
+        if op == "eq":
+            if str(row.get(column)) != value:
+                return False
+        elif op == "in":
+            values = next(csv.reader([value.removeprefix("(").removesuffix(")")]))
+            if str(row.get(column)) not in values:
+                return False
+        else:
+            raise AssertionError(f"unsupported filter: {column}={condition}")
+    return True
+
+
+def _project(row: dict, select: str) -> dict:
+    if select == "*":
+        return copy.deepcopy(row)
+    if "(" in select:
+        raise AssertionError(f"embedded resources are not supported: {select}")
+    return {c: copy.deepcopy(row[c]) for c in select.split(",") if c in row}
+
+
+def _written(prefer: str, rows: list[dict], status: int) -> httpx.Response:
+    if "return=minimal" in prefer:
+        return httpx.Response(204 if status == 200 else status)
+    return httpx.Response(status, json=copy.deepcopy(rows))
@@ -0,0 +1,454 @@
+"""Tests for SupabaseBackend, run against an in-memory PostgREST fake."""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pytest
+
+from forge_mcp import backends
+from forge_mcp.backends import SupabaseBackend
+
+from .fake_supabase import FakeSupabase, SqlError
+
+
+@pytest.fixture
+def server(monkeypatch: pytest.MonkeyPatch) -> FakeSupabase:
+    """A fake Supabase project that SupabaseBackend() connects to."""
+    fake = FakeSupabase()
+    monkeypatch.setattr("supabase.create_client", fake.create_client)
+    monkeypatch.setenv("SUPABASE_URL", "http://fake.supabase.co")
+    monkeypatch.setenv("SUPABASE_SERVICE_KEY", "service-key")
+    return fake
+
+
+def _module_row(name: str, **fields) -> dict:
+    return {"name": name, "description": f"{name} module", "source_path": f"modules/{name}",
+            "module_md": f"# {name}", **fields}
+
+
+# ---------------------------------------------------------------------------
+# Client setup
+# ---------------------------------------------------------------------------
+
+
+class TestClientSetup:
+    def test_pooled_http_client_goes_through_client_options(self, server):
+        SupabaseBackend()
+        client = server.options.httpx_client
+        assert client.timeout.read == 30.0
+        assert client.follow_redirects
+
+
+# ---------------------------------------------------------------------------
+# Read cache
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Pin time.monotonic for the backend; tests advance it via clock[0]."""
+    now = [1000.0]
+    monkeypatch.setattr(backends.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def seeded(server: FakeSupabase) -> FakeSupabase:
+    server.tables["forge_modules"] = [_module_row("auth"), _module_row("billing")]
+    server.tables["forge_skills"] = [{"name": "tdd", "category": "testing", "skill_md": "# TDD"}]
+    return server
+
+
+class TestCacheTTL:
+    def test_defaults_to_sixty_seconds(self, server, monkeypatch):
+        monkeypatch.delenv("FORGE_CACHE_TTL", raising=False)
+        assert SupabaseBackend()._cache_ttl == 60.0
+
+    def test_reads_env_when_constructed(self, server, monkeypatch):
+        monkeypatch.setenv("FORGE_CACHE_TTL", "5")
+        assert SupabaseBackend()._cache_ttl == 5.0
+
+    def test_invalid_env_falls_back_to_default(self, server, monkeypatch):
+        monkeypatch.setenv("FORGE_CACHE_TTL", "a minute")
+        assert SupabaseBackend()._cache_ttl == 60.0
+
+    def test_argument_overrides_env(self, server, monkeypatch):
+        monkeypatch.setenv("FORGE_CACHE_TTL", "5")
+        assert SupabaseBackend(cache_ttl=0)._cache_ttl == 0
+
+    def test_entries_expire(self, seeded, clock):
+        backend = SupabaseBackend(cache_ttl=10)
+        backend.get_module_md("auth")
+        clock[0] += 9
+        backend.get_module_md("auth")
+        assert len(seeded.requests_to("forge_modules")) == 1
+        clock[0] += 2
+        backend.get_module_md("auth")
+        assert len(seeded.requests_to("forge_modules")) == 2
+
+    def test_zero_disables_cache(self, seeded):
+        backend = SupabaseBackend(cache_ttl=0)
+        backend.get_module_md("auth")
+        backend.get_module_md("auth")
+        assert len(seeded.requests_to("forge_modules")) == 2
+        assert not backend._cache
+
+
+class TestReadCache:
+    def test_evicts_least_recently_used(self, seeded, monkeypatch):
+        monkeypatch.setattr(backends, "_READ_CACHE_MAXSIZE", 2)
+        backend = SupabaseBackend(cache_ttl=60)
+        backend.get_module_md("auth")
+        backend.get_module_md("billing")
+        backend.get_module_md("auth")  # now most recently used
+        backend.get_skill_md("tdd")  # evicts billing
+        assert len(backend._cache) == 2
+        requests = len(seeded.requests)
+        backend.get_module_md("auth")
+        assert len(seeded.requests) == requests
+        backend.get_module_md("billing")
+        assert len(seeded.requests) == requests + 1
+
+    def test_callers_get_private_copies(self, seeded):
+        backend = SupabaseBackend(cache_ttl=60)
+        first = backend.scan_modules()
+        first[0]["module"]["name"] = "mutated"
+        first.clear()
+        second = backend.scan_modules()
+        assert [m["module"]["name"] for m in second] == ["auth", "billing"]
+        assert second is not backend.scan_modules()
+        assert len(seeded.requests_to("forge_modules")) == 1
+
+    def test_invalidate_drops_only_that_table(self, seeded):
+        backend = SupabaseBackend(cache_ttl=60)
+        backend.scan_modules()
+        backend.get_module_md("auth")
+        backend.get_skill_md("tdd")
+        backend._invalidate("forge_modules")
+        backend.scan_modules()
+        backend.get_module_md("auth")
+        backend.get_skill_md("tdd")
+        assert len(seeded.requests_to("forge_modules")) == 4
+        assert len(seeded.requests_to("forge_skills")) == 1
+
+    def test_cache_clear_drops_everything(self, seeded):
+        backend = SupabaseBackend(cache_ttl=60)
+        backend.get_module_md("auth")
+        backend.get_skill_md("tdd")
+        backend.cache_clear()
+        backend.get_module_md("auth")
+        backend.get_skill_md("tdd")
+        assert len(seeded.requests) == 4
+
+
+# ---------------------------------------------------------------------------
+# Corrections
+# ---------------------------------------------------------------------------
+
+
+def _append_observation(tables: dict[str, list[dict]], params: dict) -> int | None:
+    """Python stand-in for the forge_append_observation SQL function."""
+    for row in tables.get("forge_decisions", []):
+        if row["name"] == params["name"]:
+            row["correction_observations"] = [*row["correction_observations"], params["obs"]]
+            row["correction_total_observations"] += 1
+            row["correction_last_observed"] = row["last_observed"] = params["today"]
+            return row["correction_total_observations"]
+    return None
+
+
+def _correction(pattern: str = "Used print for logging") -> dict:
+    return {
+        "skill_name": "python-logging",
+        "instinct_pattern": pattern,
+        "corrected_pattern": "Use the structured logger",
+        "project": "forge",
+        "file": "app.py",
+    }
+
+
+@pytest.fixture
+def decisions(server: FakeSupabase) -> FakeSupabase:
+    server.tables["forge_decisions"] = [{
+        "name": "used-print-for-logging",
+        "correction_total_observations": 2,
+        "correction_observations": [{"date": "2026-01-01"}, {"date": "2026-01-02"}],
+        "correction_last_observed": "2026-01-02",
+        "last_observed": "2026-01-02",
+    }]
+    server.tables["forge_skills"] = []
+    return server
+
+
+class TestAppendObservation:
+    def test_uses_rpc_when_installed(self, decisions):
+        decisions.functions["forge_append_observation"] = _append_observation
+        backend = SupabaseBackend()
+        assert backend.record_correction(_correction()) == (
+            "Updated existing correction 'used-print-for-logging' — now at 3 observations."
+        )
+        assert [r.method for r in decisions.requests] == ["POST"]
+        row = decisions.tables["forge_decisions"][0]
+        assert row["correction_observations"][-1]["file"] == "app.py"
+
+    def test_falls_back_and_stops_trying_rpc(self, decisions):
+        backend = SupabaseBackend()
+        backend.record_correction(_correction())
+        backend.record_correction(_correction())
+        assert len(decisions.requests_to("rpc/forge_append_observation")) == 1
+        assert [r.method for r in decisions.requests_to("forge_decisions")] == [
+            "GET", "PATCH", "GET", "PATCH",
+        ]
+        row = decisions.tables["forge_decisions"][0]
+        assert row["correction_total_observations"] == 4
+        assert len(row["correction_observations"]) == 4
+
+    def test_other_rpc_errors_propagate(self, decisions):
+        from postgrest.exceptions import APIError
+
+        def locked(tables, params):
+            raise SqlError("55P03", "could not obtain lock on row")
+
+        decisions.functions["forge_append_observation"] = locked
+        backend = SupabaseBackend()
+        with pytest.raises(APIError):
+            backend.record_correction(_correction())
+        assert backend._append_rpc
+
+
+def _import_corrections(tables: dict[str, list[dict]], params: dict) -> list[str]:
+    """Python stand-in for the forge_import_corrections SQL function."""
+    rows = tables.setdefault("forge_decisions", [])
+    have = {row["name"] for row in rows}
+    inserted = []
+    for row in params["rows"]:
+        if row["name"] not in have:
+            rows.append(row)
+            have.add(row["name"])
+            inserted.append(row["name"])
+    return inserted
+
+
+class TestImportCorrections:
+    ITEMS = [
+        _correction(),
+        _correction("Caught bare Exception"),
+        _correction("Mutable default arg"),
+    ]
+
+    def _assert_results(self, decisions, results):
+        assert results[0] == (
+            "Updated existing correction 'used-print-for-logging' — now at 3 observations."
+        )
+        assert results[1].startswith("Created new correction 'caught-bare-exception'")
+        assert results[2].startswith("Created new correction 'mutable-default-arg'")
+        assert [r["name"] for r in decisions.tables["forge_decisions"]] == [
+            "used-print-for-logging", "caught-bare-exception", "mutable-default-arg",
+        ]
+
+    def test_uses_rpc_when_installed(self, decisions):
+        decisions.functions["forge_import_corrections"] = _import_corrections
+        backend = SupabaseBackend()
+        self._assert_results(decisions, backend.record_corrections(self.ITEMS))
+        assert len(decisions.requests_to("rpc/forge_import_corrections")) == 1
+        assert "POST" not in [r.method for r in decisions.requests_to("forge_decisions")]
+
+    def test_falls_back_and_stops_trying_rpc(self, decisions):
+        backend = SupabaseBackend()
+        self._assert_results(decisions, backend.record_corrections(self.ITEMS))
+        assert not backend._import_rpc
+        backend.record_corrections([_correction("Global state in tests")])
+        assert len(decisions.requests_to("rpc/forge_import_corrections")) == 1
+        upserts = [r for r in decisions.requests_to("forge_decisions") if r.method == "POST"]
+        assert len(upserts) == 2
+        assert "resolution=ignore-duplicates" in upserts[0].headers["prefer"]
+
+    def test_other_rpc_errors_propagate(self, decisions):
+        from postgrest.exceptions import APIError
+
+        def failing(tables, params):
+            raise SqlError("23502", "null value in column violates not-null constraint")
+
+        decisions.functions["forge_import_corrections"] = failing
+        backend = SupabaseBackend()
+        with pytest.raises(APIError):
+            backend.record_corrections(self.ITEMS)
+        assert backend._import_rpc
+
+
+# ---------------------------------------------------------------------------
+# Scans
+# ---------------------------------------------------------------------------
+
+
+class TestScans:
+    def test_decodes_rows_and_count(self, seeded):
+        backend = SupabaseBackend()
+        query = backend._client.table("forge_modules").select("name", count="exact")
+        resp = backends._exec(query)
+        assert resp.data == [{"name": "auth"}, {"name": "billing"}]
+        assert resp.count == 2
+
+    def test_leaves_postgrest_parsing_alone(self, seeded):
+        from postgrest import APIResponse
+
+        stock = APIResponse.__dict__["from_http_request_response"]
+        SupabaseBackend().scan_modules()
+        assert APIResponse.__dict__["from_http_request_response"] is stock
+
+    def test_errors_raise_api_error(self, server):
+        from postgrest.exceptions import APIError
+
+        with pytest.raises(APIError) as excinfo:
+            SupabaseBackend().scan_modules()
+        assert excinfo.value.code == "PGRST205"
+
+
+# ---------------------------------------------------------------------------
+# Concurrent reads
+# ---------------------------------------------------------------------------
+
+
+class _Gate:
+    """Holds the first request to ``table`` in flight until released."""
+
+    def __init__(self, server: FakeSupabase, table: str) -> None:
+        self.arrived = threading.Event()
+        self.release = threading.Event()
+        self._path = f"/rest/v1/{table}"
+        server.before_response = self
+
+    def __call__(self, request) -> None:
+        if request.url.path == self._path and not self.arrived.is_set():
+            self.arrived.set()
+            assert self.release.wait(5)
+
+
+class _Joins(dict):
+    """An _inflight dict that counts lookups finding a fetch to join."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.joined = threading.Semaphore(0)
+
+    def get(self, key, default=None):
+        found = super().get(key, default)
+        if found is not None:
+            self.joined.release()
+        return found
+
+
+class TestInflightReads:
+    def test_concurrent_callers_share_one_fetch(self, seeded):
+        backend = SupabaseBackend()
+        backend._inflight = joins = _Joins()
+        gate = _Gate(seeded, "forge_modules")
+        with ThreadPoolExecutor(4) as pool:
+            leader = pool.submit(backend.scan_modules)
+            assert gate.arrived.wait(5)
+            followers = [pool.submit(backend.scan_modules) for _ in range(3)]
+            for _ in followers:
+                assert joins.joined.acquire(timeout=5)
+            gate.release.set()
+            results = [f.result() for f in [leader, *followers]]
+        assert len(seeded.requests_to("forge_modules")) == 1
+        assert all(r == results[0] for r in results)
+        assert len({id(r) for r in results}) == 4
+
+    def test_fetch_error_reaches_every_waiter(self, server):
+        from postgrest.exceptions import APIError
+
+        backend = SupabaseBackend()
+        backend._inflight = joins = _Joins()
+        gate = _Gate(server, "forge_modules")
+        with ThreadPoolExecutor(4) as pool:
+            leader = pool.submit(backend.get_module_md, "auth")
+            assert gate.arrived.wait(5)
+            followers = [pool.submit(backend.get_module_md, "auth") for _ in range(3)]
+            for _ in followers:
+                assert joins.joined.acquire(timeout=5)
+            gate.release.set()
+            for f in [leader, *followers]:
+                with pytest.raises(APIError):
+                    f.result()
+        assert len(server.requests_to("forge_modules")) == 1
+        assert not backend._inflight
+        assert not backend._cache
+
+    def test_write_during_fetch_leaves_no_stale_entry(self, decisions):
+        name = "used-print-for-logging"
+        backend = SupabaseBackend()
+        gate = _Gate(decisions, "forge_decisions")
+        with ThreadPoolExecutor(1) as pool:
+            stale = pool.submit(backend.find_decision, name)
+            assert gate.arrived.wait(5)
+            backend.record_correction(_correction())
+            # Reads starting after the write don't join the older fetch.
+            fresh = backend.find_decision(name)
+            gate.release.set()
+            assert stale.result()[0]["decision"]["last_observed"] == "2026-01-02"
+        today = date.today().isoformat()
+        assert fresh[0]["decision"]["last_observed"] == today
+        assert backend.find_decision(name)[0]["decision"]["last_observed"] == today
+
+    def test_cache_clear_during_fetch_leaves_no_entry(self, seeded):
+        backend = SupabaseBackend()
+        gate = _Gate(seeded, "forge_modules")
+        with ThreadPoolExecutor(1) as pool:
+            pending = pool.submit(backend.scan_modules)
+            assert gate.arrived.wait(5)
+            backend.cache_clear()
+            gate.release.set()
+            pending.result()
+        assert not backend._cache
+
+
+# ---------------------------------------------------------------------------
+# Paged scans
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def paged(server: FakeSupabase, monkeypatch: pytest.MonkeyPatch) -> FakeSupabase:
+    """25 forge_modules rows, scanned 10 rows per page."""
+    monkeypatch.setattr(backends, "_SCAN_PAGE_SIZE", 10)
+    server.tables["forge_modules"] = [{"name": f"m{i:02}"} for i in reversed(range(25))]
+    return server
+
+
+def _scan(server: FakeSupabase) -> list[str]:
+    return [r["name"] for r in SupabaseBackend()._iter_rows("forge_modules", "name")]
+
+
+class TestIterRows:
+    EXPECTED = [f"m{i:02}" for i in range(25)]
+
+    def test_stops_after_short_last_page(self, paged):
+        assert _scan(paged) == self.EXPECTED
+        pages = paged.requests_to("forge_modules")
+        assert [r.url.params["offset"] for r in pages] == ["0", "10", "20"]
+
+    def test_counts_on_first_page_only(self, paged):
+        _scan(paged)
+        prefer = [r.headers.get("prefer") for r in paged.requests_to("forge_modules")]
+        assert prefer == ["count=exact", None, None]
+
+    def test_server_cap_below_page_size(self, paged):
+        paged.max_rows = 4
+        assert _scan(paged) == self.EXPECTED
+        pages = paged.requests_to("forge_modules")
+        assert [r.url.params["offset"] for r in pages] == ["0", "4", "8", "12", "16", "20", "24"]
+
+    def test_without_count_pages_until_empty(self, paged):
+        paged.max_rows = 4
+        paged.exact_counts = False
+        assert _scan(paged) == self.EXPECTED
+        assert len(paged.requests_to("forge_modules")) == 8
+
+    def test_empty_table_is_one_request(self, server):
+        server.tables["forge_modules"] = []
+        assert _scan(server) == []
+        assert len(server.requests_to("forge_modules")) == 1
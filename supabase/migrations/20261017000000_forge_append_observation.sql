@@ -0,0 +1,22 @@
+-- RTG Forge — forge_append_observation
+-- Run this migration against the forge Supabase project.
+-- Used by the MCP server's record_correction: appends one observation to a
+-- correction and bumps its counters in a single atomic round trip, without
+-- shipping the existing observations array. Without it the server falls back
+-- to read-modify-write.
+
+CREATE OR REPLACE FUNCTION forge_append_observation(name TEXT, obs JSONB, today DATE)
+RETURNS INTEGER
+LANGUAGE sql
+AS $$
+    UPDATE forge_decisions d
+    SET correction_observations = COALESCE(d.correction_observations, '[]'::jsonb)
+                                  || jsonb_build_array(obs),
+        correction_total_observations = COALESCE(d.correction_total_observations, 0) + 1,
+        correction_last_observed = today,
+        last_observed = today
+    WHERE d.name = forge_append_observation.name
+    RETURNING d.correction_total_observations;
+$$;
+
+GRANT EXECUTE ON FUNCTION forge_append_observation(TEXT, JSONB, DATE) TO service_role;
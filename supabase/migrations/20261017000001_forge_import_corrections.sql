@@ -0,0 +1,39 @@
+-- RTG Forge — forge_import_corrections
+-- Run this migration against the forge Supabase project.
+-- Used by the MCP server's record_corrections: a set-based insert, one
+-- request and one transaction per batch, with jsonb_populate_recordset
+-- decoding the rows server side. Skips names that already exist and returns
+-- the names it inserted. Without it the server falls back to an
+-- ignore-duplicates upsert.
+
+CREATE OR REPLACE FUNCTION forge_import_corrections(rows JSONB)
+RETURNS SETOF TEXT
+LANGUAGE sql
+AS $$
+    INSERT INTO forge_decisions (
+        name, version, type, status, severity, description, created_date,
+        last_observed, category, context_applies_to, context_profiles,
+        context_trigger, choice_chosen, choice_rejected, evidence_skills,
+        evidence_modules, evidence_related_decisions, correction_skill_applied,
+        correction_instinct_pattern, correction_corrected_pattern,
+        correction_impact_level, correction_total_observations,
+        correction_first_observed, correction_last_observed,
+        correction_observations, correction_themes, correction_origin,
+        correction_predictability, decision_md
+    )
+    SELECT
+        name, version, type, status, severity, description, created_date,
+        last_observed, category, context_applies_to, context_profiles,
+        context_trigger, choice_chosen, choice_rejected, evidence_skills,
+        evidence_modules, evidence_related_decisions, correction_skill_applied,
+        correction_instinct_pattern, correction_corrected_pattern,
+        correction_impact_level, correction_total_observations,
+        correction_first_observed, correction_last_observed,
+        correction_observations, correction_themes, correction_origin,
+        correction_predictability, decision_md
+    FROM jsonb_populate_recordset(NULL::forge_decisions, rows)
+    ON CONFLICT (name) DO NOTHING
+    RETURNING name;
+$$;
+
+GRANT EXECUTE ON FUNCTION forge_import_corrections(JSONB) TO service_role;